@@ -0,0 +1,249 @@
+import json
+import random
+
+from benchmarks.generador_banco import generate_bank
+from juego.rutas_app import get_resource_images_dir
+
+BANK_SIZES = (100, 1000, 10000, 100000)
+
+CASES = []
+
+
+class SkipBenchmark(Exception):
+
+    pass
+
+
+def benchmark(name):
+    # Registra una fábrica: prepara los datos y retorna la función a medir
+    def decorator(factory):
+        CASES.append((name, factory))
+        return factory
+
+    return decorator
+
+
+def make_bank(size, seed=0):
+    return generate_bank(size, seed=seed)
+
+
+def write_bank(workdir, size, name=None):
+    path = workdir / (name or f"bank_{size}.json")
+    if not path.exists():
+        path.write_text(json.dumps(make_bank(size)), encoding="utf-8")
+    return path
+
+
+# =============================================================================
+# Puntaje y comodines
+# =============================================================================
+
+
+@benchmark("scoring.process_correct_answer x1000")
+def bench_process_correct_answer(workdir):
+    from juego.logica import ScoringSystem
+
+    rng = random.Random(1)
+    rows = [(rng.uniform(0, 200), rng.choice((0, 0, 1, 3))) for _ in range(1000)]
+
+    def run():
+        scoring = ScoringSystem(len(rows))
+        for seconds, mistakes in rows:
+            scoring.process_correct_answer(seconds, mistakes)
+
+    return run
+
+
+@benchmark("scoring.score_batch x100k")
+def bench_score_batch(workdir):
+    from juego.logica import ScoringSystem
+
+    rng = random.Random(2)
+    count = 100000
+    times = [rng.uniform(0, 200) for _ in range(count)]
+    mistakes = [rng.choice((0, 0, 1, 3)) for _ in range(count)]
+    streaks = [rng.randint(0, 12) for _ in range(count)]
+    scoring = ScoringSystem(15)
+
+    def run():
+        scoring.score_batch(times, mistakes, streaks)
+
+    return run
+
+
+@benchmark("wildcards.compute_random_unrevealed_position")
+def bench_unrevealed_position(workdir):
+    from juego.comodines import WildcardManager
+
+    manager = WildcardManager(rng=random.Random(3))
+    answer, target = "CYBER", "CYBERSECURITY"
+
+    def run():
+        manager.revealed_positions.clear()
+        manager.compute_random_unrevealed_position(answer, target)
+
+    return run
+
+
+# =============================================================================
+# Carga de preguntas
+# =============================================================================
+
+
+def register_bank_cases(size):
+    @benchmark(f"questions.normalize_questions[{size}]")
+    def bench_normalize(workdir):
+        from juego.datos_preguntas import normalize_questions
+
+        raw = make_bank(size)
+        return lambda: normalize_questions(raw)
+
+    @benchmark(f"questions.QuestionFileStorage.load_questions[{size}]")
+    def bench_storage_load(workdir):
+        try:
+            from juego.pantalla_preguntas_config import QuestionFileStorage
+        except ImportError as error:
+            raise SkipBenchmark(str(error)) from error
+
+        storage = QuestionFileStorage(write_bank(workdir, size))
+        return storage.load_questions
+
+    @benchmark(f"questions.merge_default_questions[{size}]")
+    def bench_merge(workdir):
+        from juego.rutas_app import merge_default_questions
+
+        # Caso de arranque habitual: el archivo del usuario ya está al día
+        default = write_bank(workdir, size)
+        user = write_bank(workdir, size, f"user_{size}.json")
+        return lambda: merge_default_questions(default, user)
+
+
+for _size in BANK_SIZES:
+    register_bank_cases(_size)
+
+
+# =============================================================================
+# Imágenes
+# =============================================================================
+
+
+def make_image_handler(workdir):
+    try:
+        from juego.manejador_imagenes import ImageHandler
+    except ImportError as error:
+        raise SkipBenchmark(str(error)) from error
+    return ImageHandler(get_resource_images_dir(), data_root=workdir)
+
+
+def make_detail_handler(workdir):
+    from PIL import Image
+
+    from juego.miniaturas import ThumbnailStore
+
+    handler = make_image_handler(workdir)
+    handler.thumbnails = ThumbnailStore(workdir / "miniaturas")
+    path = workdir / "photo.png"
+    if not path.exists():
+        Image.effect_noise((2000, 1500), 64).convert("RGB").save(path)
+    return handler, path
+
+
+@benchmark("images.create_detail_image (2000x1500 source, cold)")
+def bench_detail_image(workdir):
+    import shutil
+
+    handler, path = make_detail_handler(workdir)
+
+    def run():
+        handler.detailcache.clear()
+        shutil.rmtree(handler.thumbnails.cache_dir, ignore_errors=True)
+        handler.create_detail_image(str(path), (480, 360))
+
+    return run
+
+
+@benchmark("images.create_detail_image (thumbnail cache)")
+def bench_detail_image_thumbnail(workdir):
+    handler, path = make_detail_handler(workdir)
+    handler.create_detail_image(str(path), (220, 220))
+
+    def run():
+        handler.detailcache.clear()
+        handler.create_detail_image(str(path), (220, 220))
+
+    return run
+
+
+def make_icon_handler(workdir):
+    handler = make_image_handler(workdir)
+    try:
+        import tkinter as tk
+
+        from juego.iconos_svg import SvgIconService
+    except ImportError as error:
+        raise SkipBenchmark(str(error)) from error
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError as error:
+        raise SkipBenchmark(f"no display: {error}") from error
+    # Caché propia para no tocar la del usuario
+    handler.icon_service = SvgIconService(workdir / "iconos")
+    return handler, root
+
+
+@benchmark("images.create_ctk_icon (cold)")
+def bench_ctk_icon(workdir):
+    import shutil
+
+    handler, root = make_icon_handler(workdir)
+
+    def run():
+        handler.iconcache.clear()
+        handler.icon_service.images.clear()
+        shutil.rmtree(handler.icon_service.cache_dir, ignore_errors=True)
+        handler.create_ctk_icon("Clock.svg", (48, 48))
+
+    run.root = root
+    return run
+
+
+@benchmark("images.create_ctk_icon (disk cache)")
+def bench_ctk_icon_disk(workdir):
+    handler, root = make_icon_handler(workdir)
+    handler.create_ctk_icon("Clock.svg", (48, 48))
+
+    def run():
+        handler.iconcache.clear()
+        handler.icon_service.images.clear()
+        handler.create_ctk_icon("Clock.svg", (48, 48))
+
+    run.root = root
+    return run
+
+
+# =============================================================================
+# Texto a voz
+# =============================================================================
+
+
+@benchmark("tts.speak cache hit")
+def bench_tts_cache_hit(workdir):
+    try:
+        from juego.servicio_tts import TTSService
+    except ImportError as error:
+        raise SkipBenchmark(str(error)) from error
+
+    service = TTSService(workdir)
+    texts = [f"Definition number {i}" for i in range(service.audiocachemax)]
+    for text in texts:
+        service.audiocache[text] = object()
+        service.audiocacheorder.append(text)
+    # Sin reproducción real: solo se mide la ruta de búsqueda en caché
+    service.play_sound = lambda sound: None
+
+    def run():
+        for text in texts:
+            service.speak(text)
+
+    return run
@@ -0,0 +1,140 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from benchmarks.casos import CASES, SkipBenchmark
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+
+
+def time_case(func, repeat, min_time):
+    timer = timeit.Timer(func)
+    # Elegir el número de llamadas para que cada muestra dure al menos min_time
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = [elapsed / number]
+    samples.extend(t / number for t in timer.repeat(repeat - 1, number))
+    return {
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_cases(selected, repeat, min_time):
+    results = {}
+    skipped = {}
+    with tempfile.TemporaryDirectory(prefix="trivia-bench-") as tmp:
+        workdir = Path(tmp)
+        for name, factory in selected:
+            try:
+                func = factory(workdir)
+            except SkipBenchmark as reason:
+                skipped[name] = str(reason)
+                continue
+            results[name] = time_case(func, repeat, min_time)
+            root = getattr(func, "root", None)
+            if root is not None:
+                root.destroy()
+    return results, skipped
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(path, results):
+    previous = load_baseline(path)
+    previous.update(results)
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(previous.items())),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2)
+        file.write("\n")
+
+
+def format_us(value):
+    if value >= 1e6:
+        return f"{value / 1e6:9.3f} s "
+    if value >= 1e3:
+        return f"{value / 1e3:9.3f} ms"
+    return f"{value:9.3f} us"
+
+
+def compare(results, skipped, baseline, tolerance):
+    regressions = []
+    width = max([len(name) for name in [*results, *skipped]] + [10])
+    print(f"{'benchmark':<{width}}  {'median':>12}  {'baseline':>12}  ratio")
+    for name, stats in results.items():
+        base = baseline.get(name)
+        line = f"{name:<{width}}  {format_us(stats['median_us'])}"
+        if base:
+            ratio = stats["median_us"] / base["median_us"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  REGRESSION"
+                regressions.append(name)
+            elif ratio < 1 - tolerance:
+                flag = "  faster"
+            line += f"  {format_us(base['median_us'])}  {ratio:5.2f}x{flag}"
+        else:
+            line += f"  {'(none)':>12}"
+        print(line)
+    for name, reason in skipped.items():
+        print(f"{name:<{width}}  skipped: {reason}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the performance benchmarks.")
+    parser.add_argument("-k", "--filter", help="Only run benchmarks containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="Store these results as the baseline"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to a file")
+    args = parser.parse_args(argv)
+
+    selected = [
+        (name, factory)
+        for name, factory in CASES
+        if not args.filter or args.filter in name
+    ]
+    results, skipped = run_cases(selected, max(1, args.repeat), args.min_time)
+    regressions = compare(
+        results, skipped, load_baseline(args.baseline), args.tolerance
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"results": results, "skipped": skipped}, file, indent=2)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+import tkinter as tk
+from pathlib import Path
+
+from benchmarks.generador_banco import write_bank
+from juego.datos_preguntas import load_questions_file
+from juego.monitor_rendimiento import summarize
+from juego.sesion_juego import GameSession
+
+
+class StressRun:
+
+    def __init__(self, bank_path, iterations, seed=0):
+        self.bank_path = bank_path
+        self.iterations = iterations
+        self.rng = random.Random(seed)
+        self.samples = {}
+        self.skipped = {}
+
+    def timed(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+        return result
+
+    def skip(self, name, error):
+        self.skipped[name] = str(error)
+
+    def report(self):
+        return {
+            "operations_ms": {
+                name: summarize(values) for name, values in self.samples.items()
+            },
+            "skipped": self.skipped,
+        }
+
+    # =========================================================================
+    # Escenarios
+    # =========================================================================
+
+    def run_game_start(self):
+        for _ in range(self.iterations):
+            questions = self.timed(
+                "game.load_questions_file", load_questions_file, self.bank_path
+            )
+            session = self.timed("game.new_session", GameSession, questions)
+            self.timed("game.next_question", session.next_question)
+
+    def run_repository(self):
+        try:
+            from juego.pantalla_preguntas_config import QuestionRepository
+        except ImportError as error:
+            self.skip("repository.*", error)
+            return None
+
+        repository = None
+        for _ in range(self.iterations):
+            repository = self.timed(
+                "repository.load", QuestionRepository, self.bank_path
+            )
+
+        titles = [q["title"] for q in repository.questions]
+        for _ in range(self.iterations):
+            probe = self.rng.choice(titles)
+            self.timed(
+                "repository.is_title_unique(existing)",
+                repository.is_title_unique,
+                probe,
+            )
+            self.timed(
+                "repository.is_title_unique(new)",
+                repository.is_title_unique,
+                f"{probe} Nuevo",
+            )
+
+        for i in range(self.iterations):
+            added = self.timed(
+                "repository.add_question",
+                repository.add_question,
+                f"Stress Term {chr(65 + i % 26)}{i}",
+                "Temporary definition added by the stress harness.",
+                "",
+            )
+            edited = self.timed(
+                "repository.update_question",
+                repository.update_question,
+                added,
+                added["title"],
+                "Edited definition.",
+                "",
+            )
+            self.timed("repository.delete_question", repository.delete_question, edited)
+        return repository
+
+    def run_manage_screen(self):
+        try:
+            import customtkinter as ctk
+
+            from juego.pantalla_preguntas import ManageQuestionsScreen
+        except ImportError as error:
+            self.skip("manage.*", error)
+            return
+
+        try:
+            root = ctk.CTk()
+            root.withdraw()
+        except tk.TclError as error:
+            # Sin pantalla disponible
+            self.skip("manage.*", error)
+            return
+
+        bank_path = self.bank_path
+
+        class StressManageScreen(ManageQuestionsScreen):
+            QUESTIONS_FILE = bank_path
+
+        try:
+            screen = self.timed("manage.open_screen", StressManageScreen, root)
+            titles = [q["title"] for q in screen.questions]
+            for _ in range(self.iterations):
+                title = self.rng.choice(titles)
+                start = self.rng.randrange(max(1, len(title) - 3))
+                query = title[start : start + 3]
+                self.timed("manage.filter_questions", screen.filter_questions, query)
+                self.timed("manage.render_question_list", screen.render_question_list)
+                root.update_idletasks()
+            self.timed("manage.filter_questions(all)", screen.filter_questions, "")
+            self.timed("manage.render_question_list(all)", screen.render_question_list)
+            screen.cleanup()
+        finally:
+            root.destroy()
+
+
+def run_stress(size, iterations, images, seed, keep_dir=None):
+    if keep_dir:
+        workdir = Path(keep_dir)
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix="trivia-stress-"))
+    try:
+        bank_path = write_bank(
+            workdir, size, seed=seed, images=images, absolute_images=True
+        )
+        run = StressRun(bank_path, iterations, seed)
+        run.run_game_start()
+        run.run_repository()
+        run.run_manage_screen()
+        report = run.report()
+        report.update({"size": size, "iterations": iterations, "images": images})
+        return report
+    finally:
+        if not keep_dir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stress the question bank operations with a synthetic bank."
+    )
+    parser.add_argument(
+        "--size", type=int, action="append", help="Bank size (repeatable)"
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", type=Path, help="Keep the generated bank here")
+    args = parser.parse_args(argv)
+
+    iterations, images = max(1, args.iterations), max(0, args.images)
+    reports = [
+        run_stress(size, iterations, images, args.seed, args.keep)
+        for size in (args.size or [1000, 10000])
+    ]
+    print(json.dumps(reports, indent=2))
+
+
+if __name__ == "__main__":
+    main()
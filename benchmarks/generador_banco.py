@@ -0,0 +1,122 @@
+import argparse
+import json
+import random
+from pathlib import Path
+
+from juego.datos_preguntas import load_questions_file
+from juego.rutas_app import get_default_questions_path
+
+SYLLABLES = tuple(
+    "ka lo mi ren tor vex zan qui sel dra nox pri ul bar cyn fe gro hal jin wy".split()
+)
+
+EXTRA_TERMS = tuple(
+    "Firewall Ransomware Keylogger Rootkit Honeypot Sandbox Botnet Payload "
+    "Spoofing Sniffer Cipher Token Proxy Patch Worm Trojan Spyware Exploit "
+    "Backdoor Phishing".split()
+)
+
+IMAGE_SIZE = (1600, 1200)
+
+
+def load_vocabulary():
+    # Vocabulario realista tomado del banco incluido con el juego
+    questions = load_questions_file(get_default_questions_path())
+    terms = sorted({q["title"] for q in questions} | set(EXTRA_TERMS))
+    words = [w.strip(".,;:()") for q in questions for w in q["definition"].split()]
+    return terms, [w for w in words if w.isalpha()] or list(EXTRA_TERMS)
+
+
+def pseudo_word(rng, syllables):
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def make_definition(rng, words, long_definition):
+    count = rng.randint(60, 140) if long_definition else rng.randint(12, 35)
+    text = " ".join(rng.choice(words) for _ in range(count))
+    return text[0].upper() + text[1:] + "."
+
+
+def generate_images(images_dir, count, seed=0):
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        return []
+
+    rng = random.Random(seed)
+    images_dir.mkdir(parents=True, exist_ok=True)
+    names = []
+    for i in range(count):
+        name = f"synthetic_{i:03d}.png"
+        path = images_dir / name
+        if not path.exists():
+            image = Image.effect_noise(IMAGE_SIZE, rng.randint(20, 90)).convert("RGB")
+            draw = ImageDraw.Draw(image)
+            for _ in range(12):
+                x0, y0 = rng.randrange(IMAGE_SIZE[0]), rng.randrange(IMAGE_SIZE[1])
+                x1 = x0 + rng.randint(40, 600)
+                y1 = y0 + rng.randint(40, 600)
+                color = tuple(rng.randrange(256) for _ in range(3))
+                draw.ellipse((x0, y0, x1, y1), fill=color)
+            image.save(path)
+        names.append(name)
+    return names
+
+
+def generate_bank(size, seed=0, image_refs=(), long_ratio=0.15):
+    rng = random.Random(seed)
+    terms, words = load_vocabulary()
+    seen = set()
+    questions = []
+    syllables = 2
+    while len(questions) < size:
+        # Solo letras y espacios: el teclado del juego no tiene dígitos
+        title = f"{rng.choice(terms)} {pseudo_word(rng, syllables)}"
+        key = title.lower()
+        if key in seen:
+            if len(seen) > 0.5 * len(terms) * len(SYLLABLES) ** syllables:
+                syllables += 1
+            continue
+        seen.add(key)
+        image = rng.choice(image_refs) if image_refs else ""
+        questions.append(
+            {
+                "title": title,
+                "definition": make_definition(rng, words, rng.random() < long_ratio),
+                "image": image,
+            }
+        )
+    return {"questions": questions}
+
+
+def write_bank(out_dir, size, seed=0, images=0, absolute_images=False):
+    out_dir = Path(out_dir)
+    images_dir = out_dir / "recursos" / "imagenes"
+    image_names = generate_images(images_dir, images, seed)
+    # Rutas relativas como las del banco real, o absolutas para usarlas fuera
+    # de la raíz de datos de la aplicación
+    prefix = "recursos/imagenes"
+    if absolute_images:
+        prefix = images_dir.resolve().as_posix()
+    image_refs = [f"{prefix}/{name}" for name in image_names]
+    path = out_dir / "datos" / f"preguntas_{size}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    bank = generate_bank(size, seed=seed, image_refs=image_refs)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(bank, file, ensure_ascii=False, indent=2)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic question bank.")
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--out", type=Path, default=Path("banco_sintetico"))
+    parser.add_argument("--images", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    path = write_bank(args.out, max(1, args.size), args.seed, max(0, args.images))
+    print(f"Wrote {args.size} questions to {path}")
+
+
+if __name__ == "__main__":
+    main()
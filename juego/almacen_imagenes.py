@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+INDEX_NAME = "indice_imagenes.json"
+INDEX_VERSION = 1
+HASH_LENGTH = 32
+MAX_SOURCES = 500
+CHUNK_SIZE = 1 << 16
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+class ImageStore:
+    # Imágenes importadas guardadas por contenido: <hash>.<ext> en la carpeta de
+    # imágenes del usuario. Una misma imagen se guarda una sola vez.
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.index_path = self.root / INDEX_NAME
+        self.lock = threading.Lock()
+        self.index = None
+
+    # =========================================================================
+    # Índice
+    # =========================================================================
+
+    def load_index(self):
+        if self.index is not None:
+            return self.index
+        index = {"version": INDEX_VERSION, "images": {}, "sources": {}}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == INDEX_VERSION:
+                index["images"].update(data.get("images", {}))
+                index["sources"].update(data.get("sources", {}))
+        except (OSError, ValueError, AttributeError):
+            pass
+        self.index = index
+        return index
+
+    def save_index(self):
+        temporary = self.index_path.with_name(f".{INDEX_NAME}.tmp")
+        try:
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(self.index, file, ensure_ascii=False, indent=1)
+            os.replace(temporary, self.index_path)
+        except OSError as error:
+            # El índice solo acelera búsquedas: los archivos ya están guardados
+            print(f"Image index not saved: {error}")
+
+    def source_key(self, source_path):
+        try:
+            path = Path(source_path).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        return f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    def path_for(self, digest, suffix):
+        return self.root / f"{digest}{suffix.lower()}"
+
+    def lookup_source(self, source_path):
+        # Reimportar el mismo archivo sin modificar no vuelve a decodificarlo
+        key = self.source_key(source_path)
+        if key is None:
+            return None
+        with self.lock:
+            index = self.load_index()
+            digest = index["sources"].get(key)
+            entry = index["images"].get(digest) if digest else None
+        if not entry:
+            return None
+        path = self.root / entry["file"]
+        return path if path.exists() else None
+
+    def content_key(self, path):
+        path = Path(path)
+        digest = path.stem
+        if len(digest) != HASH_LENGTH:
+            return None
+        with self.lock:
+            entry = self.load_index()["images"].get(digest)
+        return digest if entry and entry["file"] == path.name else None
+
+    def original_name(self, path):
+        digest = self.content_key(path)
+        if digest is None:
+            return None
+        with self.lock:
+            return self.load_index()["images"][digest].get("name") or None
+
+    # =========================================================================
+    # Escritura
+    # =========================================================================
+
+    def put_bytes(self, data, suffix, name="", source_path=None):
+        return self.store(hash_bytes(data), suffix, name, source_path, data=data)
+
+    def put_file(self, source_path):
+        source_path = Path(source_path)
+        existing = self.lookup_source(source_path)
+        if existing is not None:
+            return existing
+        suffix = source_path.suffix or ".png"
+        return self.store(hash_file(source_path), suffix, source_path.name, source_path)
+
+    def store(self, digest, suffix, name, source_path, data=None):
+        destination = self.path_for(digest, suffix)
+        with self.lock:
+            index = self.load_index()
+            entry = index["images"].get(digest)
+            if entry and (self.root / entry["file"]).exists():
+                # Mismo contenido con otra extensión (.jpg/.jpeg): reutilizar la
+                # copia indexada en lugar de escribir otra
+                destination = self.root / entry["file"]
+            elif not destination.exists():
+                self.root.mkdir(parents=True, exist_ok=True)
+                temporary = destination.with_name(f".{destination.name}.tmp")
+                try:
+                    if data is None:
+                        with open(source_path, "rb") as src, open(
+                            temporary, "wb"
+                        ) as dst:
+                            for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                                dst.write(chunk)
+                    else:
+                        temporary.write_bytes(data)
+                    os.replace(temporary, destination)
+                except OSError:
+                    try:
+                        temporary.unlink()
+                    except OSError:
+                        pass
+                    raise
+
+            entry = index["images"].setdefault(
+                digest, {"file": destination.name, "name": name}
+            )
+            entry["file"] = destination.name
+            if name and not entry.get("name"):
+                entry["name"] = name
+            key = self.source_key(source_path) if source_path else None
+            if key is not None:
+                sources = index["sources"]
+                sources.pop(key, None)
+                sources[key] = digest
+                while len(sources) > MAX_SOURCES:
+                    sources.pop(next(iter(sources)))
+            self.save_index()
+        return destination
@@ -0,0 +1,156 @@
+import time
+import tkinter as tk
+from functools import lru_cache
+
+from juego.pantalla_juego_config import ANIMATION_ENGINE
+
+
+@lru_cache(maxsize=256)
+def color_ramp(start_hex, end_hex, steps):
+    # Rampa precalculada: steps + 1 colores desde el inicio hasta el destino
+    steps = max(1, steps)
+    sr, sg, sb = (
+        int(start_hex[1:3], 16),
+        int(start_hex[3:5], 16),
+        int(start_hex[5:7], 16),
+    )
+    er, eg, eb = int(end_hex[1:3], 16), int(end_hex[3:5], 16), int(end_hex[5:7], 16)
+    ramp = []
+    for i in range(steps + 1):
+        f = i / steps
+        r = int(sr + (er - sr) * f)
+        g = int(sg + (eg - sg) * f)
+        b = int(sb + (eb - sb) * f)
+        ramp.append(f"#{r:02x}{g:02x}{b:02x}")
+    return tuple(ramp)
+
+
+class Tween:
+
+    def __init__(self, frames, apply, start, duration, on_done=None):
+        self.frames = frames
+        self.apply = apply
+        self.start = start
+        self.duration = duration
+        self.on_done = on_done
+        self.last_index = -1
+
+    def step(self, now):
+        if now < self.start:
+            return False
+        last = len(self.frames) - 1
+        if self.duration <= 0:
+            index = last
+        else:
+            index = min(last, int((now - self.start) / self.duration * last))
+        # Solo aplicar cuando el cuadro visible realmente cambia
+        if index != self.last_index:
+            self.last_index = index
+            self.apply(self.frames[index])
+        return index >= last
+
+
+class AnimationEngine:
+
+    fps = ANIMATION_ENGINE["fps"]
+    enabled = ANIMATION_ENGINE["enabled"]
+
+    engines = {}
+
+    def __init__(self, root):
+        self.root = root
+        self.tweens = {}
+        self.tick_job = None
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget.nametowidget(".")
+        engine = cls.engines.get(root)
+        if engine is None:
+            engine = cls(root)
+            cls.engines[root] = engine
+        return engine
+
+    @classmethod
+    def configure(cls, fps=None, enabled=None):
+        # Permite reducir o desactivar las animaciones en equipos lentos
+        if fps is not None:
+            cls.fps = max(1, int(fps))
+        if enabled is not None:
+            cls.enabled = bool(enabled)
+
+    def animate(
+        self, owner, name, frames, apply, duration_ms, delay_ms=0, on_done=None
+    ):
+        key = (owner, name)
+        self.tweens.pop(key, None)
+        frames = tuple(frames)
+        if not frames:
+            return
+
+        if not self.enabled:
+            # Sin animaciones: saltar directamente al estado final
+            try:
+                apply(frames[-1])
+            except tk.TclError:
+                return
+            if on_done:
+                on_done()
+            return
+
+        now = time.monotonic()
+        tween = Tween(frames, apply, now + delay_ms / 1000, duration_ms / 1000, on_done)
+        if delay_ms <= 0 and self.run_tween(key, tween, now):
+            return
+        self.tweens[key] = tween
+        self.schedule_tick()
+
+    def cancel(self, owner, name=None):
+        keys = [
+            key
+            for key in self.tweens
+            if key[0] is owner and (name is None or key[1] == name)
+        ]
+        for key in keys:
+            del self.tweens[key]
+        if not self.tweens and self.tick_job:
+            try:
+                self.root.after_cancel(self.tick_job)
+            except tk.TclError:
+                pass
+            self.tick_job = None
+
+    def is_animating(self, owner, name):
+        return (owner, name) in self.tweens
+
+    def run_tween(self, key, tween, now):
+        try:
+            finished = tween.step(now)
+        except tk.TclError:
+            # El widget fue destruido: descartar la animación sin callback
+            self.tweens.pop(key, None)
+            return True
+        if finished:
+            if self.tweens.get(key) is tween:
+                del self.tweens[key]
+            if tween.on_done:
+                tween.on_done()
+        return finished
+
+    def schedule_tick(self):
+        if self.tick_job is not None or not self.tweens:
+            return
+        try:
+            self.tick_job = self.root.after(max(1, round(1000 / self.fps)), self.tick)
+        except tk.TclError:
+            self.tick_job = None
+            self.tweens.clear()
+
+    def tick(self):
+        self.tick_job = None
+        now = time.monotonic()
+        # Todas las animaciones activas avanzan en el mismo cuadro
+        for key, tween in list(self.tweens.items()):
+            if self.tweens.get(key) is tween:
+                self.run_tween(key, tween, now)
+        self.schedule_tick()
@@ -18,7 +18,10 @@ class WildcardManager:
     # Anti-frustración: preguntas sin ganar una carga
     ANTI_FRUSTRATION_THRESHOLD = 3
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Generador aleatorio inyectable para sesiones reproducibles
+        self.rng = rng or random
+
         # Cargas compartidas entre preguntas
         self.charges = self.STARTING_CHARGES
 
@@ -153,7 +156,7 @@ class WildcardManager:
             return None
 
         # Seleccionar posición aleatoria
-        position, letter = random.choice(unrevealed_positions)
+        position, letter = self.rng.choice(unrevealed_positions)
 
         # Marcar esta posición como revelada
         self.revealed_positions.add(position)
@@ -0,0 +1,150 @@
+import tkinter as tk
+
+import customtkinter as ctk
+
+
+def rounded_rect_points(x0, y0, x1, y1, radius):
+    # Puntos de un polígono suavizado que se dibuja como rectángulo redondeado
+    r = max(0, min(radius, (x1 - x0) / 2, (y1 - y0) / 2))
+    return [
+        x0 + r, y0, x1 - r, y0, x1, y0, x1, y0 + r,
+        x1, y1 - r, x1, y1, x1 - r, y1, x0 + r, y1,
+        x0, y1, x0, y1 - r, x0, y0 + r, x0, y0,
+    ]  # fmt: skip
+
+
+class AnswerRowCanvas(tk.Canvas):
+
+    CORNER_RADIUS = 8
+    CELL_PAD_Y = 4
+    MAX_SPARE_CELLS = 10
+
+    def __init__(self, master, bg_color, empty_color, text_color, font):
+        super().__init__(
+            master,
+            width=1,
+            height=1,
+            bg=bg_color,
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        self.empty_color = empty_color
+        self.text_color = text_color
+        self.font = font
+        self.font_spec = None
+
+        # Cada celda: [id_caja, id_glifo, caracter, color]
+        self.cells = []
+        self.word_length = 0
+        self.box_size = 0
+        self.gap = 0
+
+    # =========================================================================
+    # Geometría
+    # =========================================================================
+
+    def get_scaling(self):
+        try:
+            return ctk.ScalingTracker.get_widget_scaling(self)
+        except (AttributeError, KeyError, tk.TclError):
+            return 1.0
+
+    def create_cell(self):
+        box_id = self.create_polygon(
+            0, 0, 0, 0, smooth=True, fill=self.empty_color, outline="", state="hidden"
+        )
+        glyph_id = self.create_text(
+            0, 0, text="", fill=self.text_color, state="hidden", tags=("glyph",)
+        )
+        if self.font_spec:
+            self.itemconfigure(glyph_id, font=self.font_spec)
+        self.cells.append([box_id, glyph_id, "", self.empty_color])
+
+    def set_layout(self, word_length, box_size, gap):
+        scaling = self.get_scaling()
+        box_px = max(1, round(box_size * scaling))
+        gap_px = max(0, round(gap * scaling))
+        pad_px = round(self.CELL_PAD_Y * scaling)
+        radius = self.CORNER_RADIUS * scaling
+
+        while len(self.cells) < word_length:
+            self.create_cell()
+
+        # Eliminar celdas sobrantes (prevenir crecimiento infinito de memoria)
+        if len(self.cells) - word_length > self.MAX_SPARE_CELLS:
+            for box_id, glyph_id, _, _ in self.cells[
+                word_length + self.MAX_SPARE_CELLS :
+            ]:
+                self.delete(box_id, glyph_id)
+            del self.cells[word_length + self.MAX_SPARE_CELLS :]
+
+        step = box_px + gap_px * 2
+        for i, (box_id, glyph_id, _, _) in enumerate(self.cells):
+            if i >= word_length:
+                self.itemconfigure(box_id, state="hidden")
+                self.itemconfigure(glyph_id, state="hidden")
+                continue
+            x0 = i * step + gap_px
+            y0 = pad_px
+            self.coords(
+                box_id,
+                *rounded_rect_points(x0, y0, x0 + box_px, y0 + box_px, radius),
+            )
+            self.coords(glyph_id, x0 + box_px / 2, y0 + box_px / 2)
+            self.itemconfigure(box_id, state="normal")
+            self.itemconfigure(glyph_id, state="normal")
+
+        self.word_length = word_length
+        self.box_size = box_size
+        self.gap = gap
+        self.refresh_font(scaling)
+        self.configure(
+            width=max(box_px, word_length * step), height=box_px + pad_px * 2
+        )
+
+    def refresh_font(self, scaling=None):
+        if self.font is None:
+            return
+        if scaling is None:
+            scaling = self.get_scaling()
+        if isinstance(self.font, ctk.CTkFont):
+            spec = self.font.create_scaled_tuple(scaling)
+        else:
+            spec = self.font
+        if spec != self.font_spec:
+            self.font_spec = spec
+            self.itemconfigure("glyph", font=spec)
+
+    # =========================================================================
+    # Contenido
+    # =========================================================================
+
+    def set_cell(self, index, char, fill=None):
+        if index >= len(self.cells):
+            return
+        cell = self.cells[index]
+        char = char or ""
+        if not char or fill is None:
+            fill = self.empty_color
+        # Solo tocar los elementos que realmente cambiaron
+        try:
+            if cell[2] != char:
+                self.itemconfigure(cell[1], text=char)
+                cell[2] = char
+            if cell[3] != fill:
+                self.itemconfigure(cell[0], fill=fill)
+                cell[3] = fill
+        except tk.TclError:
+            pass
+
+    def set_fill(self, index, fill):
+        if index >= len(self.cells):
+            return
+        cell = self.cells[index]
+        if cell[3] == fill:
+            return
+        try:
+            self.itemconfigure(cell[0], fill=fill)
+            cell[3] = fill
+        except tk.TclError:
+            pass
@@ -0,0 +1,135 @@
+import customtkinter as ctk
+
+from juego.rutas_app import get_resource_fonts_dir
+
+# (límite, paso): por debajo de cada límite los tamaños se redondean al paso.
+# Al arrastrar el borde de la ventana la fuente solo cambia cada pocos píxeles,
+# así Tk no redistribuye todos los widgets que la usan en cada evento. Solo se
+# aplica al redimensionar: el tamaño de diseño (keep) se respeta tal cual
+FONT_SIZE_STEPS = ((20, 1), (40, 2), (None, 4))
+
+
+def quantize_font_size(size, keep=None):
+    size = max(1, int(round(size)))
+    if size == keep:
+        return size
+    for limit, step in FONT_SIZE_STEPS:
+        if limit is None or size < limit:
+            return max(step, int(round(size / step)) * step)
+    return size
+
+
+class FontPool:
+    # Fuentes de toda la aplicación. Las fijas se comparten por
+    # (familia, tamaño, peso) con su tamaño exacto y nunca se reconfiguran; las
+    # escalables son una por rol y pantalla, y solo se reconfiguran cuando cambia
+    # su tamaño cuantizado
+
+    instance = None
+
+    def __init__(self):
+        self.fixed = {}
+        self.scalable_fonts = {}
+        self.applied_sizes = {}
+        self.design_sizes = {}
+        self.bundled_loaded = False
+
+    @classmethod
+    def shared(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def load_bundled_fonts(self, fonts_dir=None):
+        # Registrar los TTF incluidos una sola vez por ejecución
+        if self.bundled_loaded:
+            return
+        self.bundled_loaded = True
+        fonts_dir = fonts_dir or get_resource_fonts_dir()
+        try:
+            paths = sorted(fonts_dir.glob("*.ttf"))
+        except OSError:
+            return
+        for path in paths:
+            if not ctk.FontManager.load_font(str(path)):
+                print(f"Font not loaded: {path.name}")
+
+    def make(self, family, size, weight=None):
+        return (
+            ctk.CTkFont(family=family, size=size, weight=weight)
+            if weight
+            else ctk.CTkFont(family=family, size=size)
+        )
+
+    def get(self, family, size, weight=None):
+        key = (family, size, weight)
+        font = self.fixed.get(key)
+        if font is None:
+            font = self.fixed[key] = self.make(family, size, weight)
+        return font
+
+    def scalable(self, namespace, name, family, size, weight=None):
+        # Se reutiliza entre instancias de la misma pantalla: solo una está
+        # visible a la vez y todas la escalan igual
+        key = (namespace, name, family, weight)
+        font = self.scalable_fonts.get(key)
+        if font is None:
+            font = self.scalable_fonts[key] = self.make(family, size, weight)
+            self.applied_sizes[id(font)] = size
+            self.design_sizes[id(font)] = size
+        else:
+            self.set_size(font, size)
+        return font
+
+    def set_size(self, font, size):
+        # Las fuentes del pool viven toda la ejecución: su id es estable
+        size = quantize_font_size(size, self.design_sizes.get(id(font)))
+        if self.applied_sizes.get(id(font)) != size:
+            self.applied_sizes[id(font)] = size
+            font.configure(size=size)
+        return size
+
+
+class FontRegistry:
+    # Fuentes con nombre de una pantalla, escaladas con la ventana
+
+    def __init__(self, specs, namespace, max_ratio=2.5):
+        self.pool = FontPool.shared()
+        self.namespace = namespace
+        self.max_ratio = max_ratio
+        self.fonts = {}
+        self.base_sizes = {}
+        self.min_sizes = {}
+
+        for name, (family, size, weight, min_size) in specs.items():
+            self.fonts[name] = self.pool.scalable(namespace, name, family, size, weight)
+            self.base_sizes[name] = size
+            self.min_sizes[name] = min_size or 10
+
+    def get(self, name):
+        return self.fonts.get(name)
+
+    def items(self):
+        return self.fonts.items()
+
+    def as_dict(self):
+        return dict(self.fonts)
+
+    def scaled_size(self, name, scale, scaler):
+        base_size = self.base_sizes.get(name, 14)
+        min_size = self.min_sizes.get(name, 10)
+        max_size = base_size * self.max_ratio
+        return quantize_font_size(
+            scaler.scale_value(base_size, scale, min_size, max_size), base_size
+        )
+
+    def set_size(self, name, size):
+        return self.pool.set_size(self.fonts[name], size)
+
+    def update_scale(self, scale, scaler):
+        for name in self.fonts:
+            self.set_size(name, self.scaled_size(name, scale, scaler))
+
+    def attach_attributes(self, target):
+        for name, font in self.fonts.items():
+            setattr(target, f"{name}_font", font)
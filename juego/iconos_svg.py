@@ -0,0 +1,299 @@
+import hashlib
+import os
+import re
+import shutil
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from PIL import Image, ImageTk
+from tksvg import SvgImage as TkSvgImage
+
+from juego.rutas_app import get_data_root
+
+# Subir la versión cuando cambie la forma de rasterizar: invalida la caché en disco
+ICON_CACHE_VERSION = 1
+DEFAULT_SVG_SIZE = (24, 24)
+MEMORY_CACHE_MAX = 256
+# Cada tamaño de ventana visto al redimensionar genera PNG nuevos: al pasar de
+# DISK_CACHE_MAX se borran los menos usados hasta quedar en DISK_CACHE_TRIM
+DISK_CACHE_MAX = 512
+DISK_CACHE_TRIM = 384
+
+LENGTH_PATTERN = re.compile(r"^\s*([0-9.]+)\s*(px)?\s*$")
+
+
+def get_icon_cache_dir():
+    return get_data_root() / "cache" / f"iconos_v{ICON_CACHE_VERSION}"
+
+
+def parse_svg_size(svg_path):
+    # Solo lee el elemento raíz: no hace falta rasterizar para conocer el tamaño
+    try:
+        for _, element in ET.iterparse(str(svg_path), events=("start",)):
+            root = element
+            break
+        else:
+            return DEFAULT_SVG_SIZE
+    except (OSError, ET.ParseError):
+        return DEFAULT_SVG_SIZE
+
+    width = parse_length(root.get("width"))
+    height = parse_length(root.get("height"))
+    view_box = (root.get("viewBox") or "").replace(",", " ").split()
+    if (width is None or height is None) and len(view_box) == 4:
+        try:
+            box_w, box_h = float(view_box[2]), float(view_box[3])
+        except ValueError:
+            box_w = box_h = 0
+        if box_w > 0 and box_h > 0:
+            if width is None and height is None:
+                width, height = box_w, box_h
+            elif width is None:
+                width = height * box_w / box_h
+            else:
+                height = width * box_h / box_w
+    if not width or not height:
+        return DEFAULT_SVG_SIZE
+    return (max(1, round(width)), max(1, round(height)))
+
+
+def parse_length(value):
+    match = LENGTH_PATTERN.match(value or "")
+    if not match:
+        return None
+    try:
+        return float(match.group(1)) or None
+    except ValueError:
+        return None
+
+
+def parse_hex_color(hex_color):
+    try:
+        hex_color = hex_color.lstrip("#")
+        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+    except (AttributeError, ValueError, IndexError):
+        return None
+
+
+def tint_image(pil_image, hex_color, mode="replace"):
+    rgb = parse_hex_color(hex_color) if hex_color else None
+    if rgb is None:
+        return pil_image
+    alpha = pil_image.getchannel("A")
+    if mode == "multiply":
+        channels = [
+            channel.point(lambda value, c=component: int(value * c / 255))
+            for channel, component in zip(pil_image.split()[:3], rgb)
+        ]
+        return Image.merge("RGBA", (*channels, alpha))
+    # "replace": un solo color conservando la transparencia original
+    tinted = Image.new("RGBA", pil_image.size, (*rgb, 0))
+    tinted.putalpha(alpha)
+    return tinted
+
+
+def crop_to_alpha_bounds(pil_image):
+    try:
+        bbox = pil_image.getchannel("A").getbbox()
+        return pil_image.crop(bbox) if bbox else pil_image
+    except (ValueError, OSError, AttributeError):
+        return pil_image
+
+
+def fit_to_canvas(pil_image, size):
+    target_w, target_h = size
+    orig_w, orig_h = pil_image.size
+    if orig_w <= 0 or orig_h <= 0:
+        return pil_image
+    ratio = min(target_w / orig_w, target_h / orig_h)
+    new_size = (max(1, int(orig_w * ratio)), max(1, int(orig_h * ratio)))
+    if new_size != pil_image.size:
+        resample = getattr(Image.Resampling, "LANCZOS", 1)
+        pil_image = pil_image.resize(new_size, resample)
+    canvas = Image.new("RGBA", size, (0, 0, 0, 0))
+    canvas.paste(
+        pil_image, ((target_w - new_size[0]) // 2, (target_h - new_size[1]) // 2)
+    )
+    return canvas
+
+
+class SvgIconService:
+    # Rasteriza cada (svg, escala, tinte) una sola vez por instalación: primero en
+    # memoria y luego como PNG en una caché versionada en disco
+
+    instance = None
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else get_icon_cache_dir()
+        self.images = {}
+        self.sizes = {}
+        self.stamps = {}
+        self.lock = threading.Lock()
+        self.pruned = False
+        self.disk_entries = None
+
+    @classmethod
+    def shared(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    def get_base_size(self, svg_path):
+        key = str(svg_path)
+        size = self.sizes.get(key)
+        if size is None:
+            size = self.sizes[key] = parse_svg_size(svg_path)
+        return size
+
+    def load_svg_image(self, svg_path, scale=1.0, tint=None, tint_mode="replace"):
+        svg_path = Path(svg_path)
+        stamp = self.source_stamp(svg_path)
+        if stamp is None:
+            print(f"Error loading SVG image '{svg_path}': file not found")
+            return None
+        key = ("raster", svg_path.name, stamp, round(scale, 4), tint, tint_mode)
+        return self.cached(key, self.rasterize, svg_path, scale, tint, tint_mode)
+
+    def render_icon(self, svg_path, size, scale=None, tint=None):
+        # Icono recortado a su contenido y centrado en un lienzo de tamaño fijo
+        svg_path = Path(svg_path)
+        if scale is None:
+            # Rasterizar a 2x el tamaño objetivo para nitidez, luego reducir
+            scale = (max(size) * 2) / max(*self.get_base_size(svg_path), 1)
+        stamp = self.source_stamp(svg_path)
+        if stamp is None:
+            return None
+        key = ("icon", svg_path.name, stamp, tuple(size), round(scale, 4), tint)
+        return self.cached(key, self.compose_icon, svg_path, size, scale, tint)
+
+    # =========================================================================
+    # Caché
+    # =========================================================================
+
+    def source_stamp(self, svg_path):
+        # Huella del contenido (no del mtime: el EXE extrae los recursos en cada
+        # arranque); se calcula una vez por archivo y ejecución
+        key = str(svg_path)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            try:
+                stamp = hashlib.sha1(svg_path.read_bytes()).hexdigest()[:16]
+            except OSError:
+                return None
+            self.stamps[key] = stamp
+        return stamp
+
+    def disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:24]
+        return self.cache_dir / f"{Path(key[1]).stem}-{digest}.png"
+
+    def cached(self, key, render, *args):
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        path = self.disk_path(key)
+        image = self.read_png(path)
+        if image is None:
+            image = render(*args)
+            if image is None:
+                return None
+            self.write_png(path, image)
+
+        with self.lock:
+            self.images[key] = image
+            if len(self.images) > MEMORY_CACHE_MAX:
+                self.images.pop(next(iter(self.images)), None)
+        return image
+
+    def read_png(self, path):
+        try:
+            with Image.open(path) as img:
+                image = img.convert("RGBA")
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        try:
+            # El mtime marca el último uso para el recorte LRU
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def write_png(self, path, image):
+        self.prune_old_versions()
+        temporary = path.with_name(f".{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(temporary, "PNG")
+            temporary.replace(path)
+        except OSError as error:
+            print(f"Icon cache not written '{path.name}': {error}")
+            return
+        self.track_disk_entry()
+
+    def track_disk_entry(self):
+        with self.lock:
+            if self.disk_entries is None:
+                self.disk_entries = len(self.list_disk_entries())
+            else:
+                self.disk_entries += 1
+            if self.disk_entries > DISK_CACHE_MAX:
+                self.trim_disk_cache()
+
+    def list_disk_entries(self):
+        entries = []
+        try:
+            for path in self.cache_dir.glob("*.png"):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except OSError:
+                    pass
+        except OSError:
+            pass
+        return entries
+
+    def trim_disk_cache(self):
+        entries = sorted(self.list_disk_entries())
+        remaining = len(entries)
+        for _, path in entries[: max(0, len(entries) - DISK_CACHE_TRIM)]:
+            try:
+                path.unlink()
+                remaining -= 1
+            except OSError:
+                pass
+        self.disk_entries = remaining
+
+    def prune_old_versions(self):
+        if self.pruned:
+            return
+        self.pruned = True
+        try:
+            for entry in self.cache_dir.parent.glob("iconos_v*"):
+                if entry != self.cache_dir and entry.is_dir():
+                    shutil.rmtree(entry, ignore_errors=True)
+        except OSError:
+            pass
+
+    # =========================================================================
+    # Rasterizado
+    # =========================================================================
+
+    def rasterize(self, svg_path, scale, tint=None, tint_mode="replace"):
+        try:
+            svg_photo = TkSvgImage(file=str(svg_path), scale=scale)
+            pil_image = ImageTk.getimage(svg_photo).convert("RGBA")
+        except (FileNotFoundError, OSError, ValueError, RuntimeError) as error:
+            print(f"Error loading SVG image '{svg_path}': {error}")
+            return None
+        return tint_image(pil_image, tint, tint_mode)
+
+    def compose_icon(self, svg_path, size, scale, tint=None):
+        pil_image = self.rasterize(svg_path, scale, tint)
+        if pil_image is None:
+            return None
+        return fit_to_canvas(crop_to_alpha_bounds(pil_image), tuple(size))
@@ -0,0 +1,141 @@
+import io
+import queue
+import threading
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+# Las imágenes se muestran como máximo a unos cientos de píxeles; guardar el
+# original de la cámara solo obliga a decodificarlo completo en cada partida
+MAX_IMPORT_SIDE = 1024
+JPEG_QUALITY = 85
+
+
+class ImageImportError(Exception):
+
+    pass
+
+
+class ImportCancelled(Exception):
+
+    pass
+
+
+def has_transparency(image):
+    if image.mode in ("RGBA", "LA", "PA"):
+        extrema = image.getchannel("A").getextrema()
+        return extrema[0] < 255
+    return image.mode == "P" and "transparency" in image.info
+
+
+def report(progress, fraction, message):
+    if progress is not None:
+        progress(fraction, message)
+
+
+def prepare_image(source_path, max_side=MAX_IMPORT_SIDE, progress=None):
+    report(progress, 0.1, "Checking image...")
+    try:
+        with Image.open(source_path) as probe:
+            probe.verify()
+    except Image.DecompressionBombError as error:
+        raise ImageImportError("The image is too large to import.") from error
+    except (OSError, ValueError, SyntaxError) as error:
+        raise ImageImportError("The file is not a readable image.") from error
+
+    report(progress, 0.3, "Decoding image...")
+    try:
+        with Image.open(source_path) as img:
+            # JPEG: decodificar directamente a una escala reducida
+            img.draft("RGB", (max_side, max_side))
+            # Respetar la orientación de la cámara antes de descartar el EXIF
+            image = ImageOps.exif_transpose(img)
+            image.load()
+    except Image.DecompressionBombError as error:
+        raise ImageImportError("The image is too large to import.") from error
+    except (OSError, ValueError) as error:
+        raise ImageImportError("The image could not be decoded.") from error
+
+    report(progress, 0.6, "Resizing image...")
+    transparent = has_transparency(image)
+    image = image.convert("RGBA" if transparent else "RGB")
+    if max(image.size) > max_side:
+        resample = getattr(Image.Resampling, "LANCZOS", 1)
+        image.thumbnail((max_side, max_side), resample)
+    return image, transparent
+
+
+def encode_image(image, transparent):
+    # Sin metadatos: Pillow reutiliza image.info (ICC, EXIF, comentarios) al guardar
+    image.info = {}
+    buffer = io.BytesIO()
+    if transparent:
+        image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue(), ".png"
+    image.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue(), ".jpg"
+
+
+class ImageImportJob:
+    # Importa una imagen en un hilo; la interfaz consulta poll() con after()
+
+    def __init__(self, image_handler, source_path):
+        self.image_handler = image_handler
+        self.source_path = Path(source_path)
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.done = False
+        self.destination = None
+        self.error = None
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def progress(self, fraction, message):
+        if self.cancelled.is_set():
+            raise ImportCancelled()
+        self.events.put(("progress", fraction, message))
+
+    def run(self):
+        # El evento final se emite siempre: sin él la ventana quedaría esperando
+        destination, error_message = None, None
+        try:
+            destination = self.image_handler.import_image(
+                self.source_path, progress=self.progress
+            )
+            if self.cancelled.is_set():
+                # El archivo queda en el almacén: puede estar compartido
+                destination = None
+        except ImportCancelled:
+            pass
+        except ImageImportError as error:
+            error_message = str(error)
+        except OSError as error:
+            error_message = f"Unable to save the image.\n\n{error}"
+        except Exception as error:
+            print(f"Unexpected error importing '{self.source_path}': {error!r}")
+            destination = None
+            error_message = f"Unable to import the image.\n\n{error}"
+        finally:
+            self.events.put(("done", destination, error_message))
+
+    def poll(self):
+        updates = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return updates
+            if event[0] == "done":
+                self.done = True
+                self.destination, self.error = event[1], event[2]
+                # poll() corre en el hilo de la interfaz, el único que toca la
+                # caché de rutas; el almacén pudo recibir un archivo nuevo
+                self.image_handler.invalidate_image_paths()
+            else:
+                updates.append((event[1], event[2]))
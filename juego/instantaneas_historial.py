@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+SNAPSHOT_CACHE_SIZE = 12
+
+
+class RenderSnapshot:
+    # Todo lo que hace falta para volver a mostrar una pregunta del historial
+    # sin leer ni decodificar nada
+
+    __slots__ = (
+        "definition",
+        "answer",
+        "answer_length",
+        "timer_text",
+        "score_text",
+        "skipped",
+        "image",
+        "image_text",
+        "image_box",
+    )
+
+    def __init__(self, state):
+        question = state["question"]
+        self.definition = question.get("definition", "No definition")
+        self.answer = state["answer"]
+        self.answer_length = len(question.get("title", "").replace(" ", ""))
+        m, s = divmod(state["time_taken"], 60)
+        self.timer_text = f"{m:02d}:{s:02d}"
+        self.score_text = str(state["total_score"])
+        self.skipped = state.get("was_skipped", False)
+        # Imagen ya escalada; image_box es el tamaño para el que se preparó
+        self.image = None
+        self.image_text = ""
+        self.image_box = None
+
+    def has_image_for(self, image_box):
+        return self.image_box == image_box
+
+
+class SnapshotCache:
+
+    def __init__(self, max_size=SNAPSHOT_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+    def get(self, state):
+        entry = self.entries.get(id(state))
+        # Se guarda el propio estado: su id no puede reutilizarse mientras exista
+        if entry is None or entry[0] is not state:
+            return None
+        self.entries.move_to_end(id(state))
+        return entry[1]
+
+    def put(self, state, snapshot):
+        self.entries[id(state)] = (state, snapshot)
+        self.entries.move_to_end(id(state))
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
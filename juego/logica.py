@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class QuestionResult:
     def __init__(
         self,
@@ -192,6 +198,80 @@ class ScoringSystem:
     def process_wrong_answer(self):
         pass
 
+    def score_batch(self, times, mistakes, prior_streaks=None, multipliers=None):
+        # Puntúa muchas respuestas correctas a la vez con la misma semántica que
+        # process_correct_answer + apply_wildcard_bonus, sin modificar la sesión.
+        # prior_streaks es la racha limpia antes de cada respuesta.
+        # Retorna (puntos_brutos, puntos_otorgados).
+        if np is None:
+            return self.score_batch_python(times, mistakes, prior_streaks, multipliers)
+
+        t = np.asarray(times, dtype=np.float64)
+        errors = np.maximum(0, np.asarray(mistakes, dtype=np.int64))
+        streaks = (
+            np.zeros(t.shape, dtype=np.int64)
+            if prior_streaks is None
+            else np.asarray(prior_streaks, dtype=np.int64)
+        )
+        wildcard = (
+            np.ones(t.shape, dtype=np.int64)
+            if multipliers is None
+            else np.asarray(multipliers, dtype=np.int64)
+        )
+
+        effective = np.maximum(0, t - self.GRACE_PERIOD_SECONDS)
+        tier_2 = self.MAX_TIME_MULTIPLIER - (
+            (effective - self.SPEED_TIER_1_MAX)
+            / (self.SPEED_TIER_2_MAX - self.SPEED_TIER_1_MAX)
+        ) * (self.MAX_TIME_MULTIPLIER - self.MID_TIME_MULTIPLIER)
+        tier_3 = self.MID_TIME_MULTIPLIER - (
+            (effective - self.SPEED_TIER_2_MAX)
+            / (self.SPEED_TIER_3_MAX - self.SPEED_TIER_2_MAX)
+        ) * (self.MID_TIME_MULTIPLIER - self.MIN_TIME_MULTIPLIER)
+        time_mult = np.select(
+            [
+                effective <= self.SPEED_TIER_1_MAX,
+                effective <= self.SPEED_TIER_2_MAX,
+                effective <= self.SPEED_TIER_3_MAX,
+            ],
+            [self.MAX_TIME_MULTIPLIER, tier_2, tier_3],
+            self.MIN_TIME_MULTIPLIER,
+        )
+
+        # np.rint redondea al par más cercano, igual que round()
+        raw_points = np.rint(self.base_points * time_mult).astype(np.int64)
+        score = np.maximum(0, raw_points - errors * self.penalty_per_mistake)
+
+        new_streaks = np.where(errors == 0, streaks + 1, 0)
+        capped = np.minimum(new_streaks, self.STREAK_MAX_LEVEL)
+        streak_mult = 1.0 + (self.STREAK_BONUS_PER_LEVEL * capped)
+        points = np.rint(score * streak_mult).astype(np.int64)
+
+        awarded = np.where(wildcard > 1, points * wildcard, points)
+        return raw_points, awarded
+
+    def score_batch_python(self, times, mistakes, prior_streaks=None, multipliers=None):
+        # Respaldo sin NumPy con los mismos resultados que score_batch
+        count = len(times)
+        prior_streaks = prior_streaks if prior_streaks is not None else [0] * count
+        multipliers = multipliers if multipliers is not None else [1] * count
+        raw_points = []
+        awarded = []
+        for time_seconds, errors, streak, mult in zip(
+            times, mistakes, prior_streaks, multipliers
+        ):
+            errors = max(0, int(errors or 0))
+            raw_points.append(
+                self.calculate_raw_points(self.get_effective_time(time_seconds))
+            )
+            new_streak = streak + 1 if errors == 0 else 0
+            streak_mult = 1.0 + (
+                self.STREAK_BONUS_PER_LEVEL * min(new_streak, self.STREAK_MAX_LEVEL)
+            )
+            points = round(self.calculate_score(time_seconds, errors) * streak_mult)
+            awarded.append(points * mult if mult > 1 else points)
+        return raw_points, awarded
+
     def get_session_stats(self):
         mastery_pct = self.get_mastery_percentage()
         session_max_raw = self.get_session_max_raw()
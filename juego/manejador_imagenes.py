@@ -1,18 +1,25 @@
-import shutil
+import time
 from pathlib import Path
 from tkinter import messagebox
 
 import customtkinter as ctk
-from PIL import Image, ImageFile, ImageTk
+from PIL import Image, ImageFile
 
 ImageFile.LOAD_TRUNCATED_IMAGES = True
-from tksvg import SvgImage as TkSvgImage
+
+from juego.almacen_imagenes import ImageStore
+from juego.iconos_svg import SvgIconService
+from juego.importador_imagenes import encode_image, prepare_image, report
+from juego.miniaturas import ThumbnailStore, resample_for
 
 
 class ImageHandler:
 
     ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp"}
     MAX_DISPLAY_NAME_LENGTH = 60
+    # Intervalo mínimo entre revisiones del mtime de las carpetas consultadas
+    RESOLVE_RECHECK_SECONDS = 2.0
+    DETAIL_THUMBNAIL_SIZE = (256, 256)
 
     def __init__(
         self,
@@ -29,77 +36,34 @@ class ImageHandler:
         self.resource_root = Path(resource_root) if resource_root is not None else None
         if self.user_images_dir is None and self.data_root is not None:
             self.user_images_dir = self.data_root / "recursos" / "imagenes"
+        self.image_store = ImageStore(self.user_images_dir or self.images_dir)
+        self.icon_service = SvgIconService.shared()
+        self.thumbnails = ThumbnailStore.shared()
         self.iconcache = {}
         self.detailcache = {}
         self.cachemax = 128
+        self.resolvecache = {}
+        self.resolvewatch = {}
+        self.resolvechecked = 0.0
 
-    def load_svg_image(self, svg_path, scale=1.0):
-        try:
-            return ImageTk.getimage(
-                TkSvgImage(file=str(svg_path), scale=scale)
-            ).convert("RGBA")
-        except (FileNotFoundError, OSError, ValueError, RuntimeError):
-            return None
-
-    def get_svg_base_size(self, svg_path):
-        try:
-            img = ImageTk.getimage(TkSvgImage(file=str(svg_path), scale=1.0))
-            return img.size
-        except (FileNotFoundError, OSError, ValueError, RuntimeError):
-            return (24, 24)  # respaldo
-
-    def crop_to_alpha_bounds(self, pil_image):
-        try:
-            bbox = pil_image.getchannel("A").getbbox()
-            return pil_image.crop(bbox) if bbox else pil_image
-        except (ValueError, OSError, AttributeError):
-            return pil_image
-
-    def resize_image(self, image, target_size):
+    def resize_image(self, image, target_size, resample=None):
         if image.size == target_size:
             return image
-        resample = getattr(Image.Resampling, "LANCZOS", 1)
+        if resample is None:
+            resample = getattr(Image.Resampling, "LANCZOS", 1)
         return image.resize(target_size, resample)
 
     def create_ctk_icon(self, svg_filename, size, scale=None):
         svg_path = self.images_dir / svg_filename
-        target_w, target_h = size
-        target_max = max(target_w, target_h)
-
-        if scale is None:
-            # Calcular la escala necesaria para rasterizar SVG a resolución objetivo
-            base_w, base_h = self.get_svg_base_size(svg_path)
-            base_max = max(base_w, base_h, 1)
-            # Rasterizar a 2x el tamaño objetivo para nitidez, luego reducir
-            scale = (target_max * 2) / base_max
-
-        key = (str(svg_path), size, round(scale, 4))
+        key = (str(svg_path), size, scale)
         cached = self.iconcache.get(key)
         if cached is not None:
             return cached
 
-        pil_image = self.load_svg_image(svg_path, scale)
-        if not pil_image:
+        final = self.icon_service.render_icon(svg_path, size, scale)
+        if final is None:
             return None
 
-        cropped = self.crop_to_alpha_bounds(pil_image)
-
-        # Preservar proporción de aspecto al redimensionar
-        orig_w, orig_h = cropped.size
-        if orig_w > 0 and orig_h > 0:
-            ratio = min(target_w / orig_w, target_h / orig_h)
-            new_w = max(1, int(orig_w * ratio))
-            new_h = max(1, int(orig_h * ratio))
-            resized = self.resize_image(cropped, (new_w, new_h))
-
-            # Centrar en lienzo transparente
-            final = Image.new("RGBA", size, (0, 0, 0, 0))
-            paste_x = (target_w - new_w) // 2
-            paste_y = (target_h - new_h) // 2
-            final.paste(resized, (paste_x, paste_y))
-        else:
-            final = cropped
-
         icon = ctk.CTkImage(light_image=final, dark_image=final, size=size)
         self.iconcache[key] = icon
         if len(self.iconcache) > self.cachemax:
@@ -111,6 +75,18 @@ class ImageHandler:
         if not image_path:
             return None
 
+        key = str(image_path)
+        self.revalidate_resolve_cache()
+        try:
+            return self.resolvecache[key]
+        except KeyError:
+            pass
+
+        resolved = self.lookup_image_path(image_path)
+        self.resolvecache[key] = resolved
+        return resolved
+
+    def lookup_image_path(self, image_path):
         candidate = Path(image_path)
         if not candidate.is_absolute():
             for base in (
@@ -122,26 +98,55 @@ class ImageHandler:
                 if base is None:
                     continue
                 resolved = base / candidate
+                self.watch_directory(resolved.parent)
                 if resolved.exists():
                     return resolved
             candidate = Path(__file__).resolve().parent.parent / candidate
 
+        self.watch_directory(candidate.parent)
         return candidate if candidate.exists() else None
 
+    def watch_directory(self, directory):
+        if directory not in self.resolvewatch:
+            self.resolvewatch[directory] = self.get_directory_mtime(directory)
+
+    def get_directory_mtime(self, directory):
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def revalidate_resolve_cache(self):
+        # Crear, borrar o renombrar archivos cambia el mtime de la carpeta; se
+        # revisa como mucho cada RESOLVE_RECHECK_SECONDS
+        now = time.monotonic()
+        if now - self.resolvechecked < self.RESOLVE_RECHECK_SECONDS:
+            return
+        self.resolvechecked = now
+        for directory, mtime in list(self.resolvewatch.items()):
+            if self.get_directory_mtime(directory) != mtime:
+                self.invalidate_image_paths()
+                return
+
+    def invalidate_image_paths(self):
+        self.resolvecache.clear()
+        self.resolvewatch.clear()
+
     def create_detail_image(self, image_path, max_size):
         resolved_path = self.resolve_image_path(image_path)
         if not resolved_path:
             return None
 
-        key = (str(resolved_path), max_size)
+        # Las imágenes del almacén se identifican por contenido, no por ruta
+        content_key = self.image_store.content_key(resolved_path)
+        key = (content_key or str(resolved_path), max_size)
         cached = self.detailcache.get(key)
         if cached is not None:
             return cached
 
-        try:
-            with Image.open(resolved_path) as img:
-                prepared_image = img.convert("RGBA").copy()
-        except (FileNotFoundError, OSError, ValueError):
+        # Miniatura precalculada o decodificación reducida, nunca el original completo
+        prepared_image = self.thumbnails.get(resolved_path, max_size, content_key)
+        if prepared_image is None:
             return None
 
         width, height = prepared_image.size
@@ -154,7 +159,9 @@ class ImageHandler:
         new_width = max(1, int(width * scale))
         new_height = max(1, int(height * scale))
 
-        resized_image = self.resize_image(prepared_image, (new_width, new_height))
+        resized_image = self.resize_image(
+            prepared_image, (new_width, new_height), resample_for(max(max_size))
+        )
 
         final_image = Image.new("RGBA", max_size, (0, 0, 0, 0))
         paste_x = (max_width - new_width) // 2
@@ -172,6 +179,14 @@ class ImageHandler:
             self.detailcache.pop(viejo, None)
         return image
 
+    def warm_thumbnails(self, image_paths, max_size):
+        entries = []
+        for image_path in dict.fromkeys(image_paths):
+            resolved = self.resolve_image_path(image_path)
+            if resolved:
+                entries.append((resolved, self.image_store.content_key(resolved)))
+        self.thumbnails.warm(entries, max_size)
+
     def truncate_filename(self, name):
         if not name or len(name) <= self.MAX_DISPLAY_NAME_LENGTH:
             return name or ""
@@ -187,18 +202,10 @@ class ImageHandler:
         except OSError:
             return target_dir, source_path
 
-    def get_unique_destination(self, source_path):
-        stem = source_path.stem or "image"
-        suffix = source_path.suffix or ".png"
-
-        target_dir = self.user_images_dir or self.images_dir
-        destination = target_dir / (source_path.name or "image.png")
-        counter = 1
-        while destination.exists():
-            destination = target_dir / f"{stem}_{counter}{suffix}"
-            counter += 1
-
-        return destination
+    def display_name(self, image_path):
+        resolved = self.resolve_image_path(image_path)
+        original = self.image_store.original_name(resolved) if resolved else None
+        return self.truncate_filename(original or Path(image_path).name)
 
     def copy_image_to_project(self, source_path):
         images_dir, source = self.resolve_paths(source_path)
@@ -218,9 +225,9 @@ class ImageHandler:
             )
             return None
 
-        destination = self.get_unique_destination(source_path)
         try:
-            shutil.copy2(source_path, destination)
+            destination = self.image_store.put_file(source_path)
+            self.invalidate_image_paths()
             return Path("recursos") / "imagenes" / destination.name
         except OSError as error:
             messagebox.showerror(
@@ -229,6 +236,34 @@ class ImageHandler:
             )
             return None
 
+    def is_project_image(self, source_path):
+        images_dir, source = self.resolve_paths(Path(source_path))
+        try:
+            source.relative_to(images_dir)
+            return True
+        except ValueError:
+            return False
+
+    def import_image(self, source_path, progress=None):
+        # Se ejecuta en un hilo de trabajo: sin widgets ni cuadros de diálogo
+        source_path = Path(source_path)
+        if self.is_project_image(source_path):
+            return source_path
+        existing = self.image_store.lookup_source(source_path)
+        if existing is not None:
+            return existing
+
+        image, transparent = prepare_image(source_path, progress=progress)
+        report(progress, 0.85, "Saving image...")
+        data, suffix = encode_image(image, transparent)
+        destination = self.image_store.put_bytes(
+            data, suffix, name=source_path.name, source_path=source_path
+        )
+        # La caché de rutas se invalida en el hilo de la interfaz (ImageImportJob.poll)
+        # Dejar lista la miniatura del panel de detalle mientras seguimos en el hilo
+        self.thumbnails.get(destination, self.DETAIL_THUMBNAIL_SIZE, destination.stem)
+        return destination
+
     def create_transparent_placeholder(self):
         pixel = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
         return ctk.CTkImage(light_image=pixel, dark_image=pixel, size=(1, 1))
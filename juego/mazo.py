@@ -0,0 +1,131 @@
+class FenwickTree:
+
+    def __init__(self, weights):
+        self.size = len(weights)
+        self.weights = list(weights)
+        self.tree = [0] * (self.size + 1)
+        # Construcción en O(n)
+        for i, weight in enumerate(self.weights, start=1):
+            self.tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.weights)
+        self.top_bit = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def update(self, index, delta):
+        self.weights[index] += delta
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        # Índice del primer elemento cuya suma acumulada supera target
+        pos = 0
+        step = self.top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+class UniformDeck:
+
+    mode = "uniform"
+
+    def __init__(self, questions, rng):
+        self.questions = list(questions)
+        self.rng = rng
+        self.tree = FenwickTree([1] * len(self.questions))
+        self.remaining = len(self.questions)
+
+    def __len__(self):
+        return self.remaining
+
+    def draw(self):
+        if not self.remaining:
+            return None
+        # La k-ésima pregunta restante: misma secuencia que randrange + pop
+        index = self.tree.find(self.rng.randrange(self.remaining))
+        self.tree.update(index, -1)
+        self.remaining -= 1
+        return self.questions[index]
+
+
+class ShuffledDeck:
+
+    mode = "shuffle"
+
+    def __init__(self, questions, rng):
+        self.order = list(questions)
+        rng.shuffle(self.order)
+        # Sacar del final es O(1)
+        self.order.reverse()
+
+    def __len__(self):
+        return len(self.order)
+
+    def draw(self):
+        return self.order.pop() if self.order else None
+
+
+class WeightedDeck:
+
+    mode = "weighted"
+
+    def __init__(self, questions, rng, weights):
+        self.questions = list(questions)
+        self.rng = rng
+        self.tree = FenwickTree([max(1e-6, float(w)) for w in weights])
+        self.remaining = len(self.questions)
+
+    def __len__(self):
+        return self.remaining
+
+    def draw(self):
+        if not self.remaining:
+            return None
+        index = self.tree.find(self.rng.random() * self.tree.total)
+        # Tras muchas restas en coma flotante, saltar entradas ya retiradas
+        while self.tree.weights[index] <= 0:
+            index = (index + 1) % len(self.questions)
+        self.tree.update(index, -self.tree.weights[index])
+        self.remaining -= 1
+        return self.questions[index]
+
+
+DECK_MODES = {
+    UniformDeck.mode: UniformDeck,
+    ShuffledDeck.mode: ShuffledDeck,
+    WeightedDeck.mode: WeightedDeck,
+}
+
+
+def build_deck(mode, questions, rng, weights=None):
+    if mode == WeightedDeck.mode:
+        if weights is None:
+            weights = [1.0] * len(questions)
+        return WeightedDeck(questions, rng, weights)
+    return DECK_MODES.get(mode, UniformDeck)(questions, rng)
+
+
+def difficulty_weights(questions, stats):
+    # Peso mayor para términos con más errores, saltos o tiempo en partidas previas
+    weights = []
+    for question in questions:
+        row = stats.get(question.get("title", ""))
+        if not row:
+            weights.append(1.0)
+            continue
+        weights.append(
+            1.0
+            + row["avg_mistakes"]
+            + 2.0 * row["skip_rate"]
+            + min(row["avg_time"], 180.0) / 60.0
+        )
+    return weights
@@ -0,0 +1,118 @@
+import math
+import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict
+
+from juego.ayudantes_responsivos import get_dpi_scaling
+
+HEIGHT_CACHE_SIZE = 256
+WIDTH_CACHE_SIZE = 4096
+
+
+class TextMeasurer:
+    # Predice la altura de un texto con wraplength a partir de las métricas de la
+    # fuente, sin esperar a que Tk distribuya los widgets
+
+    instance = None
+
+    def __init__(self):
+        self.fonts = {}
+        self.linespaces = {}
+        self.widths = OrderedDict()
+        self.heights = OrderedDict()
+
+    @classmethod
+    def shared(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    # =========================================================================
+    # Fuentes
+    # =========================================================================
+
+    def font_spec(self, font, scaling):
+        # Mismo tamaño en píxeles que usa CTk al aplicar el escalado del widget
+        size = abs(int(font.cget("size")))
+        return (
+            font.cget("family"),
+            -max(1, round(size * scaling)),
+            font.cget("weight"),
+            font.cget("slant"),
+        )
+
+    def get_font(self, spec):
+        tk_font = self.fonts.get(spec)
+        if tk_font is None:
+            family, size, weight, slant = spec
+            tk_font = tkfont.Font(family=family, size=size, weight=weight, slant=slant)
+            self.fonts[spec] = tk_font
+            self.linespaces[spec] = tk_font.metrics("linespace")
+        return tk_font
+
+    def text_width(self, spec, text):
+        key = (spec, text)
+        width = self.widths.get(key)
+        if width is None:
+            width = self.get_font(spec).measure(text)
+            self.widths[key] = width
+            if len(self.widths) > WIDTH_CACHE_SIZE:
+                self.widths.popitem(last=False)
+        return width
+
+    # =========================================================================
+    # Medición
+    # =========================================================================
+
+    def count_lines(self, spec, text, wrap):
+        # Igual que Tk: se corta en los espacios y una palabra más ancha que la
+        # línea se parte por caracteres
+        paragraphs = text.split("\n")
+        if wrap <= 0:
+            return len(paragraphs)
+        space = self.text_width(spec, " ")
+        lines = 0
+        for paragraph in paragraphs:
+            lines += 1
+            line_width = None
+            for word in paragraph.split(" "):
+                width = self.text_width(spec, word)
+                if line_width is not None and line_width + space + width <= wrap:
+                    line_width += space + width
+                    continue
+                if line_width is not None:
+                    lines += 1
+                if width > wrap:
+                    extra = math.ceil(width / wrap) - 1
+                    lines += extra
+                    width -= extra * wrap
+                line_width = width
+        return lines
+
+    def text_height(self, text, font, wraplength, scaling=1.0):
+        # Altura lógica (sin escalar) del texto ajustado a wraplength
+        spec = self.font_spec(font, scaling)
+        wrap = int(round(wraplength * scaling)) if wraplength else 0
+        key = (spec, wrap, text)
+        height = self.heights.get(key)
+        if height is not None:
+            self.heights.move_to_end(key)
+            return height
+        self.get_font(spec)
+        lines = self.count_lines(spec, text, wrap)
+        height = lines * self.linespaces[spec] / scaling
+        self.heights[key] = height
+        if len(self.heights) > HEIGHT_CACHE_SIZE:
+            self.heights.popitem(last=False)
+        return height
+
+    def label_height(self, label, font):
+        # Altura que pedirá un CTkLabel con wraplength: nunca menor que su alto
+        try:
+            text = label.cget("text")
+            wraplength = label.cget("wraplength")
+            min_height = label.cget("height")
+        except (tk.TclError, ValueError):
+            return 0
+        scaling = get_dpi_scaling(label)
+        return max(min_height, self.text_height(text, font, wraplength, scaling))
@@ -0,0 +1,188 @@
+import hashlib
+import os
+import threading
+from collections import deque
+from pathlib import Path
+
+from PIL import Image
+
+from juego.rutas_app import get_data_root
+
+THUMBNAIL_CACHE_VERSION = 1
+# Lados precalculados; el panel de detalle usa el menor que cubra su tamaño
+THUMBNAIL_SIDES = (128, 256, 512)
+# Por debajo de este lado basta un filtro bilineal
+SMALL_TARGET_SIDE = 256
+# Presupuesto de la caché en disco: al superarlo se borran las miniaturas menos
+# usadas hasta quedar en DISK_CACHE_TRIM_BYTES
+DISK_CACHE_MAX_BYTES = 96 * 1024 * 1024
+DISK_CACHE_TRIM_BYTES = 64 * 1024 * 1024
+
+
+def get_thumbnail_cache_dir():
+    return get_data_root() / "cache" / f"miniaturas_v{THUMBNAIL_CACHE_VERSION}"
+
+
+def pick_side(max_size):
+    target = max(max_size)
+    for side in THUMBNAIL_SIDES:
+        if side >= target:
+            return side
+    return None
+
+
+def resample_for(side):
+    if side <= SMALL_TARGET_SIDE:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
+
+def decode_reduced(path, side):
+    # thumbnail() aplica draft() en JPEG y reduce() antes de remuestrear, así que
+    # nunca se decodifica ni convierte la imagen completa
+    with Image.open(path) as img:
+        if img.mode in ("P", "PA"):
+            img = img.convert("RGBA")
+        img.thumbnail((side, side), resample_for(side), reducing_gap=2.0)
+        return img.convert("RGBA")
+
+
+class ThumbnailStore:
+
+    instance = None
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else get_thumbnail_cache_dir()
+        self.lock = threading.Lock()
+        self.warm_thread = None
+        # Pendientes del hilo de precalentado; una llamada nueva se suma a la cola
+        self.warm_queue = deque()
+        self.warm_queued = set()
+        self.disk_bytes = None
+
+    @classmethod
+    def shared(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def cache_path(self, source_path, side, content_key=None):
+        if content_key is None:
+            try:
+                stat = source_path.stat()
+            except OSError:
+                return None
+            stamp = f"{source_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+            content_key = hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:24]
+        return self.cache_dir / f"{content_key}-{side}.png"
+
+    def get(self, source_path, max_size, content_key=None):
+        source_path = Path(source_path)
+        side = pick_side(max_size)
+        if side is None:
+            # Mayor que cualquier miniatura: decodificar reducido al tamaño pedido
+            return self.decode(source_path, max(max_size))
+
+        path = self.cache_path(source_path, side, content_key)
+        if path is None:
+            return None
+        try:
+            with Image.open(path) as img:
+                image = img.convert("RGBA")
+            # El mtime marca el último uso para el recorte LRU
+            os.utime(path)
+            return image
+        except (FileNotFoundError, OSError, ValueError):
+            pass
+
+        image = self.decode(source_path, side)
+        if image is not None:
+            self.write(path, image)
+        return image
+
+    def decode(self, source_path, side):
+        try:
+            return decode_reduced(source_path, side)
+        except (FileNotFoundError, OSError, ValueError, Image.DecompressionBombError):
+            return None
+
+    def write(self, path, image):
+        temporary = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(temporary, "PNG")
+            temporary.replace(path)
+            written = path.stat().st_size
+        except OSError as error:
+            print(f"Thumbnail not cached '{path.name}': {error}")
+            return
+        self.track_disk_usage(written)
+
+    def track_disk_usage(self, written):
+        with self.lock:
+            if self.disk_bytes is None:
+                self.disk_bytes = sum(size for _, size, _ in self.list_disk_entries())
+            else:
+                self.disk_bytes += written
+            if self.disk_bytes > DISK_CACHE_MAX_BYTES:
+                self.trim_disk_cache()
+
+    def list_disk_entries(self):
+        entries = []
+        try:
+            for path in self.cache_dir.glob("*.png"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            pass
+        return entries
+
+    def trim_disk_cache(self):
+        entries = sorted(self.list_disk_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= DISK_CACHE_TRIM_BYTES:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self.disk_bytes = total
+
+    def warm(self, entries, max_size):
+        # entries: (ruta, clave de contenido o None). Genera en segundo plano las
+        # miniaturas que falten para que navegar la lista no decodifique originales
+        side = pick_side(max_size)
+        if side is None or not entries:
+            return
+        with self.lock:
+            for source_path, content_key in entries:
+                task = (str(source_path), content_key, side)
+                if task not in self.warm_queued:
+                    self.warm_queued.add(task)
+                    self.warm_queue.append(task)
+            if self.warm_thread is not None and self.warm_thread.is_alive():
+                return
+            self.warm_thread = threading.Thread(target=self.run_warm, daemon=True)
+            self.warm_thread.start()
+
+    def run_warm(self):
+        while True:
+            with self.lock:
+                if not self.warm_queue:
+                    # Se decide bajo el mismo lock que warm(): nada queda sin hilo
+                    self.warm_thread = None
+                    return
+                task = self.warm_queue.popleft()
+                self.warm_queued.discard(task)
+            source_path, content_key, side = task
+            path = self.cache_path(Path(source_path), side, content_key)
+            if path is None or path.exists():
+                continue
+            image = self.decode(Path(source_path), side)
+            if image is not None:
+                self.write(path, image)
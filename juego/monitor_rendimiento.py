@@ -0,0 +1,244 @@
+import json
+import math
+import os
+import time
+import tkinter as tk
+from collections import deque
+from functools import wraps
+
+from juego.rutas_app import get_data_root
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "p99": round(percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+class PerformanceMonitor:
+
+    ENV_VAR = "TRIVIA_PERF_MONITOR"
+    HEARTBEAT_MS = 50
+    OVERLAY_REFRESH_MS = 500
+    MAX_LAG_SAMPLES = 600
+    MAX_CALLBACK_SAMPLES = 200
+
+    instance = None
+
+    def __init__(self, root):
+        self.root = root
+        self.active = False
+        self.lag_samples = deque(maxlen=self.MAX_LAG_SAMPLES)
+        self.callback_samples = {}
+        self.heartbeat_job = None
+        self.heartbeat_expected = None
+        self.overlay_job = None
+        self.overlay_label = None
+        self.overlay_visible = False
+
+    @classmethod
+    def install(cls, root, force=False):
+        # Solo se activa si se pide por variable de entorno (o explícitamente)
+        if not force and os.environ.get(cls.ENV_VAR, "").lower() not in (
+            "1",
+            "true",
+            "yes",
+        ):
+            return None
+        monitor = cls(root)
+        cls.instance = monitor
+        root.bind_all("<F12>", monitor.on_toggle_key, add="+")
+        root.bind_all("<Control-F12>", monitor.on_export_key, add="+")
+        monitor.start()
+        return monitor
+
+    # =========================================================================
+    # Muestreo
+    # =========================================================================
+
+    def start(self):
+        if self.active:
+            return
+        self.active = True
+        self.schedule_heartbeat()
+
+    def stop(self):
+        self.active = False
+        for attr in ("heartbeat_job", "overlay_job"):
+            job = getattr(self, attr)
+            if job:
+                try:
+                    self.root.after_cancel(job)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
+
+    def schedule_heartbeat(self):
+        self.heartbeat_expected = time.perf_counter() + self.HEARTBEAT_MS / 1000
+        try:
+            self.heartbeat_job = self.root.after(self.HEARTBEAT_MS, self.on_heartbeat)
+        except tk.TclError:
+            self.heartbeat_job = None
+
+    def on_heartbeat(self):
+        self.heartbeat_job = None
+        if not self.active:
+            return
+        # Retraso entre el disparo programado y el real del after()
+        lag_ms = (time.perf_counter() - self.heartbeat_expected) * 1000
+        self.lag_samples.append(max(0.0, lag_ms))
+        self.schedule_heartbeat()
+
+    def record(self, name, duration_ms):
+        samples = self.callback_samples.get(name)
+        if samples is None:
+            samples = deque(maxlen=self.MAX_CALLBACK_SAMPLES)
+            self.callback_samples[name] = samples
+        samples.append(duration_ms)
+
+    def snapshot(self):
+        return {
+            "loop_lag_ms": summarize(self.lag_samples),
+            "callbacks_ms": {
+                name: summarize(samples)
+                for name, samples in sorted(self.callback_samples.items())
+            },
+        }
+
+    # =========================================================================
+    # Superposición
+    # =========================================================================
+
+    def on_toggle_key(self, _event=None):
+        self.toggle_overlay()
+
+    def on_export_key(self, _event=None):
+        self.export()
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.start()
+            self.refresh_overlay()
+            return
+        if self.overlay_job:
+            try:
+                self.root.after_cancel(self.overlay_job)
+            except tk.TclError:
+                pass
+            self.overlay_job = None
+        if self.overlay_label:
+            try:
+                self.overlay_label.destroy()
+            except tk.TclError:
+                pass
+            self.overlay_label = None
+
+    def ensure_overlay_label(self):
+        # Las pantallas destruyen los hijos de la raíz al reconstruirse
+        try:
+            if self.overlay_label and self.overlay_label.winfo_exists():
+                return self.overlay_label
+        except tk.TclError:
+            pass
+        self.overlay_label = tk.Label(
+            self.root,
+            font=("Consolas", 10),
+            bg="#202632",
+            fg="#00CFC5",
+            justify="left",
+            anchor="nw",
+            padx=8,
+            pady=6,
+        )
+        self.overlay_label.place(relx=1.0, x=-8, y=8, anchor="ne")
+        return self.overlay_label
+
+    def format_overlay(self):
+        snap = self.snapshot()
+        lag = snap["loop_lag_ms"]
+        lines = [
+            "loop lag (ms)      p50 {p50:6.1f}  p95 {p95:6.1f}  "
+            "p99 {p99:6.1f}  max {max:6.1f}".format(**lag)
+        ]
+        for name, stats in snap["callbacks_ms"].items():
+            lines.append(
+                f"{name[:18]:<18} n={stats['count']:<4} p50 {stats['p50']:6.1f}  "
+                f"p95 {stats['p95']:6.1f}  max {stats['max']:6.1f}"
+            )
+        lines.append("F12 hide  ·  Ctrl+F12 export")
+        return "\n".join(lines)
+
+    def refresh_overlay(self):
+        self.overlay_job = None
+        if not self.overlay_visible:
+            return
+        try:
+            label = self.ensure_overlay_label()
+            label.configure(text=self.format_overlay())
+            label.lift()
+            self.overlay_job = self.root.after(
+                self.OVERLAY_REFRESH_MS, self.refresh_overlay
+            )
+        except tk.TclError:
+            self.overlay_label = None
+
+    # =========================================================================
+    # Exportación
+    # =========================================================================
+
+    def export(self, path=None):
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = get_data_root() / "rendimiento" / f"perf-{stamp}.json"
+        payload = {
+            "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "heartbeat_ms": self.HEARTBEAT_MS,
+            "summary": self.snapshot(),
+            "samples": {
+                "loop_lag_ms": [round(v, 3) for v in self.lag_samples],
+                "callbacks_ms": {
+                    name: [round(v, 3) for v in samples]
+                    for name, samples in self.callback_samples.items()
+                },
+            },
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(payload, file, indent=2)
+        except OSError as error:
+            print(f"Error exporting performance data to '{path}': {error}")
+            return None
+        return path
+
+
+def measure(name):
+    # Decorador sin costo cuando el monitor no está activo
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            monitor = PerformanceMonitor.instance
+            if monitor is None or not monitor.active:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                monitor.record(name, (time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    return decorator
@@ -1,10 +1,10 @@
 import tkinter
 
 import customtkinter as ctk
-from PIL import ImageTk
-from tksvg import SvgImage as TkSvgImage
 
 from juego.ayudantes_responsivos import get_dpi_scaling, get_logical_dimensions
+from juego.fuentes import FontPool
+from juego.iconos_svg import SvgIconService
 from juego.rutas_app import get_resource_images_dir
 
 
@@ -34,21 +34,25 @@ class CreditsScreen:
         self.return_button = None
         self.logo_image = None
 
-        self.title_font = ctk.CTkFont(
-            family="Poppins ExtraBold",
-            size=self.BASE_FONT_SIZES["title"],
-            weight="bold",
+        self.font_pool = FontPool.shared()
+        self.title_font = self.font_pool.scalable(
+            "credits",
+            "title",
+            "Poppins ExtraBold",
+            self.BASE_FONT_SIZES["title"],
+            "bold",
         )
 
-        self.body_font = ctk.CTkFont(
-            family="Open Sans Regular", size=self.BASE_FONT_SIZES["body"], weight="bold"
+        self.body_font = self.font_pool.scalable(
+            "credits", "body", "Open Sans Regular", self.BASE_FONT_SIZES["body"], "bold"
         )
 
-        self.button_font = ctk.CTkFont(
-            family="Poppins SemiBold", size=self.BASE_FONT_SIZES["button"]
+        self.button_font = self.font_pool.scalable(
+            "credits", "button", "Poppins SemiBold", self.BASE_FONT_SIZES["button"]
         )
 
         self.logo_svg_path = get_resource_images_dir() / "Hat.svg"
+        self.icon_service = SvgIconService.shared()
         self.resize_job = None
 
         self.build_ui()
@@ -83,7 +87,9 @@ class CreditsScreen:
         logo_container.grid(row=0, column=0, sticky="n", pady=(20, 10))
         logo_container.grid_columnconfigure(0, weight=1)
 
-        img = self.load_svg_image(self.logo_svg_path, scale=self.SVG_RASTER_SCALE)
+        img = self.icon_service.load_svg_image(
+            self.logo_svg_path, scale=self.SVG_RASTER_SCALE
+        )
         if img:
             self.logo_image = ctk.CTkImage(
                 light_image=img,
@@ -98,7 +104,7 @@ class CreditsScreen:
             self.logo_label = ctk.CTkLabel(
                 logo_container,
                 text="(logo)",
-                font=ctk.CTkFont(size=18),
+                font=self.font_pool.get(None, 18),
                 text_color="red",
             )
             self.logo_label.grid(row=0, column=0)
@@ -201,12 +207,14 @@ class CreditsScreen:
         scale = min(w / self.BASE_DIMENSIONS[0], h / self.BASE_DIMENSIONS[1])
         scale = max(self.SCALE_LIMITS[0], min(self.SCALE_LIMITS[1], scale))
 
-        self.title_font.configure(
-            size=int(max(16, self.BASE_FONT_SIZES["title"] * scale))
+        self.font_pool.set_size(
+            self.title_font, int(max(16, self.BASE_FONT_SIZES["title"] * scale))
+        )
+        self.font_pool.set_size(
+            self.body_font, int(max(9, self.BASE_FONT_SIZES["body"] * scale))
         )
-        self.body_font.configure(size=int(max(9, self.BASE_FONT_SIZES["body"] * scale)))
-        self.button_font.configure(
-            size=int(max(12, self.BASE_FONT_SIZES["button"] * scale))
+        self.font_pool.set_size(
+            self.button_font, int(max(12, self.BASE_FONT_SIZES["button"] * scale))
         )
 
         if self.logo_image:
@@ -257,15 +265,6 @@ class CreditsScreen:
 
         self.resize_job = None
 
-    def load_svg_image(self, svg_path, scale=1.0):
-        try:
-            svg_photo = TkSvgImage(file=str(svg_path), scale=scale)
-            pil = ImageTk.getimage(svg_photo).convert("RGBA")
-            return pil
-        except (FileNotFoundError, ValueError) as e:
-            print(f"Error loading SVG image '{svg_path}': {e}")
-            return None
-
     def cleanup(self):
         try:
             self.parent.unbind("<Configure>")
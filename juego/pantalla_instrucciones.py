@@ -2,10 +2,10 @@
 from tkinter import TclError
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
-from tksvg import SvgImage as TkSvgImage
 
 from juego.ayudantes_responsivos import get_dpi_scaling, get_logical_dimensions
+from juego.fuentes import FontPool
+from juego.iconos_svg import SvgIconService
 from juego.rutas_app import get_resource_images_dir
 
 
@@ -191,28 +191,37 @@ class InstructionsScreen:
 
         self.images_dir = get_resource_images_dir()
         self.logo_svg_path = self.images_dir / "Hat.svg"
-
-        self.title_font = ctk.CTkFont(
-            family="Poppins ExtraBold",
-            size=self.BASE_FONT_SIZES["title"],
-            weight="bold",
+        self.icon_service = SvgIconService.shared()
+
+        self.font_pool = FontPool.shared()
+        self.title_font = self.font_pool.scalable(
+            "instructions",
+            "title",
+            "Poppins ExtraBold",
+            self.BASE_FONT_SIZES["title"],
+            "bold",
         )
-        self.section_title_font = ctk.CTkFont(
-            family="Poppins SemiBold", size=self.BASE_FONT_SIZES["section_title"]
+        self.section_title_font = self.font_pool.scalable(
+            "instructions",
+            "section_title",
+            "Poppins SemiBold",
+            self.BASE_FONT_SIZES["section_title"],
         )
-        self.body_font = ctk.CTkFont(
-            family="Open Sans Regular", size=self.BASE_FONT_SIZES["body"]
+        self.body_font = self.font_pool.scalable(
+            "instructions", "body", "Open Sans Regular", self.BASE_FONT_SIZES["body"]
         )
-        self.button_font = ctk.CTkFont(
-            family="Poppins SemiBold", size=self.BASE_FONT_SIZES["button"]
+        self.button_font = self.font_pool.scalable(
+            "instructions", "button", "Poppins SemiBold", self.BASE_FONT_SIZES["button"]
         )
-        self.toggle_font = ctk.CTkFont(
-            family="Poppins SemiBold",
-            size=self.BASE_FONT_SIZES["toggle"],
-            weight="bold",
+        self.toggle_font = self.font_pool.scalable(
+            "instructions",
+            "toggle",
+            "Poppins SemiBold",
+            self.BASE_FONT_SIZES["toggle"],
+            "bold",
         )
-        self.icon_font = ctk.CTkFont(
-            family="Poppins Bold", size=self.BASE_FONT_SIZES["icon"], weight="bold"
+        self.icon_font = self.font_pool.scalable(
+            "instructions", "icon", "Poppins Bold", self.BASE_FONT_SIZES["icon"], "bold"
         )
 
         self.build_ui()
@@ -255,7 +264,9 @@ class InstructionsScreen:
         logo_frame = ctk.CTkFrame(self.header_frame, fg_color="transparent")
         logo_frame.grid(row=0, column=0, sticky="w")
 
-        img = self.load_svg_image(self.logo_svg_path, scale=self.SVG_RASTER_SCALE)
+        img = self.icon_service.load_svg_image(
+            self.logo_svg_path, scale=self.SVG_RASTER_SCALE
+        )
         if img:
             self.logo_image = ctk.CTkImage(
                 light_image=img,
@@ -267,7 +278,7 @@ class InstructionsScreen:
             self.logo_label = ctk.CTkLabel(
                 logo_frame,
                 text="Logo",
-                font=ctk.CTkFont(size=16),
+                font=self.font_pool.get(None, 16),
                 text_color="red",
             )
         self.logo_label.grid(row=0, column=0, sticky="w")
@@ -354,8 +365,8 @@ class InstructionsScreen:
             icon_image = None
             svg_path = self.images_dir / config["icon"]
             tint_color = self.ICON_TINT_COLOR if config["icon"] == "star.svg" else None
-            svg_image = self.load_svg_image(
-                svg_path, scale=self.SVG_RASTER_SCALE, tint_color=tint_color
+            svg_image = self.icon_service.load_svg_image(
+                svg_path, scale=self.SVG_RASTER_SCALE, tint=tint_color
             )
             if svg_image:
                 icon_image = ctk.CTkImage(
@@ -482,21 +493,24 @@ class InstructionsScreen:
         scale = min(width / self.BASE_DIMENSIONS[0], height / self.BASE_DIMENSIONS[1])
         scale = max(self.SCALE_LIMITS[0], min(self.SCALE_LIMITS[1], scale))
 
-        self.title_font.configure(
-            size=int(max(18, self.BASE_FONT_SIZES["title"] * scale))
+        self.font_pool.set_size(
+            self.title_font, int(max(18, self.BASE_FONT_SIZES["title"] * scale))
+        )
+        self.font_pool.set_size(
+            self.section_title_font,
+            int(max(10, self.BASE_FONT_SIZES["section_title"] * scale)),
         )
-        self.section_title_font.configure(
-            size=int(max(10, self.BASE_FONT_SIZES["section_title"] * scale))
+        self.font_pool.set_size(
+            self.body_font, int(max(6, self.BASE_FONT_SIZES["body"] * scale))
         )
-        self.body_font.configure(size=int(max(6, self.BASE_FONT_SIZES["body"] * scale)))
-        self.button_font.configure(
-            size=int(max(12, self.BASE_FONT_SIZES["button"] * scale))
+        self.font_pool.set_size(
+            self.button_font, int(max(12, self.BASE_FONT_SIZES["button"] * scale))
         )
-        self.toggle_font.configure(
-            size=int(max(9, self.BASE_FONT_SIZES["toggle"] * scale))
+        self.font_pool.set_size(
+            self.toggle_font, int(max(9, self.BASE_FONT_SIZES["toggle"] * scale))
         )
-        self.icon_font.configure(
-            size=int(max(10, self.BASE_FONT_SIZES["icon"] * scale))
+        self.font_pool.set_size(
+            self.icon_font, int(max(10, self.BASE_FONT_SIZES["icon"] * scale))
         )
 
         if self.logo_image:
@@ -616,27 +630,3 @@ class InstructionsScreen:
         self.cleanup()
         if self.on_return_callback:
             self.on_return_callback()
-
-    def tint_image(self, pil_image, hex_color):
-        if not hex_color:
-            return pil_image
-        try:
-            hex_color = hex_color.lstrip("#")
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-        except (AttributeError, ValueError, IndexError):
-            return pil_image
-        alpha = pil_image.split()[-1]
-        tinted = Image.new("RGBA", pil_image.size, (r, g, b, 0))
-        tinted.putalpha(alpha)
-        return tinted
-
-    def load_svg_image(self, svg_path, scale=1.0, tint_color=None):
-        try:
-            svg_photo = TkSvgImage(file=str(svg_path), scale=scale)
-            pil_image = ImageTk.getimage(svg_photo).convert("RGBA")
-            return self.tint_image(pil_image, tint_color)
-        except (FileNotFoundError, ValueError) as error:
-            print(f"Error loading SVG image '{svg_path}': {error}")
-            return None
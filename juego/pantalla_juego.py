@@ -1,7 +1,6 @@
 import tkinter as tk
 
-import customtkinter as ctk
-
+from juego.monitor_rendimiento import measure
 from juego.pantalla_juego_config import GAME_PROFILES, GAME_RESIZE_DELAY
 from juego.pantalla_juego_logica import GameScreenLogic
 
@@ -14,8 +13,6 @@ class GameScreen(GameScreenLogic):
         # Pre-inicializar atributos para satisfacer al linter
         self.resize_job = None
         self.key_feedback_job = None
-        self.feedback_animation_job = None
-        self.definition_scroll_update_job = None
         self.keypress_bind_id = None
         self.keyrelease_bind_id = None
         self.ultimo_tam_imagen = 0
@@ -44,6 +41,7 @@ class GameScreen(GameScreenLogic):
             self.parent.after_cancel(self.resize_job)
         self.resize_job = self.parent.after(GAME_RESIZE_DELAY, self.apply_responsive)
 
+    @measure("game.apply_responsive")
     def apply_responsive(self):
         if not self.parent or not self.parent.winfo_exists():
             return
@@ -381,7 +379,7 @@ class GameScreen(GameScreenLogic):
             sz = sizes["info_icon"]
             self.info_icon.configure(size=(sz, sz))
 
-        self.queue_definition_scroll_update()
+        self.update_definition_scrollbar_visibility()
 
     def update_answer_boxes(self):
         # Llamar al método padre para actualizar el texto de las casillas
@@ -394,21 +392,18 @@ class GameScreen(GameScreenLogic):
         gap = sizes["answer_box_gap"]
         extra_pad = self.scale_value(16, scale, 8, 20)
 
-        # Actualizar etiquetas de casillas de respuesta
-        # Usar grid_configure en un widget con grid_remove() lo volvería a mostrar!
-        visible_boxes = [b for b in self.answer_box_labels if b.winfo_manager()]
-        for box in visible_boxes:
-            if box and box.winfo_exists():
-                box.configure(width=box_sz, height=box_sz)
-                box.grid_configure(padx=gap, pady=4)
+        # Redistribuir las casillas dentro del lienzo
+        word_length = self.answer_row.word_length if self.answer_row else 0
+        if word_length:
+            self.answer_row.set_layout(word_length, box_sz, gap)
 
         # Actualizar tamaño del frame si hay casillas visibles (altura extra para evitar recorte)
         if (
-            visible_boxes
+            word_length
             and self.answer_boxes_frame
             and self.answer_boxes_frame.winfo_exists()
         ):
-            frame_width = len(visible_boxes) * (box_sz + gap * 2)
+            frame_width = word_length * (box_sz + gap * 2)
             frame_height = box_sz + extra_pad
             self.answer_boxes_frame.configure(width=frame_width, height=frame_height)
             # Actualizar relleno del frame de casillas - reducir en baja res, expandir en alta res
@@ -449,7 +444,7 @@ class GameScreen(GameScreenLogic):
             base_size = self.font_base_sizes.get("keyboard", 18)
             min_size = self.font_min_sizes.get("keyboard", 10)
             new_size = max(min_size, int(round(base_size * scale * keyboard_scale)))
-            self.keyboard_font.configure(size=new_size)
+            self.font_registry.set_size("keyboard", new_size)
             delete_icon_sz = max(8, int(round(sizes["delete_icon"] * keyboard_scale)))
         else:
             delete_icon_sz = sizes["delete_icon"]
@@ -460,23 +455,21 @@ class GameScreen(GameScreenLogic):
                 padx=keyboard_pad, pady=(0, keyboard_pad_y)
             )
 
-        # Actualizar espaciado de filas del teclado
-        for row_frame in self.keyboard_frame.winfo_children():
-            if row_frame and row_frame.winfo_exists():
-                row_frame.grid_configure(pady=key_row_gap)
-
-        # Actualizar todos los botones del teclado
-        for btn in self.keyboard_buttons:
-            if btn and btn.winfo_exists():
-                is_delete = btn is self.delete_button
-                width = delete_width if is_delete else int(key_sz * key_width_ratio)
-                btn.configure(width=width, height=key_sz)
-                btn.grid_configure(padx=key_gap // 2)
-
         # Actualizar tamaño del icono de borrar
         if self.delete_icon:
             self.delete_icon.configure(size=(delete_icon_sz, delete_icon_sz))
 
+        # Un solo redibujado del lienzo en lugar de reconfigurar cada tecla
+        if self.keyboard and self.keyboard.winfo_exists():
+            self.keyboard.set_metrics(
+                key_size=key_sz,
+                key_width=int(key_sz * key_width_ratio),
+                delete_width=delete_width,
+                key_gap=key_gap,
+                row_gap=key_row_gap,
+                icon_size=delete_icon_sz,
+            )
+
     def update_action_buttons(self, scale):
         sizes = self.size_state
         btn_width = sizes["action_button_width"]
@@ -560,9 +553,7 @@ class GameScreen(GameScreenLogic):
 
         # Actualizar fuentes de botones de comodines
         try:
-            wc_font = ctk.CTkFont(
-                family="Poppins ExtraBold", size=wc_font_size, weight="bold"
-            )
+            wc_font = self.font_pool.get("Poppins ExtraBold", wc_font_size, "bold")
             for btn in [self.wildcard_x2_btn, self.wildcard_hint_btn]:
                 if btn and btn.winfo_exists():
                     btn.configure(font=wc_font)
@@ -572,8 +563,8 @@ class GameScreen(GameScreenLogic):
         # Actualizar fuente de etiqueta de cargas
         if self.charges_label and self.charges_label.winfo_exists():
             try:
-                charges_font = ctk.CTkFont(
-                    family="Poppins SemiBold", size=charges_font_size, weight="bold"
+                charges_font = self.font_pool.get(
+                    "Poppins SemiBold", charges_font_size, "bold"
                 )
                 self.charges_label.configure(font=charges_font)
             except tk.TclError:
@@ -583,8 +574,8 @@ class GameScreen(GameScreenLogic):
         if self.multiplier_label and self.multiplier_label.winfo_exists():
             mul_font_size = self.scale_value(20, scale, 12, 36)
             try:
-                mul_font = ctk.CTkFont(
-                    family="Poppins ExtraBold", size=mul_font_size, weight="bold"
+                mul_font = self.font_pool.get(
+                    "Poppins ExtraBold", mul_font_size, "bold"
                 )
                 self.multiplier_label.configure(font=mul_font)
             except tk.TclError:
@@ -593,13 +584,8 @@ class GameScreen(GameScreenLogic):
     def resize_modals(self, scale):
         for modal_attr in ["completion_modal", "summary_modal", "skip_modal"]:
             modal = getattr(self, modal_attr, None)
-            if modal and hasattr(modal, "modal") and modal.modal:
-                try:
-                    if modal.modal.winfo_exists():
-                        if hasattr(modal, "resize"):
-                            modal.resize(scale)
-                except tk.TclError:
-                    pass
+            if modal and modal.is_open():
+                modal.resize(scale)
 
     def return_to_menu(self):
         self.cleanup()
@@ -610,12 +596,12 @@ class GameScreen(GameScreenLogic):
         self.stop_timer()
         self.tts.stop()
 
-        if self.feedback_animation_job:
-            try:
-                self.parent.after_cancel(self.feedback_animation_job)
-            except (tk.TclError, ValueError):
-                pass
-            self.feedback_animation_job = None
+        if self.animation_engine:
+            self.animation_engine.cancel(self)
+
+        if self.session_recorder:
+            self.session_recorder.close()
+            self.session_recorder = None
 
         if self.key_feedback_job:
             try:
@@ -632,21 +618,6 @@ class GameScreen(GameScreenLogic):
                 pass
             self.resize_job = None
 
-        # Cancelar trabajo de actualización de scroll de definición
-        if self.definition_scroll_update_job:
-            try:
-                self.parent.after_cancel(self.definition_scroll_update_job)
-            except (tk.TclError, ValueError):
-                pass
-            self.definition_scroll_update_job = None
-
-        if self.definition_scroll_delayed_job:
-            try:
-                self.parent.after_cancel(self.definition_scroll_delayed_job)
-            except (tk.TclError, ValueError):
-                pass
-            self.definition_scroll_delayed_job = None
-
         self.close_all_modals()
 
         try:
@@ -693,13 +664,13 @@ class GameScreen(GameScreenLogic):
             return
 
         if key_char.isalpha() and len(key_char) == 1:
-            self.play_click_if_button_ready(self.key_button_map.get(key_char))
+            self.play_click_if_key_ready(key_char)
             self.show_key_feedback(key_char)
             self.on_key_press(key_char)
             return
 
         if key_sym == "BackSpace":
-            self.play_click_if_button_ready(self.delete_button)
+            self.play_click_if_key_ready("⌫")
             self.show_key_feedback("⌫")
             self.on_key_press("⌫")
             return
@@ -720,6 +691,13 @@ class GameScreen(GameScreenLogic):
             return
         self.sfx.play("click", stop_previous=True, volume=0.8)
 
+    def play_click_if_key_ready(self, key):
+        if not self.sfx or not self.keyboard:
+            return
+        if not self.keyboard.enabled or not self.keyboard.has_key(key):
+            return
+        self.sfx.play("click", stop_previous=True, volume=0.8)
+
     def on_physical_key_release(self, event):
         key_char = event.char.upper() if event.char else ""
         key_sym = event.keysym
@@ -733,20 +711,12 @@ class GameScreen(GameScreenLogic):
             return
 
     def show_key_feedback(self, key):
-        if key in self.key_button_map:
-            btn = self.key_button_map[key]
-            if key == "⌫":
-                btn.configure(fg_color=self.COLORS["danger_hover"])
-            else:
-                btn.configure(fg_color=self.COLORS["key_pressed"])
+        if self.keyboard:
+            self.keyboard.set_pressed(key, True)
 
     def reset_key_feedback(self, key):
-        if key in self.key_button_map:
-            btn = self.key_button_map[key]
-            if key == "⌫":
-                btn.configure(fg_color=self.COLORS["danger_red"])
-            else:
-                btn.configure(fg_color=self.COLORS["key_bg"])
+        if self.keyboard:
+            self.keyboard.set_pressed(key, False)
 
     def simulate_button_press(self, button):
         if button is None:
@@ -769,22 +739,18 @@ class GameScreen(GameScreenLogic):
     def is_modal_open(self):
         for modal_attr in ["completion_modal", "summary_modal", "skip_modal"]:
             modal = getattr(self, modal_attr, None)
-            if modal and hasattr(modal, "modal") and modal.modal:
-                try:
-                    if modal.modal.winfo_exists():
-                        return True
-                except tk.TclError:
-                    pass
-                # Limpiar referencia obsoleta si el modal ya no existe
-                setattr(self, modal_attr, None)
+            # Los modales ocultos siguen existiendo para reutilizarse
+            if modal and modal.is_open():
+                return True
         return False
 
     def close_all_modals(self):
         for modal_attr in ["completion_modal", "summary_modal", "skip_modal"]:
             modal = getattr(self, modal_attr, None)
             if modal:
+                # Fin de la partida: destruir también los modales reutilizables
                 try:
-                    modal.close()
+                    modal.destroy()
                 except (tk.TclError, AttributeError):
                     pass
                 setattr(self, modal_attr, None)
@@ -1,12 +1,12 @@
-import tkinter as tk
-
 import customtkinter as ctk
 
+from juego.animaciones import AnimationEngine
 from juego.ayudantes_responsivos import ResponsiveScaler, get_logical_dimensions
-from juego.comodines import WildcardManager
 from juego.datos_preguntas import load_questions_file
-from juego.logica import ScoringSystem
+from juego.fuentes import FontPool, FontRegistry
 from juego.manejador_imagenes import ImageHandler
+from juego.medicion_texto import TextMeasurer
+from juego.mazo import difficulty_weights
 from juego.pantalla_juego_config import (
     GAME_BASE_DIMENSIONS,
     GAME_BASE_SIZES,
@@ -18,11 +18,14 @@ from juego.pantalla_juego_config import (
     GAME_RESIZE_DELAY,
     GAME_SCALE_LIMITS,
     KEYBOARD_LAYOUT,
-    GameFontRegistry,
+    QUESTION_DECK,
+    SESSION_LOG,
     GameSizeCalculator,
 )
 from juego.pantalla_juego_constructor_ui import GameUIBuilderMixin
 from juego.pantalla_juego_iconos import GameIconsMixin
+from juego.registro_sesion import SessionRecorder
+from juego.resultados import ResultsStore
 from juego.rutas_app import (
     get_data_questions_path,
     get_data_root,
@@ -32,6 +35,8 @@ from juego.rutas_app import (
     get_user_images_dir,
 )
 from juego.servicio_tts import TTSService
+from juego.sesion_juego import GameSession
+from juego.temporizador import GameTimer
 
 
 class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
@@ -48,9 +53,6 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
     # Escala de renderizado SVG
     SVG_RASTER_SCALE = 2.0
 
-    # Número máximo de preguntas a mantener en el historial
-    MAX_QUESTION_HISTORY = 50
-
     def __init__(
         self, parent, on_return_callback=None, tts_service=None, sfx_service=None
     ):
@@ -60,27 +62,17 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
 
         # Pre-inicializar todos los atributos para satisfacer al linter
         # Atributos de estado del juego
+        self.session = None
+        self.session_recorder = None
         self.current_question = None
-        self.questions = []
-        self.available_questions = []
-        self.score = 0
         self.current_answer = ""
         self.timer_seconds = 0
         self.audio_enabled = True
         self.timer_running = False
-        self.timer_job = None
-        self.timer_generation = 0
-        self.questions_answered = 0
-        self.game_completed = False
-        self.scoring_system = None
-        self.wildcard_manager = None
+        self.question_clock = None
         self.question_timer = 0
-        self.question_mistakes = 0
         self.resize_job = None
-        self.processing_correct_answer = False
         self.awaiting_modal_decision = False
-        self.stored_modal_data = None
-        self.question_history = []
         self.viewing_history_index = -1
         self.physical_key_pressed = None
         self.key_feedback_job = None
@@ -120,14 +112,10 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         self.definition_label = None
         self.definition_scrollbar_visible = None
         self.definition_scrollbar_manager = None
-        self.definition_scroll_update_job = None
-        self.definition_scroll_delayed_job = None
         self.answer_boxes_frame = None
-        self.answer_box_labels = []
+        self.answer_row = None
         self.keyboard_frame = None
-        self.keyboard_buttons = []
-        self.delete_button = None
-        self.key_button_map = {}
+        self.keyboard = None
         self.action_buttons_frame = None
         self.skip_button = None
         self.check_button = None
@@ -150,7 +138,7 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         self.charges_frame = None
         self.charges_label = None
         self.feedback_label = None
-        self.feedback_animation_job = None
+        self.animation_engine = None
         self.completion_modal = None
         self.summary_modal = None
         self.skip_modal = None
@@ -180,35 +168,25 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         self.build_ui()
 
     def init_game_state(self):
+        # La sesión (puntaje, comodines, mazo e historial) se crea al cargar preguntas
+        self.session = None
+        self.session_recorder = None
         self.current_question = None
-        self.questions = []
-        self.available_questions = []
-        self.score = 0
         self.current_answer = ""
         self.timer_seconds = 0
         self.audio_enabled = True
         if self.sfx and hasattr(self.sfx, "is_muted"):
             self.audio_enabled = not self.sfx.is_muted()
         self.timer_running = False
-        self.timer_job = None
-        self.timer_generation = (
-            0  # Contador para invalidar callbacks de temporizador obsoletos
-        )
-        self.questions_answered = 0
-        self.game_completed = False
-        self.scoring_system = None
-        self.wildcard_manager = WildcardManager()
+        # Reloj monotónico por pregunta (los segmentos se cierran al congelar)
+        self.question_clock = GameTimer(self.parent, self.on_timer_tick)
         self.question_timer = 0
-        self.question_mistakes = 0
 
         # Manejo de redimensionamiento
         self.resize_job = None
 
-        # Estado del flujo del juego
-        self.processing_correct_answer = False
+        # Estado de presentación (qué se muestra y si se espera al modal)
         self.awaiting_modal_decision = False
-        self.stored_modal_data = None
-        self.question_history = []
         self.viewing_history_index = -1
 
         # Manejo del teclado físico
@@ -256,13 +234,11 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         self.definition_scrollbar_visible = None
         self.definition_scrollbar_manager = None
         self.answer_boxes_frame = None
-        self.answer_box_labels = []
+        self.answer_row = None
 
         # Componentes del teclado
         self.keyboard_frame = None
-        self.keyboard_buttons = []
-        self.delete_button = None
-        self.key_button_map = {}
+        self.keyboard = None
 
         # Botones de acción
         self.action_buttons_frame = None
@@ -295,7 +271,6 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
 
         # Componentes de retroalimentación
         self.feedback_label = None
-        self.feedback_animation_job = None
 
         # Referencias de modales
         self.completion_modal = None
@@ -337,6 +312,9 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         # Servicio TTS
         self.tts = tts_service or TTSService(self.audio_dir)
 
+        # Reloj de animación compartido
+        self.animation_engine = AnimationEngine.for_widget(self.parent)
+
     def init_responsive_system(self):
         # Crear escalador
         self.scaler = ResponsiveScaler(
@@ -349,7 +327,9 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         self.size_calc = GameSizeCalculator(self.scaler, GAME_PROFILES)
 
         # Crear registro de fuentes y adjuntar fuentes como atributos
-        self.font_registry = GameFontRegistry(GAME_FONT_SPECS)
+        self.font_pool = FontPool.shared()
+        self.text_measurer = TextMeasurer.shared()
+        self.font_registry = FontRegistry(GAME_FONT_SPECS, "game")
         self.font_registry.attach_attributes(self)
 
         # Almacenar tamaños base y mínimos para escalado de fuentes
@@ -409,10 +389,48 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         )
 
     def load_questions(self):
-        self.questions = load_questions_file(self.questions_path)
-        self.available_questions = list(self.questions)
-        self.scoring_system = ScoringSystem(len(self.questions) or 1)
-        self.wildcard_manager.reset_game()
+        questions = load_questions_file(self.questions_path)
+        results = ResultsStore.shared()
+        mode = QUESTION_DECK["mode"]
+        weights = None
+        if mode == "weighted":
+            weights = difficulty_weights(questions, results.question_difficulty())
+        self.session = GameSession(questions, deck=mode, weights=weights)
+        # Los resultados se guardan en segundo plano al completar la partida
+        results.track(self.session)
+        if SESSION_LOG["enabled"]:
+            self.session_recorder = SessionRecorder.start(
+                self.session, max_files=SESSION_LOG["max_files"]
+            )
+
+    # Accesos de solo lectura al estado que pertenece a la sesión
+    @property
+    def questions(self):
+        return self.session.questions if self.session else []
+
+    @property
+    def scoring_system(self):
+        return self.session.scoring if self.session else None
+
+    @property
+    def wildcard_manager(self):
+        return self.session.wildcards if self.session else None
+
+    @property
+    def score(self):
+        return self.session.score if self.session else 0
+
+    @property
+    def question_history(self):
+        return self.session.history if self.session else []
+
+    @property
+    def stored_modal_data(self):
+        return self.session.pending_result if self.session else None
+
+    @property
+    def game_completed(self):
+        return bool(self.session and self.session.completed)
 
     # =========================================================================
     # Manejo de Barra de Desplazamiento de Definición
@@ -421,50 +439,11 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
     def set_definition_text(self, text):
         if self.definition_label and self.definition_label.winfo_exists():
             self.definition_label.configure(text=text)
-        self.queue_definition_scroll_update()
-
-    def queue_definition_scroll_update(self):
-        if not self.parent or not self.parent.winfo_exists():
-            return
-        if self.definition_scroll_update_job:
-            try:
-                self.parent.after_cancel(self.definition_scroll_update_job)
-            except tk.TclError:
-                pass
-            self.definition_scroll_update_job = None
-        if self.definition_scroll_delayed_job:
-            try:
-                self.parent.after_cancel(self.definition_scroll_delayed_job)
-            except tk.TclError:
-                pass
-            self.definition_scroll_delayed_job = None
-        try:
-            self.definition_scroll_update_job = self.parent.after_idle(
-                self.on_scroll_idle_check
-            )
-        except tk.TclError:
-            self.definition_scroll_update_job = None
-            self.update_definition_scrollbar_visibility()
-
-    def on_scroll_idle_check(self):
-        self.definition_scroll_update_job = None
-        self.update_definition_scrollbar_visibility()
-        # Programar un segundo chequeo diferido: las etiquetas con wraplength
-        # a menudo no reportan su altura final en after_idle.
-        if self.parent and self.parent.winfo_exists():
-            try:
-                self.definition_scroll_delayed_job = self.parent.after(
-                    150, self.on_scroll_delayed_check
-                )
-            except tk.TclError:
-                pass
-
-    def on_scroll_delayed_check(self):
-        self.definition_scroll_delayed_job = None
         self.update_definition_scrollbar_visibility()
 
     def update_definition_scrollbar_visibility(self):
-        self.definition_scroll_update_job = None
+        # Se decide en el momento con las métricas de la fuente: el alto del
+        # contenedor y el wraplength son valores que fija la propia pantalla
         if not self.definition_scroll or not self.definition_scroll.winfo_exists():
             return
         if (
@@ -472,29 +451,17 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
             or not self.definition_scroll_wrapper.winfo_exists()
         ):
             return
-
-        content = None
-        if self.def_inner and self.def_inner.winfo_exists():
-            content = self.def_inner
-        elif self.definition_label and self.definition_label.winfo_exists():
-            content = self.definition_label
-        if not content:
-            return
-
-        try:
-            content.update_idletasks()
-            self.definition_scroll_wrapper.update_idletasks()
-        except tk.TclError:
+        if not self.definition_label or not self.definition_label.winfo_exists():
             return
 
-        wrapper_height = self.definition_scroll_wrapper.winfo_height()
-        if wrapper_height <= 1:
-            wrapper_height = self.definition_scroll_wrapper.winfo_reqheight()
-        content_height = content.winfo_reqheight()
-
-        # Usar tolerancia mínima para detectar corte de texto con mayor fiabilidad
-        needs_scroll = content_height > wrapper_height
-        self.set_definition_scrollbar_visible(needs_scroll)
+        content_height = self.text_measurer.label_height(
+            self.definition_label, self.definition_font
+        )
+        if self.info_icon:
+            # El icono lleva 2px de margen superior
+            content_height = max(content_height, self.info_icon.cget("size")[1] + 2)
+        wrapper_height = self.definition_scroll_wrapper.cget("height")
+        self.set_definition_scrollbar_visible(content_height > wrapper_height)
 
     def set_definition_scrollbar_visible(self, visible):
         if self.definition_scrollbar_visible is visible:
@@ -551,61 +518,11 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
         is_compact = self.size_state.get("is_height_constrained", False)
         extra_pad = self.scale_value(16, scale, 8, 20)
 
-        # Crear nuevas cajas si es necesario
-        for i in range(len(self.answer_box_labels), word_length):
-            box = ctk.CTkLabel(
-                self.answer_boxes_frame,
-                text="",
-                font=self.answer_box_font,
-                width=box_sz,
-                height=box_sz,
-                fg_color=self.COLORS["answer_box_empty"],
-                corner_radius=8,
-                text_color=self.COLORS["text_dark"],
-            )
-            self.answer_box_labels.append(box)
+        if not self.answer_row:
+            return
 
-        revealed = self.wildcard_manager.get_revealed_positions()
-
-        # Configurar cajas visibles
-        for i in range(word_length):
-            box = self.answer_box_labels[i]
-            has_char = i < len(self.current_answer) and self.current_answer[i].strip()
-            if has_char:
-                fg = (
-                    self.COLORS["success_green"]
-                    if i in revealed
-                    else self.COLORS["answer_box_filled"]
-                )
-                box.configure(
-                    text=self.current_answer[i],
-                    fg_color=fg,
-                    width=box_sz,
-                    height=box_sz,
-                )
-            else:
-                box.configure(
-                    text="",
-                    fg_color=self.COLORS["answer_box_empty"],
-                    width=box_sz,
-                    height=box_sz,
-                )
-            box.grid(row=0, column=i, padx=gap, pady=4)
-
-        # Ocultar y destruir cajas extras (prevenir crecimiento infinito de memoria)
-        excess_count = len(self.answer_box_labels) - word_length
-        if excess_count > 10:  # Umbral: mantener hasta 10 extras para reutilizar
-            # Destruir las cajas realmente sobrantes más allá del umbral
-            for i in range(word_length + 10, len(self.answer_box_labels)):
-                try:
-                    self.answer_box_labels[i].destroy()
-                except tk.TclError:
-                    pass
-            del self.answer_box_labels[word_length + 10 :]
-
-        # Ocultar cajas extras restantes
-        for i in range(word_length, len(self.answer_box_labels)):
-            self.answer_box_labels[i].grid_remove()
+        self.answer_row.set_layout(word_length, box_sz, gap)
+        self.refresh_answer_cells()
 
         # Actualizar tamaño del marco (relleno extra para evitar recorte en baja resolución)
         self.answer_boxes_frame.configure(
@@ -619,6 +536,23 @@ class GameScreenBase(GameIconsMixin, GameUIBuilderMixin):
                 pad_y = self.scale_value(14, scale, 8, 28)
             self.answer_boxes_frame.grid_configure(pady=(pad_y, pad_y // 2))
 
+    def refresh_answer_cells(self):
+        if not self.answer_row:
+            return
+        revealed = self.wildcard_manager.get_revealed_positions()
+        # El lienzo solo redibuja las celdas cuyo contenido cambió
+        for i in range(self.answer_row.word_length):
+            has_char = i < len(self.current_answer) and self.current_answer[i].strip()
+            if has_char:
+                fg = (
+                    self.COLORS["success_green"]
+                    if i in revealed
+                    else self.COLORS["answer_box_filled"]
+                )
+                self.answer_row.set_cell(i, self.current_answer[i], fg)
+            else:
+                self.answer_row.set_cell(i, "")
+
     # =========================================================================
     # Manejo de Estado de Comodines
     # =========================================================================
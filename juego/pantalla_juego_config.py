@@ -1,5 +1,3 @@
-import customtkinter as ctk
-
 GAME_BASE_DIMENSIONS = (1280, 720)
 GAME_SCALE_LIMITS = (0.50, 2.20)  # Soporta 720p a 4K
 GAME_RESIZE_DELAY = 80
@@ -36,6 +34,7 @@ GAME_COLORS = {
     "key_bg": "#E8ECF2",
     "key_hover": "#D0D6E0",
     "key_pressed": "#B8C0D0",
+    "key_text_disabled": "#9AA3B2",
     # Colores de casillas de respuesta
     "answer_box_empty": "#E2E7F3",
     "answer_box_filled": "#D0D6E0",
@@ -384,6 +383,24 @@ MODAL_ANIMATION = {
     "fade_step_ms": 30,
 }
 
+# Reloj de animación compartido (bajar fps o desactivar en equipos lentos)
+ANIMATION_ENGINE = {
+    "fps": 30,
+    "enabled": True,
+}
+
+# Selección de preguntas: "uniform", "shuffle" o "weighted" (refuerza términos
+# difíciles según el historial de resultados)
+QUESTION_DECK = {
+    "mode": "uniform",
+}
+
+# Registro de eventos por sesión para reproducir partidas (ver registro_sesion)
+SESSION_LOG = {
+    "enabled": True,
+    "max_files": 30,
+}
+
 
 KEYBOARD_LAYOUT = [
     ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
@@ -401,42 +418,6 @@ LEVEL_BADGE_COLORS = {
 }
 
 
-class GameFontRegistry:
-
-    def __init__(self, specs):
-        self.fonts = {}
-        self.base_sizes = {}
-        self.min_sizes = {}
-
-        for name, (family, size, weight, min_size) in specs.items():
-            font = (
-                ctk.CTkFont(family=family, size=size, weight=weight)
-                if weight
-                else ctk.CTkFont(family=family, size=size)
-            )
-            self.fonts[name] = font
-            self.base_sizes[name] = size
-            self.min_sizes[name] = min_size or 10
-
-    def get(self, name):
-        return self.fonts.get(name)
-
-    def items(self):
-        return self.fonts.items()
-
-    def update_scale(self, scale, scaler):
-        for name, font in self.fonts.items():
-            base_size = self.base_sizes.get(name, 14)
-            min_size = self.min_sizes.get(name, 10)
-            max_size = base_size * 2.5
-            new_size = scaler.scale_value(base_size, scale, min_size, max_size)
-            font.configure(size=new_size)
-
-    def attach_attributes(self, target):
-        for name, font in self.fonts.items():
-            setattr(target, f"{name}_font", font)
-
-
 class GameSizeCalculator:
 
     # Umbral de altura por debajo del cual aplicamos tamaño compacto
@@ -1,8 +1,8 @@
-from functools import partial
-
 import customtkinter as ctk
 
+from juego.fila_respuestas import AnswerRowCanvas
 from juego.pantalla_juego_config import KEYBOARD_LAYOUT
+from juego.teclado_virtual import KeyboardCanvas
 
 
 class GameUIBuilderMixin:
@@ -306,6 +306,16 @@ class GameUIBuilderMixin:
         self.answer_boxes_frame.grid_rowconfigure(0, weight=1)
         self.answer_boxes_frame.grid_anchor("center")
 
+        # Un solo lienzo dibuja todas las casillas de la respuesta
+        self.answer_row = AnswerRowCanvas(
+            self.answer_boxes_frame,
+            bg_color=self.COLORS["bg_card"],
+            empty_color=self.COLORS["answer_box_empty"],
+            text_color=self.COLORS["text_dark"],
+            font=self.answer_box_font,
+        )
+        self.answer_row.grid(row=0, column=0)
+
     def build_feedback_section(self):
         self.feedback_label = ctk.CTkLabel(
             self.question_container,
@@ -326,8 +336,8 @@ class GameUIBuilderMixin:
 
         wc_sz = self.BASE_SIZES["wildcard_size"]
         wc_font = self.BASE_SIZES["wildcard_font_size"]
-        font = ctk.CTkFont(family="Poppins ExtraBold", size=wc_font, weight="bold")
-        charges_font = ctk.CTkFont(family="Poppins SemiBold", size=14, weight="bold")
+        font = self.font_pool.get("Poppins ExtraBold", wc_font, "bold")
+        charges_font = self.font_pool.get("Poppins SemiBold", 14, "bold")
 
         # Calcular ancho del botón para acomodar texto como "X16" (multiplicadores acumulados)
         # Usar 1.5x la altura para una forma de píldora que ajuste todo el texto
@@ -416,58 +426,30 @@ class GameUIBuilderMixin:
         )
         self.keyboard_frame.grid_columnconfigure(0, weight=1)
 
-        self.keyboard_buttons.clear()
-        self.key_button_map.clear()
-        self.delete_button = None
         self.load_delete_icon()
 
         key_sz = self.BASE_SIZES["key_base"]
-        key_gap = self.BASE_SIZES["key_gap"]
         key_width_ratio = self.BASE_SIZES.get("key_width_ratio", 1.0)
         delete_ratio = self.BASE_SIZES.get("delete_key_width_ratio", 1.8)
 
-        for row_idx, row_keys in enumerate(KEYBOARD_LAYOUT):
-            row_frame = ctk.CTkFrame(self.keyboard_frame, fg_color="transparent")
-            row_frame.grid(row=row_idx, column=0, pady=4, sticky="ew")
-            row_frame.grid_columnconfigure(0, weight=1)
-            row_frame.grid_columnconfigure(2, weight=1)
-
-            inner = ctk.CTkFrame(row_frame, fg_color="transparent")
-            inner.grid(row=0, column=1)
-
-            for col, key in enumerate(row_keys):
-                is_del = key == "⌫"
-                w = (
-                    int(key_sz * delete_ratio * key_width_ratio)
-                    if is_del
-                    else int(key_sz * key_width_ratio)
-                )
-                fg = self.COLORS["danger_red"] if is_del else self.COLORS["key_bg"]
-                hv = self.COLORS["danger_hover"] if is_del else self.COLORS["key_hover"]
-                tc = "white" if is_del else self.COLORS["text_dark"]
-                img = self.delete_icon if is_del else None
-                txt = "" if img else key
-
-                btn = ctk.CTkButton(
-                    inner,
-                    text=txt,
-                    image=img,
-                    font=self.keyboard_font,
-                    width=w,
-                    height=key_sz,
-                    fg_color=fg,
-                    hover_color=hv,
-                    text_color=tc,
-                    border_width=2,
-                    border_color=self.COLORS["header_bg"],
-                    corner_radius=8,
-                    command=partial(self.on_key_press, key),
-                )
-                btn.grid(row=0, column=col, padx=key_gap // 2)
-                self.keyboard_buttons.append(btn)
-                self.key_button_map[key] = btn
-                if is_del:
-                    self.delete_button = btn
+        # Todas las teclas se dibujan en un solo lienzo
+        self.keyboard = KeyboardCanvas(
+            self.keyboard_frame,
+            layout=KEYBOARD_LAYOUT,
+            command=self.on_key_press,
+            colors=self.COLORS,
+            font=self.keyboard_font,
+            delete_icon=self.delete_icon,
+            sfx=self.sfx,
+        )
+        self.keyboard.grid(row=0, column=0)
+        self.keyboard.set_metrics(
+            key_size=key_sz,
+            key_width=int(key_sz * key_width_ratio),
+            delete_width=int(key_sz * delete_ratio * key_width_ratio),
+            key_gap=self.BASE_SIZES["key_gap"],
+            row_gap=4,
+        )
 
     def build_action_buttons(self):
         self.action_buttons_frame = ctk.CTkFrame(self.main, fg_color="transparent")
@@ -1,16 +1,19 @@
-import random
 import tkinter as tk
 from functools import partial
 
 import customtkinter as ctk
 from PIL import Image, ImageFile
 
+from juego.animaciones import color_ramp
+from juego.instantaneas_historial import RenderSnapshot, SnapshotCache
+from juego.monitor_rendimiento import measure
 from juego.pantalla_juego_base import GameScreenBase
 from juego.pantalla_juego_modales import (
     GameCompletionModal,
     QuestionSummaryModal,
     SkipConfirmationModal,
 )
+from juego.sesion_juego import GameSession
 
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
@@ -25,37 +28,32 @@ class GameScreenLogic(GameScreenBase):
         self.current_question = None
         self.current_answer = ""
         self.current_image = None
-        self.processing_correct_answer = False
         self.question_timer = 0
-        self.question_mistakes = 0
         self.audio_enabled = True
-        self.questions_answered = 0
-        self.score = 0
-        self.stored_modal_data = None
-        self.game_completed = False
         self.viewing_history_index = -1
-        self.question_history = []
         self.awaiting_modal_decision = False
-        self.feedback_animation_job = None
         self.timer_running = False
-        self.timer_job = None
         self.skip_modal = None
         self.completion_modal = None
         self.summary_modal = None
         self.cached_original_image = None
         self.cached_image_path = None  # Guarda qué ruta de imagen está en caché
+        self.history_snapshots = SnapshotCache()
 
         super().__init__(parent, on_return_callback, tts_service, sfx_service)
 
+    def can_use_wildcards(self):
+        return (
+            self.current_question is not None
+            and not self.awaiting_modal_decision
+            and self.viewing_history_index < 0
+        )
+
     def on_wildcard_x2(self):
-        if (
-            not self.current_question
-            or self.awaiting_modal_decision
-            or self.viewing_history_index >= 0
-        ):
+        if not self.can_use_wildcards():
             return
 
-        stacks = self.wildcard_manager.activate_double_points()
+        stacks = self.session.use_double_points()
         if stacks > 0:
             multiplier = self.wildcard_manager.get_points_multiplier()
             self.wildcard_x2_btn.configure(text=f"X{multiplier}")
@@ -65,40 +63,25 @@ class GameScreenLogic(GameScreenBase):
                 self.sfx.play("points", stop_previous=True)
 
     def on_wildcard_hint(self):
-        if (
-            not self.current_question
-            or self.awaiting_modal_decision
-            or self.viewing_history_index >= 0
-        ):
+        if not self.can_use_wildcards():
             return
 
-        title = self.current_question.get("title", "").replace(" ", "").upper()
-        result = self.wildcard_manager.activate_reveal_letter(
-            self.current_answer, title
-        )
+        result = self.session.use_reveal_letter()
         if result is None:
             return
 
-        pos, letter = result
-        ans = list(self.current_answer.upper())
-        while len(ans) <= pos:
-            ans.append(" ")
-        ans[pos] = letter
-        self.current_answer = "".join(ans).rstrip()
+        pos, _ = result
+        self.current_answer = self.session.current_answer
         self.update_answer_boxes_with_reveal(pos)
         self.update_wildcard_buttons_state()
         if self.sfx:
             self.sfx.play("reveal", stop_previous=True)
 
     def on_wildcard_freeze(self):
-        if (
-            not self.current_question
-            or self.awaiting_modal_decision
-            or self.viewing_history_index >= 0
-        ):
+        if not self.can_use_wildcards():
             return
 
-        if not self.wildcard_manager.activate_freeze():
+        if not self.session.use_freeze():
             return
 
         self.apply_freeze_timer_visuals()
@@ -110,33 +93,29 @@ class GameScreenLogic(GameScreenBase):
     def load_random_question(self):
         self.tts.stop()
         self.hide_feedback()
-        self.processing_correct_answer = False
         self.set_empty_questions_mode(False)
-        self.wildcard_manager.reset_for_new_question()
-        self.update_wildcard_buttons_state()
-        self.reset_timer_visuals()
-        self.reset_double_points_visuals()
 
         # Limpiar caché de imagen
         self.cached_original_image = None
         self.cached_image_path = None
 
-        if not self.questions:
-            self.current_question = None
-            self.current_answer = ""
+        self.current_question = self.session.next_question()
+        self.current_answer = self.session.current_answer
+        self.update_wildcard_buttons_state()
+        self.reset_timer_visuals()
+        self.reset_double_points_visuals()
+
+        if not self.session.has_questions():
             self.set_definition_text("No questions available!")
             self.set_empty_questions_mode(True)
             return
 
-        if not self.available_questions:
+        if self.current_question is None:
             self.handle_game_completion()
             return
 
-        idx = random.randrange(len(self.available_questions))
-        self.current_question = self.available_questions.pop(idx)
-        self.current_answer = ""
         self.question_timer = 0
-        self.question_mistakes = 0
+        self.question_clock.reset()
         self.timer_label.configure(text="00:00")
 
         definition = self.current_question.get("definition", "No definition")
@@ -158,6 +137,7 @@ class GameScreenLogic(GameScreenBase):
         except (tk.TclError, AttributeError):
             pass
 
+    @measure("game.load_question_image")
     def load_question_image(self):
         if not self.current_question:
             return
@@ -231,74 +211,32 @@ class GameScreenLogic(GameScreenBase):
     def reload_question_image(self):
         self.load_question_image()
 
+    @measure("game.on_key_press")
     def on_key_press(self, key):
         if not self.current_question or self.awaiting_modal_decision:
             return
 
-        title = self.current_question.get("title", "").replace(" ", "")
-        max_len = len(title)
-        revealed = self.wildcard_manager.get_revealed_positions()
-
-        # Rellenar la respuesta actual hasta max_len con espacios para preservar posiciones
-        ans = list(self.current_answer.ljust(max_len))
-
-        if key == "⌫":
-            # Encontrar la última posición no revelada con contenido y limpiarla
-            for i in range(max_len - 1, -1, -1):
-                if i in revealed:
-                    continue
-                if ans[i].strip():
-                    ans[i] = " "
-                    break
-        else:
-            # Encontrar la primera posición vacía no revelada y llenarla
-            for i in range(max_len):
-                if i in revealed:
-                    continue
-                if not ans[i].strip():
-                    ans[i] = key
-                    break
-
-        # Recortar espacios finales, pero nunca por debajo de la posición revelada más alta + 1
-        min_len = (max(revealed) + 1) if revealed else 0
-        while len(ans) > min_len and not ans[-1].strip():
-            ans.pop()
-
-        self.current_answer = "".join(ans)
-        self.update_answer_boxes()
+        if self.session.press_key(key):
+            self.current_answer = self.session.current_answer
+            self.refresh_answer_cells()
 
     def update_answer_boxes(self):
-        revealed = self.wildcard_manager.get_revealed_positions()
-        for i, box in enumerate(self.answer_box_labels):
-            has = i < len(self.current_answer) and self.current_answer[i].strip()
-            if has:
-                box.configure(
-                    text=self.current_answer[i],
-                    fg_color=(
-                        self.COLORS["success_green"]
-                        if i in revealed
-                        else self.COLORS["answer_box_filled"]
-                    ),
-                )
-            else:
-                box.configure(text="", fg_color=self.COLORS["answer_box_empty"])
+        self.refresh_answer_cells()
 
     def update_answer_boxes_with_reveal(self, pos):
-        self.update_answer_boxes()
-        if pos < len(self.answer_box_labels):
+        self.refresh_answer_cells()
+        if self.answer_row and pos < self.answer_row.word_length:
             self.animate_reveal_flash(pos)
 
     def animate_reveal_flash(self, pos):
-        if pos >= len(self.answer_box_labels):
+        if not self.answer_row or pos >= self.answer_row.word_length:
             return
-        box = self.answer_box_labels[pos]
-        try:
-            box.configure(fg_color="#00FFE5")
-        except tk.TclError:
-            pass
-        self.parent.after(
+        self.animation_engine.animate(
+            self,
+            ("reveal", pos),
+            ("#00FFE5", self.COLORS["success_green"]),
+            partial(self.answer_row.set_fill, pos),
             150,
-            partial(self.safe_configure, box, fg_color=self.COLORS["success_green"]),
         )
 
     def safe_configure(self, widget, **kw):
@@ -322,7 +260,7 @@ class GameScreenLogic(GameScreenBase):
     def on_skip(self):
         if (
             not self.current_question
-            or self.processing_correct_answer
+            or self.session.answer_locked
             or self.awaiting_modal_decision
             or self.viewing_history_index >= 0
         ):
@@ -342,69 +280,28 @@ class GameScreenLogic(GameScreenBase):
 
         self.stop_timer()
         self.tts.stop()
-        title = self.current_question.get("title", "")
-
-        if self.scoring_system:
-            self.scoring_system.process_skip(mistakes=self.question_mistakes)
-            self.questions_answered = self.scoring_system.questions_answered
-            self.score = self.scoring_system.total_score
-        else:
-            self.questions_answered += 1
 
-        # Calcular cargas por saltar (para seguimiento anti-frustración)
-        charges_earned, charges_max_reached = (
-            self.wildcard_manager.calculate_earned_charges(0, 1, 0, was_skipped=True)
-        )
+        if self.session.skip(self.question_clock.elapsed()) is None:
+            return
 
         self.score_label.configure(text=str(self.score))
-        streak = self.scoring_system.clean_streak if self.scoring_system else 0
-        streak_mult = (
-            self.scoring_system.calculate_streak_multiplier()
-            if self.scoring_system
-            else 1.0
-        )
-
-        self.stored_modal_data = {
-            "correct_word": title,
-            "time_taken": self.question_timer,
-            "points_awarded": 0,
-            "total_score": self.score,
-            "question": self.current_question,
-            "answer": self.current_answer,
-            "was_skipped": True,
-            "multiplier": 1,
-            "streak": streak,
-            "streak_multiplier": streak_mult,
-            "charges_earned": charges_earned,
-            "charges_max_reached": charges_max_reached,
-        }
         self.show_feedback(skipped=True)
+        self.capture_snapshot(self.stored_modal_data)
         self.show_summary_modal_for_state(self.stored_modal_data)
 
     def handle_game_completion(self):
-        if self.game_completed:
+        if self.completion_modal is not None:
             return
 
-        self.game_completed = True
+        self.session.complete()
         self.stop_timer()
         self.tts.stop()
         self.current_question = None
         self.set_definition_text("Game Complete!")
 
-        stats = self.scoring_system.get_session_stats() if self.scoring_system else None
         if self.sfx:
             self.sfx.play("win", stop_previous=True)
-        self.completion_modal = GameCompletionModal(
-            self.parent,
-            self.score,
-            len(self.questions),
-            stats,
-            self.on_completion_previous,
-            bool(self.question_history),
-            self.return_to_menu,
-            self.get_current_scale(),
-        )
-        self.completion_modal.show()
+        self.show_completion_modal_again()
 
     def on_check(self):
         if not self.current_question:
@@ -421,102 +318,29 @@ class GameScreenLogic(GameScreenBase):
             self.show_summary_modal_for_state(self.stored_modal_data)
             return
 
-        if self.processing_correct_answer:
-            return
+        # Tiempo exacto del reloj monotónico, no el segundo mostrado
+        outcome = self.session.check_answer(self.question_clock.elapsed())
 
-        title = self.current_question.get("title", "")
-        clean = title.replace(" ", "")
-        targetlen = len(clean)
-        ans = self.current_answer.ljust(targetlen)
-        full = True
-        for i in range(targetlen):
-            if not ans[i].strip():
-                full = False
-                break
-        if not full:
-            if self.feedback_animation_job:
-                try:
-                    self.parent.after_cancel(self.feedback_animation_job)
-                except tk.TclError:
-                    pass
-                self.feedback_animation_job = None
-            txt = "Fill all spaces"
+        if outcome == GameSession.CHECK_INCOMPLETE:
             clr = self.COLORS.get("warning_yellow", "#FFC553")
-            self.feedback_label.configure(text=txt, text_color=clr)
-            self.animate_feedback(0, clr)
-            return
-        if self.current_answer.upper() == clean.upper():
-            self.processing_correct_answer = True
+            self.feedback_label.configure(text="Fill all spaces", text_color=clr)
+            self.animate_feedback(clr)
+        elif outcome == GameSession.CHECK_WRONG:
+            self.show_feedback(correct=False)
+            if self.sfx:
+                self.sfx.play("incorrect", stop_previous=True)
+        elif outcome == GameSession.CHECK_CORRECT:
             self.stop_timer()
             self.tts.stop()
             self.show_feedback(correct=True)
             if self.sfx:
                 self.sfx.play("correct", stop_previous=True)
-
-            pts = 0
-            raw_pts = 0
-            max_raw = 0
-            mult = self.wildcard_manager.get_points_multiplier()
-
-            if self.scoring_system:
-                effective_time = self.scoring_system.get_effective_time(
-                    self.question_timer
-                )
-                raw_pts = self.scoring_system.calculate_raw_points(effective_time)
-                max_raw = self.scoring_system.max_raw_per_question
-
-                res = self.scoring_system.process_correct_answer(
-                    time_seconds=self.question_timer,
-                    mistakes=self.question_mistakes,
-                )
-                pts = self.scoring_system.apply_wildcard_bonus(res.points_earned, mult)
-                self.score = self.scoring_system.total_score
-                self.questions_answered = self.scoring_system.questions_answered
-            else:
-                pts = 100 * mult
-                raw_pts = 100
-                max_raw = 150
-                self.score += pts
-                self.questions_answered += 1
-
-            # Calcular cargas ganadas
-            charges_earned, charges_max_reached = (
-                self.wildcard_manager.calculate_earned_charges(
-                    raw_pts, max_raw, self.question_mistakes, was_skipped=False
-                )
-            )
-
             self.score_label.configure(text=str(self.score))
-            streak = self.scoring_system.clean_streak if self.scoring_system else 0
-            streak_mult = (
-                self.scoring_system.calculate_streak_multiplier()
-                if self.scoring_system
-                else 1.0
-            )
-
-            self.stored_modal_data = {
-                "correct_word": title,
-                "time_taken": self.question_timer,
-                "points_awarded": pts,
-                "total_score": self.score,
-                "question": self.current_question,
-                "answer": self.current_answer,
-                "was_skipped": False,
-                "multiplier": mult,
-                "streak": streak,
-                "streak_multiplier": streak_mult,
-                "charges_earned": charges_earned,
-                "charges_max_reached": charges_max_reached,
-            }
+            self.capture_snapshot(self.stored_modal_data)
             self.parent.after(
                 600,
                 partial(self.show_summary_modal_for_state, self.stored_modal_data),
             )
-        else:
-            self.question_mistakes += 1
-            self.show_feedback(correct=False)
-            if self.sfx:
-                self.sfx.play("incorrect", stop_previous=True)
 
     def show_summary_modal_for_state(self, state, review_mode=False):
         has_prev = (
@@ -534,24 +358,42 @@ class GameScreenLogic(GameScreenBase):
             on_close = self.on_modal_close
             on_prev = self.on_modal_previous
 
-        self.summary_modal = QuestionSummaryModal(
-            self.parent,
-            state["correct_word"],
-            state["time_taken"],
-            state["points_awarded"],
-            state["total_score"],
-            on_next,
-            on_close,
-            on_prev,
-            has_prev,
-            state.get("multiplier", 1),
-            self.on_modal_main_menu,
-            state.get("streak", 0),
-            state.get("streak_multiplier", 1.0),
-            state.get("charges_earned", 0),
-            state.get("charges_max_reached", False),
-            self.get_current_scale(),
-        )
+        # Un único modal de resumen por partida: se reutiliza con los datos nuevos
+        if self.summary_modal is None:
+            self.summary_modal = QuestionSummaryModal(
+                self.parent,
+                state["correct_word"],
+                state["time_taken"],
+                state["points_awarded"],
+                state["total_score"],
+                on_next,
+                on_close,
+                on_prev,
+                has_prev,
+                state.get("multiplier", 1),
+                self.on_modal_main_menu,
+                state.get("streak", 0),
+                state.get("streak_multiplier", 1.0),
+                state.get("charges_earned", 0),
+                state.get("charges_max_reached", False),
+                self.get_current_scale(),
+            )
+        else:
+            self.summary_modal.rebind(
+                state["correct_word"],
+                state["time_taken"],
+                state["points_awarded"],
+                state["total_score"],
+                on_next,
+                on_close,
+                on_prev,
+                has_prev,
+                state.get("multiplier", 1),
+                state.get("streak", 0),
+                state.get("streak_multiplier", 1.0),
+                state.get("charges_earned", 0),
+                state.get("charges_max_reached", False),
+            )
         self.summary_modal.show()
 
     def on_modal_main_menu(self):
@@ -605,15 +447,8 @@ class GameScreenLogic(GameScreenBase):
             else:
                 self.return_to_current_question()
         else:
-            if self.stored_modal_data:
-                self.question_history.append(self.stored_modal_data)
-                # Limitar tamaño del historial para evitar crecimiento ilimitado de memoria
-                if len(self.question_history) > self.MAX_QUESTION_HISTORY:
-                    self.question_history = self.question_history[
-                        -self.MAX_QUESTION_HISTORY :
-                    ]
+            self.session.commit_pending_result()
             self.awaiting_modal_decision = False
-            self.stored_modal_data = None
             self.set_buttons_enabled(True)
             self.load_random_question()
             if not self.game_completed and self.current_question:
@@ -636,30 +471,8 @@ class GameScreenLogic(GameScreenBase):
         if idx < 0 or idx >= len(self.question_history):
             return
 
-        state = self.question_history[idx]
         self.viewing_history_index = idx
-        self.current_question = state["question"]
-        self.current_answer = state["answer"]
-
-        self.set_definition_text(
-            self.current_question.get("definition", "No definition")
-        )
-        self.create_answer_boxes(
-            len(self.current_question.get("title", "").replace(" ", ""))
-        )
-        self.update_answer_boxes()
-
-        m, s = divmod(state["time_taken"], 60)
-        self.timer_label.configure(text=f"{m:02d}:{s:02d}")
-        self.score_label.configure(text=str(state["total_score"]))
-
-        self.load_question_image()
-        self.show_feedback(
-            skipped=state.get("was_skipped", False),
-            correct=not state.get("was_skipped", False),
-        )
-        self.set_buttons_enabled(False)
-        self.awaiting_modal_decision = True
+        self.apply_history_state(self.question_history[idx])
 
     def return_to_current_question(self):
         self.viewing_history_index = -1
@@ -668,36 +481,62 @@ class GameScreenLogic(GameScreenBase):
             self.set_buttons_enabled(True)
             return
 
-        state = self.stored_modal_data
+        self.apply_history_state(self.stored_modal_data)
+
+    def capture_snapshot(self, state):
+        # La imagen de la pregunta recién respondida ya está escalada en pantalla
+        if not state:
+            return
+        snapshot = RenderSnapshot(state)
+        snapshot.image = self.current_image
+        if not self.current_image:
+            snapshot.image_text = self.image_label.cget("text")
+        snapshot.image_box = self.get_scaled_image_size()
+        self.history_snapshots.put(state, snapshot)
+
+    @measure("game.apply_history_state")
+    def apply_history_state(self, state):
+        snapshot = self.history_snapshots.get(state) or RenderSnapshot(state)
         self.current_question = state["question"]
-        self.current_answer = state["answer"]
+        self.current_answer = snapshot.answer
 
-        self.set_definition_text(
-            self.current_question.get("definition", "No definition")
-        )
-        self.create_answer_boxes(
-            len(self.current_question.get("title", "").replace(" ", ""))
-        )
-        self.update_answer_boxes()
+        self.set_definition_text(snapshot.definition)
+        self.create_answer_boxes(snapshot.answer_length)
+        self.timer_label.configure(text=snapshot.timer_text)
+        self.score_label.configure(text=snapshot.score_text)
 
-        m, s = divmod(state["time_taken"], 60)
-        self.timer_label.configure(text=f"{m:02d}:{s:02d}")
-        self.score_label.configure(text=str(state["total_score"]))
+        image_box = self.get_scaled_image_size()
+        if snapshot.has_image_for(image_box):
+            self.show_snapshot_image(snapshot)
+        else:
+            # Primera visita o cambio de tamaño: preparar una vez y guardar
+            self.cached_original_image = None
+            self.load_question_image()
+            snapshot.image = self.current_image
+            snapshot.image_text = self.image_label.cget("text")
+            snapshot.image_box = image_box
+        self.history_snapshots.put(state, snapshot)
 
-        self.load_question_image()
-        self.show_feedback(
-            skipped=state.get("was_skipped", False),
-            correct=not state.get("was_skipped", False),
-        )
+        self.show_feedback(skipped=snapshot.skipped, correct=not snapshot.skipped)
         self.set_buttons_enabled(False)
         self.awaiting_modal_decision = True
 
+    def show_snapshot_image(self, snapshot):
+        self._clear_internal_label_image()
+        self.current_image = snapshot.image
+        # La imagen original de la pregunta anterior ya no corresponde
+        self.cached_original_image = None
+        self.cached_image_path = None
+        try:
+            self.image_label.configure(image=snapshot.image, text=snapshot.image_text)
+        except tk.TclError:
+            pass
+
     def set_buttons_enabled(self, enabled):
         st = "normal" if enabled else "disabled"
-        for btn in self.key_button_map.values():
-            self.safe_configure(btn, state=st)
+        if self.keyboard:
+            self.keyboard.set_enabled(enabled)
         for btn in [
-            self.delete_button,
             self.skip_button,
             self.audio_toggle_btn,
             self.wildcard_x2_btn,
@@ -708,13 +547,6 @@ class GameScreenLogic(GameScreenBase):
                 self.safe_configure(btn, state=st)
 
     def show_feedback(self, correct=True, skipped=False):
-        if self.feedback_animation_job:
-            try:
-                self.parent.after_cancel(self.feedback_animation_job)
-            except tk.TclError:
-                pass
-            self.feedback_animation_job = None
-
         if skipped:
             txt, clr = "⏭ Skipped", self.COLORS.get("warning_yellow", "#FFC553")
         elif correct:
@@ -723,82 +555,34 @@ class GameScreenLogic(GameScreenBase):
             txt, clr = "✗ Incorrect - Try Again", self.COLORS["feedback_incorrect"]
 
         self.feedback_label.configure(text=txt, text_color=clr)
-        self.animate_feedback(0, clr)
-
-    def animate_feedback(self, step, target):
-        if step > 5:
-            self.feedback_animation_job = None
-            return
-        if step == 0:
-            self.feedback_label.configure(text_color="#F5F7FA")
-        else:
-            self.feedback_label.configure(
-                text_color=self.interp_color("#F5F7FA", target, step / 5)
-            )
-        if step < 5:
-            self.feedback_animation_job = self.parent.after(
-                40, partial(self.animate_feedback, step + 1, target)
-            )
-        else:
-            self.feedback_animation_job = None
+        self.animate_feedback(clr)
+
+    def animate_feedback(self, target):
+        self.animation_engine.animate(
+            self,
+            "feedback",
+            color_ramp(self.COLORS["bg_light"], target, 5),
+            self.set_feedback_color,
+            200,
+        )
 
-    def interp_color(self, c1, c2, f):
-        r1, g1, b1 = int(c1[1:3], 16), int(c1[3:5], 16), int(c1[5:7], 16)
-        r2, g2, b2 = int(c2[1:3], 16), int(c2[3:5], 16), int(c2[5:7], 16)
-        r = int(r1 + (r2 - r1) * f)
-        g = int(g1 + (g2 - g1) * f)
-        b = int(b1 + (b2 - b1) * f)
-        return f"#{r:02x}{g:02x}{b:02x}"
+    def set_feedback_color(self, color):
+        self.feedback_label.configure(text_color=color)
 
     def hide_feedback(self):
-        if self.feedback_animation_job:
-            try:
-                self.parent.after_cancel(self.feedback_animation_job)
-            except tk.TclError:
-                pass
-            self.feedback_animation_job = None
+        self.animation_engine.cancel(self, "feedback")
         self.feedback_label.configure(text="")
 
     def start_timer(self):
         self.timer_running = True
-        # Incrementar generación para invalidar callbacks de temporizador pendientes
-        self.timer_generation += 1
-        current_gen = self.timer_generation
-        if self.timer_job:
-            try:
-                self.parent.after_cancel(self.timer_job)
-            except tk.TclError:
-                pass
-            self.timer_job = None
-        self.timer_job = self.parent.after(
-            1000, partial(self.update_timer, current_gen)
-        )
+        self.question_clock.resume()
 
     def stop_timer(self):
         self.timer_running = False
-        # Incrementar generación para invalidar callbacks de temporizador pendientes
-        self.timer_generation += 1
-        if self.timer_job:
-            try:
-                self.parent.after_cancel(self.timer_job)
-            except tk.TclError:
-                pass
-            self.timer_job = None
-
-    def update_timer(self, generation=None):
-        # Verificar si este callback pertenece a la generación actual del temporizador
-        if generation is not None and generation != self.timer_generation:
-            return  # Callback obsoleto, ignorar
-        if not self.timer_running:
-            self.timer_job = None
-            return
-        self.question_timer += 1
-        m, s = divmod(self.question_timer, 60)
+        self.question_clock.pause()
+        self.question_timer = self.question_clock.elapsed_seconds()
+
+    def on_timer_tick(self, seconds):
+        self.question_timer = seconds
+        m, s = divmod(seconds, 60)
         self.timer_label.configure(text=f"{m:02d}:{s:02d}")
-        if self.timer_running:  # Verificar antes de programar
-            current_gen = self.timer_generation
-            self.timer_job = self.parent.after(
-                1000, partial(self.update_timer, current_gen)
-            )
-        else:
-            self.timer_job = None
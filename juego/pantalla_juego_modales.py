@@ -1,7 +1,6 @@
 import tkinter as tk
 
 import customtkinter as ctk
-from PIL import Image
 
 from juego.modales_confirmacion import ConfirmationModal
 from juego.pantalla_juego_config import LEVEL_BADGE_COLORS, MODAL_BASE_SIZES
@@ -18,6 +17,8 @@ __all__ = [
 
 
 class GameCompletionModal(ModalBase):
+    POOLED = True
+
     def __init__(
         self,
         parent,
@@ -30,25 +31,55 @@ class GameCompletionModal(ModalBase):
         initial_scale=1.0,
     ):
         super().__init__(parent, initial_scale)
+        self.star_icon = None
+        self.data_widgets = {}
+        self.stat_rows = []
+        self.layout_scale = initial_scale
+        self.rebind(
+            final_score,
+            total_questions,
+            session_stats,
+            on_previous_callback,
+            has_previous,
+            on_close_callback,
+        )
+
+    def rebind(
+        self,
+        final_score,
+        total_questions,
+        session_stats=None,
+        on_previous_callback=None,
+        has_previous=False,
+        on_close_callback=None,
+    ):
         self.final_score = final_score
         self.total_questions = total_questions
         self.session_stats = session_stats or {}
         self.on_previous_callback = on_previous_callback
         self.has_previous = has_previous
         self.on_close_callback = on_close_callback
-        self.star_icon = None
 
     def show(self):
-        if self.modal and self.modal.winfo_exists():
+        if self.is_open():
             self.safe_try(self.lift_and_focus_modal)
             return
-        self.show_with_scale()
-
-    def show_with_scale(self, scale_override=None, attempt=0):
         root = self.parent.winfo_toplevel() if self.parent else None
         base_scale = self.calculate_scale_factor(root)
-        scale = scale_override if scale_override is not None else base_scale
-        self.current_scale = scale
+        layout_key = (self.get_modal_size(root), base_scale)
+        if self.can_reuse(layout_key):
+            self.current_scale = self.layout_scale
+            self.bind_content()
+            self.reveal()
+            self.safe_try(self.data_widgets["return_button"].focus_set)
+            self.start_fade_in_animation(self.COLORS["bg_light"])
+            return
+        self.destroy()
+        self.show_with_scale()
+        self.layout_key = layout_key
+        self.layout_scale = self.current_scale
+
+    def get_modal_size(self, root):
         base_w, base_h = (
             MODAL_BASE_SIZES["completion_width"],
             MODAL_BASE_SIZES["completion_height"],
@@ -75,6 +106,14 @@ class GameCompletionModal(ModalBase):
             height = min(height + extra_h, win_height)
         else:
             width, height = base_w, base_h
+        return width, height
+
+    def show_with_scale(self, scale_override=None, attempt=0):
+        root = self.parent.winfo_toplevel() if self.parent else None
+        base_scale = self.calculate_scale_factor(root)
+        scale = scale_override if scale_override is not None else base_scale
+        self.current_scale = scale
+        width, height = self.get_modal_size(root)
         sizes = self.calc_sizes(scale, width, height)
         self.create_modal(width, height, "Game Complete")
         container = self.create_container(sizes["corner_r"], sizes["border_w"])
@@ -112,7 +151,7 @@ class GameCompletionModal(ModalBase):
             shrink = (available_h - 10) / required_h  # Margen extra de seguridad
             if shrink < 0.96:
                 target_scale = max(0.3, scale * shrink * 0.95)  # Reducción más agresiva
-                self.close()
+                self.destroy()
                 self.show_with_scale(scale_override=target_scale, attempt=1)
                 return
         self.modal.protocol("WM_DELETE_WINDOW", self.handle_close)
@@ -164,38 +203,8 @@ class GameCompletionModal(ModalBase):
         }
 
     def build_content(self, content, width, s):
-        stats = self.session_stats or {}
-
-        def to_int(v, d=0):
-            try:
-                return int(v)
-            except (TypeError, ValueError):
-                return d
-
-        total_q = to_int(
-            stats.get("total_questions", self.total_questions),
-            to_int(self.total_questions, 0),
-        )
-        answered = to_int(stats.get("questions_answered", total_q), 0)
-        skipped = to_int(stats.get("questions_skipped"), 0)
-        correct = stats.get("questions_correct")
-        correct = (
-            to_int(correct, max(0, answered - skipped))
-            if correct is None
-            else to_int(correct, 0)
-        )
-        errors = to_int(stats.get("total_errors"), 0)
-        streak = to_int(stats.get("highest_streak", stats.get("clean_streak")), 0)
-        grace = to_int(stats.get("grace_period_seconds", 5), 5)
-        mastery_pct = stats.get("mastery_pct", 0.0)
-        try:
-            mastery_pct = float(mastery_pct)
-        except (TypeError, ValueError):
-            mastery_pct = 0.0
-        knowledge_level = stats.get(
-            "knowledge_level", self.knowledge_level_from_pct(mastery_pct)
-        )
-        level_color = LEVEL_BADGE_COLORS.get(knowledge_level, self.COLORS["text_light"])
+        # Solo estructura: los valores de la partida se asignan en bind_content()
+        widgets = self.data_widgets = {}
         # Mensaje de completado
         ctk.CTkLabel(
             content,
@@ -212,15 +221,16 @@ class GameCompletionModal(ModalBase):
             score_frame,
             text="★" if not self.star_icon else "",
             image=self.star_icon,
-            font=ctk.CTkFont(family="Segoe UI Symbol", size=s["star_size"]),
+            font=self.make_font("Segoe UI Symbol", s["star_size"]),
             text_color=self.COLORS["warning_yellow"],
         ).grid(row=0, column=0, padx=(0, 12))
-        ctk.CTkLabel(
+        widgets["score"] = ctk.CTkLabel(
             score_frame,
-            text=str(self.final_score),
+            text="",
             font=s["score_font"],
             text_color=self.COLORS["success_green"],
-        ).grid(row=0, column=1)
+        )
+        widgets["score"].grid(row=0, column=1)
         ctk.CTkLabel(
             score_frame,
             text="points",
@@ -236,20 +246,21 @@ class GameCompletionModal(ModalBase):
             font=s["label_font"],
             text_color=self.COLORS["text_dark"],
         ).grid(row=0, column=0, padx=(0, 8))
-        ctk.CTkLabel(
+        widgets["level"] = ctk.CTkLabel(
             badge_frame,
-            text=f" {knowledge_level} ",
+            text="",
             font=s["badge_font"],
             text_color=self.COLORS["text_white"],
-            fg_color=level_color,
             corner_radius=6,
-        ).grid(row=0, column=1, padx=(0, 8))
-        ctk.CTkLabel(
+        )
+        widgets["level"].grid(row=0, column=1, padx=(0, 8))
+        widgets["mastery"] = ctk.CTkLabel(
             badge_frame,
-            text=f"({mastery_pct:.1f}%)",
+            text="",
             font=s["badge_font"],
             text_color=self.COLORS["text_light"],
-        ).grid(row=0, column=2)
+        )
+        widgets["mastery"].grid(row=0, column=2)
         # Tarjeta de estadísticas
         stats_card = ctk.CTkFrame(
             content,
@@ -265,17 +276,16 @@ class GameCompletionModal(ModalBase):
             row=0, column=0, sticky="nsew", padx=s["pad"], pady=s["pad"] // 2
         )
         rows_container.grid_columnconfigure(0, weight=1)
-        rows = [
-            ("Total questions", str(total_q), self.COLORS["primary_blue"]),
-            ("Correct", str(correct), self.COLORS["success_green"]),
-            ("Skipped", str(skipped), self.COLORS["warning_yellow"]),
-            ("Errors", str(errors), self.COLORS["danger_red"]),
-            ("Highest streak", str(streak), self.COLORS["level_master"]),
+        labels = [
+            "Total questions",
+            "Correct",
+            "Skipped",
+            "Errors",
+            "Highest streak",
         ]
-        self.animated_widgets.clear()
-        self.widget_target_colors.clear()
         bg = self.COLORS["bg_light"]
-        for i, (lbl, val, clr) in enumerate(rows):
+        self.stat_rows = []
+        for i, lbl in enumerate(labels):
             rf = ctk.CTkFrame(rows_container, fg_color="transparent")
             rf.grid(row=i, column=0, sticky="ew", pady=s["row_pad"] // 2)
             rf.grid_columnconfigure(0, weight=1)
@@ -284,43 +294,34 @@ class GameCompletionModal(ModalBase):
                 rf, text=f"{lbl}:", font=s["label_font"], text_color=bg, anchor="w"
             )
             lw.grid(row=0, column=0, sticky="w")
-            self.widget_target_colors[id(lw)] = self.COLORS["text_dark"]
             vw = ctk.CTkLabel(
-                rf, text=val, font=s["value_font"], text_color=bg, anchor="e"
+                rf, text="", font=s["value_font"], text_color=bg, anchor="e"
             )
             vw.grid(row=0, column=1, sticky="e", padx=(s["pad"] // 2, 0))
-            self.widget_target_colors[id(vw)] = clr
-            self.animated_widgets.append((lw, vw))
+            self.stat_rows.append((lw, vw))
         # Nota del período de gracia
-        grace_text = (
-            f"You get the first {grace} seconds free to read the clue. "
-            "Time-based scoring starts after that."
-        )
-        ctk.CTkLabel(
+        widgets["grace"] = ctk.CTkLabel(
             content,
-            text=grace_text,
+            text="",
             font=s["footnote_font"],
             text_color=self.COLORS["text_light"],
             justify="center",
             anchor="center",
             wraplength=int(width * (0.9 if s.get("compact") else 0.82)),
-        ).grid(row=4, column=0, pady=(0, s["pad"] // 2))
+        )
+        widgets["grace"].grid(row=4, column=0, pady=(0, s["pad"] // 2))
         # Botones
         btn_container = ctk.CTkFrame(content, fg_color="transparent")
         btn_container.grid(row=5, column=0, pady=(s["pad"] // 2, 0))
-        ctk.CTkButton(
+        widgets["previous_button"] = ctk.CTkButton(
             btn_container,
             text="Previous Question",
             font=s["button_font"],
-            fg_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
-            hover_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
-            text_color=self.COLORS["text_white"] if self.has_previous else "#AAAAAA",
-            command=self.handle_previous if self.has_previous else None,
-            state="normal" if self.has_previous else "disabled",
             width=s["btn_w"],
             height=s["btn_h"],
             corner_radius=s["btn_r"],
-        ).grid(row=0, column=0, padx=(0, s["pad"] // 2))
+        )
+        widgets["previous_button"].grid(row=0, column=0, padx=(0, s["pad"] // 2))
         rb = ctk.CTkButton(
             btn_container,
             text="Return to Menu",
@@ -334,37 +335,91 @@ class GameCompletionModal(ModalBase):
             command=self.handle_close,
         )
         rb.grid(row=0, column=1, padx=(s["pad"] // 2, 0))
+        widgets["return_button"] = rb
+        self.bind_content()
         self.safe_try(rb.focus_set)
         self.start_fade_in_animation(bg)
 
+    def bind_content(self):
+        stats = self.session_stats or {}
+
+        def to_int(v, d=0):
+            try:
+                return int(v)
+            except (TypeError, ValueError):
+                return d
+
+        total_q = to_int(
+            stats.get("total_questions", self.total_questions),
+            to_int(self.total_questions, 0),
+        )
+        answered = to_int(stats.get("questions_answered", total_q), 0)
+        skipped = to_int(stats.get("questions_skipped"), 0)
+        correct = stats.get("questions_correct")
+        correct = (
+            to_int(correct, max(0, answered - skipped))
+            if correct is None
+            else to_int(correct, 0)
+        )
+        errors = to_int(stats.get("total_errors"), 0)
+        streak = to_int(stats.get("highest_streak", stats.get("clean_streak")), 0)
+        grace = to_int(stats.get("grace_period_seconds", 5), 5)
+        mastery_pct = stats.get("mastery_pct", 0.0)
+        try:
+            mastery_pct = float(mastery_pct)
+        except (TypeError, ValueError):
+            mastery_pct = 0.0
+        knowledge_level = stats.get(
+            "knowledge_level", self.knowledge_level_from_pct(mastery_pct)
+        )
+        level_color = LEVEL_BADGE_COLORS.get(knowledge_level, self.COLORS["text_light"])
+        widgets = self.data_widgets
+        widgets["score"].configure(text=str(self.final_score))
+        widgets["level"].configure(text=f" {knowledge_level} ", fg_color=level_color)
+        widgets["mastery"].configure(text=f"({mastery_pct:.1f}%)")
+        values = [
+            (str(total_q), self.COLORS["primary_blue"]),
+            (str(correct), self.COLORS["success_green"]),
+            (str(skipped), self.COLORS["warning_yellow"]),
+            (str(errors), self.COLORS["danger_red"]),
+            (str(streak), self.COLORS["level_master"]),
+        ]
+        self.animation_engine.cancel(self)
+        self.animated_widgets.clear()
+        self.widget_target_colors.clear()
+        bg = self.COLORS["bg_light"]
+        for (lw, vw), (val, clr) in zip(self.stat_rows, values):
+            lw.configure(text_color=bg)
+            vw.configure(text=val, text_color=bg)
+            self.widget_target_colors[id(lw)] = self.COLORS["text_dark"]
+            self.widget_target_colors[id(vw)] = clr
+            self.animated_widgets.append((lw, vw))
+        widgets["grace"].configure(
+            text=(
+                f"You get the first {grace} seconds free to read the clue. "
+                "Time-based scoring starts after that."
+            )
+        )
+        widgets["previous_button"].configure(
+            fg_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
+            hover_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
+            text_color=self.COLORS["text_white"] if self.has_previous else "#AAAAAA",
+            command=self.handle_previous if self.has_previous else None,
+            state="normal" if self.has_previous else "disabled",
+        )
+
     def load_star_icon(self, size):
-        img = self.load_svg_image(self.IMAGES_DIR / "star.svg", self.SVG_RASTER_SCALE)
+        img = self.icon_service.load_svg_image(
+            self.IMAGES_DIR / "star.svg",
+            self.SVG_RASTER_SCALE,
+            tint=self.COLORS["warning_yellow"],
+            tint_mode="multiply",
+        )
         if img:
-            r, g, b = (
-                int(self.COLORS["warning_yellow"][1:3], 16),
-                int(self.COLORS["warning_yellow"][3:5], 16),
-                int(self.COLORS["warning_yellow"][5:7], 16),
-            )
-            ir, ig, ib, ia = img.split()
-            img = Image.merge(
-                "RGBA",
-                (
-                    self.apply_channel_tint(ir, r),
-                    self.apply_channel_tint(ig, g),
-                    self.apply_channel_tint(ib, b),
-                    ia,
-                ),
-            )
             self.star_icon = ctk.CTkImage(
                 light_image=img, dark_image=img, size=(size, size)
             )
 
-    def apply_channel_tint(self, channel, component):
-        def tint_value(value):
-            return int(value * component / 255)
-
-        return channel.point(tint_value)
-
     def knowledge_level_from_pct(self, mastery_pct):
         pct = max(0.0, min(100.0, float(mastery_pct)))
         if pct < 40:
@@ -389,6 +444,9 @@ class GameCompletionModal(ModalBase):
 
 
 class QuestionSummaryModal(ModalBase):
+    POOLED = True
+    ROW_LABELS = ("Word:", "Time:", "Points:", "Total:", "Streak:", "Charges:")
+
     def __init__(
         self,
         parent,
@@ -409,6 +467,46 @@ class QuestionSummaryModal(ModalBase):
         initial_scale=1.0,
     ):
         super().__init__(parent, initial_scale)
+        self.on_main_menu_callback = on_main_menu_callback
+        self.confirmation_modal = None
+        self.next_button = None
+        self.previous_button = None
+        self.value_labels = []
+        self.label_widgets = []
+        self.multiplier_label = None
+        self.rebind(
+            correct_word,
+            time_taken,
+            points_awarded,
+            total_score,
+            on_next_callback,
+            on_close_callback,
+            on_previous_callback,
+            has_previous,
+            multiplier,
+            streak,
+            streak_multiplier,
+            charges_earned,
+            charges_max_reached,
+        )
+
+    def rebind(
+        self,
+        correct_word,
+        time_taken,
+        points_awarded,
+        total_score,
+        on_next_callback,
+        on_close_callback=None,
+        on_previous_callback=None,
+        has_previous=False,
+        multiplier=1,
+        streak=0,
+        streak_multiplier=1.0,
+        charges_earned=0,
+        charges_max_reached=False,
+    ):
+        # Datos de la pregunta a mostrar; los widgets se actualizan en show()
         self.correct_word = correct_word
         self.time_taken = time_taken
         self.points_awarded = points_awarded
@@ -418,17 +516,16 @@ class QuestionSummaryModal(ModalBase):
         self.on_previous_callback = on_previous_callback
         self.has_previous = has_previous
         self.multiplier = multiplier
-        self.on_main_menu_callback = on_main_menu_callback
         self.streak = streak
         self.streak_multiplier = streak_multiplier
         self.charges_earned = charges_earned
         self.charges_max_reached = charges_max_reached
-        self.confirmation_modal = None
-        self.next_button = None
 
     def show(self):
-        if self.modal and self.modal.winfo_exists():
+        if self.is_open():
+            self.bind_data()
             self.safe_try(self.lift_and_focus_modal)
+            self.start_fade_in_animation(self.COLORS["bg_light"])
             return
         root = self.parent.winfo_toplevel() if self.parent else None
         win_width, win_height = (
@@ -452,6 +549,22 @@ class QuestionSummaryModal(ModalBase):
         max_height = int(MODAL_BASE_SIZES["summary_height"] * max_scale)
         width = min(width, max_width)
         height = min(height, max_height)
+        layout_key = (width, height, scale)
+        if self.can_reuse(layout_key):
+            self.bind_data()
+            self.reveal()
+            self.safe_try(self.next_button.focus_set)
+            self.start_fade_in_animation(self.COLORS["bg_light"])
+            return
+        self.destroy()
+        self.build(width, height, scale)
+        self.layout_key = layout_key
+        self.bind_data()
+        self.safe_try(self.modal.focus_force)
+        self.safe_try(self.next_button.focus_set)
+        self.start_fade_in_animation(self.COLORS["bg_light"])
+
+    def build(self, width, height, scale):
         sizes = self.calc_sizes(scale, width, height)
         self.create_modal(width, height, "Summary")
         container = self.create_container(sizes["corner_r"], sizes["border_w"])
@@ -470,30 +583,11 @@ class QuestionSummaryModal(ModalBase):
         )
         content.grid_columnconfigure(0, weight=1)
         content.grid_columnconfigure(1, weight=1)
-        # Construir filas de datos
-        points_display = str(self.points_awarded)
-        streak_display = f"{self.streak} ({self.streak_multiplier:.2f}x)"
-        if self.charges_earned > 0:
-            charges_display, charges_color = (
-                f"+{self.charges_earned}",
-                self.COLORS["warning_yellow"],
-            )
-        elif self.charges_max_reached:
-            charges_display, charges_color = "0 (max)", self.COLORS["text_light"]
-        else:
-            charges_display, charges_color = "0", self.COLORS["text_light"]
-        rows = [
-            ("Word:", self.correct_word, self.COLORS["primary_blue"]),
-            ("Time:", f"{self.time_taken}s", self.COLORS["primary_blue"]),
-            ("Points:", points_display, self.COLORS["primary_blue"]),
-            ("Total:", str(self.total_score), self.COLORS["primary_blue"]),
-            ("Streak:", streak_display, self.COLORS["level_master"]),
-            ("Charges:", charges_display, charges_color),
-        ]
-        self.animated_widgets.clear()
-        self.widget_target_colors.clear()
+        # Filas de datos: los textos y colores se asignan en bind_data()
+        self.label_widgets = []
+        self.value_labels = []
         bg = self.COLORS["bg_light"]
-        for i, (lbl, val, clr) in enumerate(rows):
+        for i, lbl in enumerate(self.ROW_LABELS):
             row_frame = ctk.CTkFrame(content, fg_color="transparent")
             row_frame.grid(
                 row=i, column=0, columnspan=2, sticky="ew", pady=sizes["row_pad"]
@@ -504,48 +598,32 @@ class QuestionSummaryModal(ModalBase):
                 row_frame, text=lbl, font=sizes["label_font"], text_color=bg, anchor="e"
             )
             lw.grid(row=0, column=0, sticky="e", padx=(0, 4))
-            self.widget_target_colors[id(lw)] = self.COLORS["text_dark"]
-            if lbl == "Points:" and self.multiplier > 1:
-                value_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-                value_frame.grid(row=0, column=1, sticky="w")
-                vw = ctk.CTkLabel(
-                    value_frame,
-                    text=val,
-                    font=sizes["value_font"],
-                    text_color=bg,
-                    anchor="w",
-                )
-                vw.grid(row=0, column=0, sticky="w")
-                self.widget_target_colors[id(vw)] = clr
+            value_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+            value_frame.grid(row=0, column=1, sticky="w")
+            vw = ctk.CTkLabel(
+                value_frame,
+                text="",
+                font=sizes["value_font"],
+                text_color=bg,
+                anchor="w",
+            )
+            vw.grid(row=0, column=0, sticky="w")
+            self.label_widgets.append(lw)
+            self.value_labels.append(vw)
+            if lbl == "Points:":
                 mult_font = self.make_font(
                     "Poppins ExtraBold",
                     max(8, sizes["value_font"].cget("size") - 2),
                     "bold",
                 )
-                mult_label = ctk.CTkLabel(
+                self.multiplier_label = ctk.CTkLabel(
                     value_frame,
-                    text=f"x{self.multiplier}",
+                    text="",
                     font=mult_font,
                     text_color=bg,
                     anchor="w",
                 )
-                mult_label.grid(row=0, column=1, padx=(3, 0), sticky="w")
-                self.widget_target_colors[id(mult_label)] = self.COLORS[
-                    "warning_yellow"
-                ]
-                self.animated_widgets.append((lw, vw))
-                self.animated_widgets.append((mult_label, mult_label))
-            else:
-                vw = ctk.CTkLabel(
-                    row_frame,
-                    text=val,
-                    font=sizes["value_font"],
-                    text_color=bg,
-                    anchor="w",
-                )
-                vw.grid(row=0, column=1, sticky="w")
-                self.widget_target_colors[id(vw)] = clr
-                self.animated_widgets.append((lw, vw))
+                self.multiplier_label.grid(row=0, column=1, padx=(3, 0), sticky="w")
         # Botones
         btn_container = ctk.CTkFrame(content, fg_color="transparent")
         btn_container.grid(row=6, column=0, columnspan=2, pady=(sizes["pad"], 0))
@@ -554,19 +632,15 @@ class QuestionSummaryModal(ModalBase):
         menu_gap = max(btn_gap, sizes["pad"] // 2)
         if sizes["modal_scale"] >= 1.2:
             menu_gap = max(menu_gap, sizes["pad"])
-        ctk.CTkButton(
+        self.previous_button = ctk.CTkButton(
             btn_container,
             text="Previous",
             font=sizes["button_font"],
-            fg_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
-            hover_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
-            text_color=self.COLORS["text_white"] if self.has_previous else "#AAAAAA",
-            command=self.handle_previous if self.has_previous else None,
-            state="normal" if self.has_previous else "disabled",
             width=sizes["btn_w"],
             height=sizes["btn_h"],
             corner_radius=sizes["btn_r"],
-        ).grid(row=0, column=0, padx=(0, btn_gap))
+        )
+        self.previous_button.grid(row=0, column=0, padx=(0, btn_gap))
         ctk.CTkButton(
             btn_container,
             text="Close",
@@ -608,9 +682,60 @@ class QuestionSummaryModal(ModalBase):
         self.modal.bind("<Escape>", self.handle_close)
         self.modal.bind("<Return>", self.handle_next)
         self.modal.bind("<KP_Enter>", self.handle_next)
-        self.safe_try(self.modal.focus_force)
-        self.safe_try(self.next_button.focus_set)
-        self.start_fade_in_animation(bg)
+
+    def bind_data(self):
+        points_display = str(self.points_awarded)
+        streak_display = f"{self.streak} ({self.streak_multiplier:.2f}x)"
+        if self.charges_earned > 0:
+            charges_display, charges_color = (
+                f"+{self.charges_earned}",
+                self.COLORS["warning_yellow"],
+            )
+        elif self.charges_max_reached:
+            charges_display, charges_color = "0 (max)", self.COLORS["text_light"]
+        else:
+            charges_display, charges_color = "0", self.COLORS["text_light"]
+        values = [
+            (self.correct_word, self.COLORS["primary_blue"]),
+            (f"{self.time_taken}s", self.COLORS["primary_blue"]),
+            (points_display, self.COLORS["primary_blue"]),
+            (str(self.total_score), self.COLORS["primary_blue"]),
+            (streak_display, self.COLORS["level_master"]),
+            (charges_display, charges_color),
+        ]
+        self.animation_engine.cancel(self)
+        self.animated_widgets.clear()
+        self.widget_target_colors.clear()
+        bg = self.COLORS["bg_light"]
+        rows = zip(self.ROW_LABELS, self.label_widgets, self.value_labels, values)
+        for lbl, lw, vw, (val, clr) in rows:
+            lw.configure(text_color=bg)
+            vw.configure(text=val, text_color=bg)
+            self.widget_target_colors[id(lw)] = self.COLORS["text_dark"]
+            self.widget_target_colors[id(vw)] = clr
+            self.animated_widgets.append((lw, vw))
+            if lbl == "Points:":
+                self.bind_multiplier(bg)
+        self.bind_buttons()
+
+    def bind_multiplier(self, bg):
+        mult_label = self.multiplier_label
+        if self.multiplier <= 1:
+            mult_label.grid_remove()
+            return
+        mult_label.configure(text=f"x{self.multiplier}", text_color=bg)
+        mult_label.grid()
+        self.widget_target_colors[id(mult_label)] = self.COLORS["warning_yellow"]
+        self.animated_widgets.append((mult_label, mult_label))
+
+    def bind_buttons(self):
+        self.previous_button.configure(
+            fg_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
+            hover_color=self.COLORS["header_bg"] if self.has_previous else "#E8E8E8",
+            text_color=self.COLORS["text_white"] if self.has_previous else "#AAAAAA",
+            command=self.handle_previous if self.has_previous else None,
+            state="normal" if self.has_previous else "disabled",
+        )
 
     def calc_sizes(self, scale, modal_width, modal_height):
         w_scale, h_scale = (
@@ -681,12 +806,14 @@ class QuestionSummaryModal(ModalBase):
 
 
 class SkipConfirmationModal(ModalBase):
+    POOLED = True
+
     def __init__(self, parent, on_skip_callback, initial_scale=1.0):
         super().__init__(parent, initial_scale)
         self.on_skip_callback = on_skip_callback
 
     def show(self):
-        if self.modal and self.modal.winfo_exists():
+        if self.is_open():
             self.safe_try(self.lift_and_focus_modal)
             return
         root = self.parent.winfo_toplevel() if self.parent else None
@@ -701,8 +828,14 @@ class SkipConfirmationModal(ModalBase):
                 MODAL_BASE_SIZES["skip_width"],
                 MODAL_BASE_SIZES["skip_height"],
             )
+        layout_key = (width, height, scale)
+        if self.can_reuse(layout_key):
+            self.reveal()
+            return
+        self.destroy()
         sizes = self.calc_sizes(scale)
         self.create_modal(width, height, "Skip Question")
+        self.layout_key = layout_key
         container = self.create_container(sizes["corner_r"], sizes["border_w"])
         self.create_header(
             container,
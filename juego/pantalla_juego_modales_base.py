@@ -2,9 +2,10 @@ import tkinter as tk
 from functools import partial
 
 import customtkinter as ctk
-from PIL import ImageTk
-from tksvg import SvgImage as TkSvgImage
 
+from juego.animaciones import AnimationEngine, color_ramp
+from juego.fuentes import FontPool
+from juego.iconos_svg import SvgIconService
 from juego.pantalla_juego_config import GAME_COLORS, MODAL_ANIMATION
 from juego.rutas_app import get_resource_images_dir
 
@@ -16,12 +17,16 @@ class ModalBase:
     ANIMATION_DELAY_MS = MODAL_ANIMATION["delay_ms"]
     FADE_STEPS = MODAL_ANIMATION["fade_steps"]
     FADE_STEP_MS = MODAL_ANIMATION["fade_step_ms"]
+    # Los modales reutilizables se ocultan al cerrarse; al volver a abrirse solo
+    # se actualizan sus datos en lugar de reconstruir la ventana
+    POOLED = False
 
     def __init__(self, parent, initial_scale=1.0):
         self.parent = parent
         self.modal = None
         self.root = None
-        self.animation_jobs = []
+        self.animation_engine = AnimationEngine.for_widget(parent)
+        self.icon_service = SvgIconService.shared()
         self.animated_widgets = []
         self.widget_target_colors = {}
         self.current_scale = initial_scale
@@ -30,6 +35,9 @@ class ModalBase:
         self.closing = (
             False  # Bandera para prevenir nuevos trabajos de animación durante cierre
         )
+        self.hidden = False
+        # Tamaño y escala con los que se construyeron los widgets actuales
+        self.layout_key = None
 
     def get_window_scaling(self, root):
         try:
@@ -97,6 +105,14 @@ class ModalBase:
             self.modal.grab_set()
         self.modal.resizable(False, False)
         # Volver a centrar el modal después de renderizar los widgets
+        self.center_modal()
+        self.modal.configure(fg_color=self.COLORS["bg_light"])
+        self.modal.grid_rowconfigure(0, weight=1)
+        self.modal.grid_columnconfigure(0, weight=1)
+        return root
+
+    def center_modal(self):
+        root = self.root
         self.modal.update_idletasks()
         final_w = self.modal.winfo_width()
         final_h = self.modal.winfo_height()
@@ -108,10 +124,42 @@ class ModalBase:
             pos_y = (self.modal.winfo_screenheight() - final_h) // 2
         pos_x, pos_y = int(pos_x), int(pos_y)
         self.modal.geometry(f"+{pos_x}+{pos_y}")
-        self.modal.configure(fg_color=self.COLORS["bg_light"])
-        self.modal.grid_rowconfigure(0, weight=1)
-        self.modal.grid_columnconfigure(0, weight=1)
-        return root
+
+    # =========================================================================
+    # Reutilización
+    # =========================================================================
+
+    def is_open(self):
+        try:
+            return bool(self.modal and self.modal.winfo_exists() and not self.hidden)
+        except tk.TclError:
+            return False
+
+    def can_reuse(self, layout_key):
+        # Solo se reaprovecha la ventana si se construyó para el mismo tamaño
+        try:
+            exists = bool(self.modal and self.modal.winfo_exists())
+        except tk.TclError:
+            exists = False
+        return exists and self.layout_key == layout_key
+
+    def reveal(self):
+        self.hidden = False
+        self.modal.deiconify()
+        self.center_modal()
+        if self.root:
+            self.safe_try(self.modal.grab_set)
+        self.safe_try(self.lift_and_focus_modal)
+
+    def hide(self):
+        self.closing = True
+        self.animation_engine.cancel(self)
+        modal = self.modal
+        if modal:
+            self.safe_try(modal.grab_release)
+            self.safe_try(modal.withdraw)
+        self.hidden = True
+        self.closing = False
 
     def scale_value(self, base, scale=None, min_val=None, max_val=None):
         value = base * (scale or self.current_scale)
@@ -122,11 +170,8 @@ class ModalBase:
         return int(round(value))
 
     def make_font(self, family, size, weight=None):
-        return (
-            ctk.CTkFont(family=family, size=size, weight=weight)
-            if weight
-            else ctk.CTkFont(family=family, size=size)
-        )
+        # Fuentes fijas compartidas por toda la aplicación
+        return FontPool.shared().get(family, size, weight)
 
     def create_container(self, corner_r, border_w):
         container = ctk.CTkFrame(
@@ -166,86 +211,48 @@ class ModalBase:
         self.resizable_fonts["header_title"] = title_font
         return header
 
-    def interpolate_color(self, start_hex, end_hex, progress):
-        sr, sg, sb = (
-            int(start_hex[1:3], 16),
-            int(start_hex[3:5], 16),
-            int(start_hex[5:7], 16),
-        )
-        er, eg, eb = int(end_hex[1:3], 16), int(end_hex[3:5], 16), int(end_hex[5:7], 16)
-        r, g, b = (
-            int(sr + (er - sr) * progress),
-            int(sg + (eg - sg) * progress),
-            int(sb + (eb - sb) * progress),
-        )
-        return f"#{r:02x}{g:02x}{b:02x}"
-
     def start_fade_in_animation(self, bg_color):
+        duration = self.FADE_STEPS * self.FADE_STEP_MS
+        default_target = self.COLORS["text_dark"]
         for i, (lw, vw) in enumerate(self.animated_widgets):
-            delay = i * self.ANIMATION_DELAY_MS
-            job = self.modal.after(
-                delay,
-                partial(self.fade_in_row, lw, vw, bg_color, 0),
+            label_ramp = color_ramp(
+                bg_color,
+                self.widget_target_colors.get(id(lw), default_target),
+                self.FADE_STEPS,
             )
-            self.animation_jobs.append(job)
-
-    def fade_in_row(self, label_widget, value_widget, bg_color, step):
-        # Verificar bandera de cierre para prevenir programación durante cierre
-        if self.closing:
-            return
-        if not self.modal or not self.modal.winfo_exists():
-            return
-        label_target = self.widget_target_colors.get(id(label_widget))
-        value_target = self.widget_target_colors.get(id(value_widget))
-        if step >= self.FADE_STEPS:
-            self.safe_try(partial(label_widget.configure, text_color=label_target))
-            self.safe_try(partial(value_widget.configure, text_color=value_target))
-            return
-        progress = (step + 1) / self.FADE_STEPS
-        self.safe_try(
-            partial(
-                label_widget.configure,
-                text_color=self.interpolate_color(bg_color, label_target, progress),
+            value_ramp = color_ramp(
+                bg_color,
+                self.widget_target_colors.get(id(vw), default_target),
+                self.FADE_STEPS,
             )
-        )
-        self.safe_try(
-            partial(
-                value_widget.configure,
-                text_color=self.interpolate_color(bg_color, value_target, progress),
+            self.animation_engine.animate(
+                self,
+                ("fade_row", i),
+                zip(label_ramp, value_ramp),
+                partial(self.apply_row_colors, lw, vw),
+                duration,
+                delay_ms=i * self.ANIMATION_DELAY_MS,
             )
-        )
-        # Verificar bandera de cierre de nuevo antes de programar
-        if self.closing:
-            return
-        job = self.modal.after(
-            self.FADE_STEP_MS,
-            partial(
-                self.fade_in_row,
-                label_widget,
-                value_widget,
-                bg_color,
-                step + 1,
-            ),
-        )
-        self.animation_jobs.append(job)
 
-    def load_svg_image(self, svg_path, scale=1.0):
-        try:
-            svg_photo = TkSvgImage(file=str(svg_path), scale=scale)
-            return ImageTk.getimage(svg_photo).convert("RGBA")
-        except (FileNotFoundError, ValueError):
-            return None
+    def apply_row_colors(self, label_widget, value_widget, colors):
+        # Verificar bandera de cierre para no tocar widgets durante el cierre
+        if self.closing or not self.modal:
+            return
+        label_widget.configure(text_color=colors[0])
+        if value_widget is not label_widget:
+            value_widget.configure(text_color=colors[1])
 
     def close(self):
+        if self.POOLED and self.modal:
+            self.hide()
+        else:
+            self.destroy()
+
+    def destroy(self):
         # Establecer bandera de cierre primero para prevenir nuevos trabajos de animación
         self.closing = True
         modal = self.modal
-        # Copiar la lista para evitar modificación durante iteración
-        jobs_to_cancel = list(self.animation_jobs)
-        self.animation_jobs.clear()
-        for job in jobs_to_cancel:
-            if modal:
-                self.safe_try(partial(modal.after_cancel, job))
+        self.animation_engine.cancel(self)
         self.animated_widgets.clear()
         self.widget_target_colors.clear()
         if modal:
@@ -257,6 +264,8 @@ class ModalBase:
                 pass
         self.modal = None
         self.root = None
+        self.hidden = False
+        self.layout_key = None
         self.closing = False  # Reiniciar para posible reutilización
 
     def safe_try(self, func):
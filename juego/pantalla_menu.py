@@ -2,10 +2,11 @@ import tkinter as tk
 from tkinter import messagebox
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
-from tksvg import SvgImage as TkSvgImage
+from PIL import Image
 
 from juego.ayudantes_responsivos import get_dpi_scaling, get_logical_dimensions
+from juego.fuentes import FontPool
+from juego.iconos_svg import SvgIconService
 from juego.modales_confirmacion import ConfirmationModal
 from juego.rutas_app import get_resource_images_dir
 
@@ -36,18 +37,18 @@ class MenuScreen:
 
         self.footer_items = []
 
-        self.title_font = ctk.CTkFont(
-            family="Poppins ExtraBold",
-            size=self.BASE_FONT_SIZES["title"],
-            weight="bold",
+        self.font_pool = FontPool.shared()
+        self.title_font = self.font_pool.scalable(
+            "menu", "title", "Poppins ExtraBold", self.BASE_FONT_SIZES["title"], "bold"
         )
 
-        self.button_font = ctk.CTkFont(
-            family="Poppins SemiBold", size=self.BASE_FONT_SIZES["button"]
+        self.button_font = self.font_pool.scalable(
+            "menu", "button", "Poppins SemiBold", self.BASE_FONT_SIZES["button"]
         )
 
         self.images_dir = get_resource_images_dir()
         self.logo_svg_path = self.images_dir / "Hat.svg"
+        self.icon_service = SvgIconService.shared()
 
         self.resize_job = None
 
@@ -81,7 +82,9 @@ class MenuScreen:
         logo_container.grid(row=0, column=0, sticky="n", pady=(0, 6))
         logo_container.grid_columnconfigure(0, weight=1)
 
-        img = self.load_svg_image(self.logo_svg_path, scale=self.SVG_RASTER_SCALE)
+        img = self.icon_service.load_svg_image(
+            self.logo_svg_path, scale=self.SVG_RASTER_SCALE
+        )
         if img:
             self.logo_image = ctk.CTkImage(
                 light_image=img,
@@ -97,7 +100,7 @@ class MenuScreen:
             ctk.CTkLabel(
                 logo_container,
                 text="(logo)",
-                font=ctk.CTkFont(size=18),
+                font=self.font_pool.get(None, 18),
                 text_color="red",
             ).grid(row=0, column=0)
 
@@ -208,11 +211,11 @@ class MenuScreen:
         scale = min(w / self.BASE_DIMENSIONS[0], h / self.BASE_DIMENSIONS[1])
         scale = max(self.SCALE_LIMITS[0], min(self.SCALE_LIMITS[1], scale))
 
-        self.title_font.configure(
-            size=int(max(16, self.BASE_FONT_SIZES["title"] * scale))
+        self.font_pool.set_size(
+            self.title_font, int(max(16, self.BASE_FONT_SIZES["title"] * scale))
         )
-        self.button_font.configure(
-            size=int(max(12, self.BASE_FONT_SIZES["button"] * scale))
+        self.font_pool.set_size(
+            self.button_font, int(max(12, self.BASE_FONT_SIZES["button"] * scale))
         )
 
         pad_y = int(max(4, min(12, 10 * scale)))
@@ -254,15 +257,6 @@ class MenuScreen:
 
         self.resize_job = None
 
-    def load_svg_image(self, svg_path, scale=1.0):
-        try:
-            svg_photo = TkSvgImage(file=str(svg_path), scale=scale)
-            pil = ImageTk.getimage(svg_photo).convert("RGBA")
-            return pil
-        except (FileNotFoundError, ValueError) as e:
-            print(f"Error loading SVG image '{svg_path}': {e}")
-            return None
-
     def load_png_image(self, png_path):
         try:
             with Image.open(png_path) as img:
@@ -3,6 +3,7 @@ from juego.ayudantes_responsivos import (
     ResponsiveScaler,
     SizeStateCalculator,
 )
+from juego.fuentes import FontRegistry
 from juego.manejador_imagenes import ImageHandler
 from juego.pantalla_preguntas_config import (
     SCREEN_BASE_DIMENSIONS,
@@ -25,7 +26,6 @@ from juego.pantalla_preguntas_config import (
     SCREEN_SIZES,
     SCREEN_VIEWPORT_WRAP_RATIO_PROFILE,
     QuestionRepository,
-    ScreenFontRegistry,
 )
 from juego.pantalla_preguntas_manejadores import QuestionScreenHandlersMixin
 from juego.rutas_app import (
@@ -79,7 +79,9 @@ class ManageQuestionsScreen(QuestionScreenHandlersMixin):
         self.init_screen()
 
     def init_fonts(self):
-        self.font_registry = ScreenFontRegistry(self.FONT_SPECS)
+        self.font_registry = FontRegistry(
+            self.FONT_SPECS, "manage_questions", max_ratio=2.2
+        )
         self.font_registry.attach_attributes(self)
         self.font_base_sizes = dict(self.font_registry.base_sizes)
         self.font_min_sizes = dict(self.font_registry.min_sizes)
@@ -114,6 +116,10 @@ class ManageQuestionsScreen(QuestionScreenHandlersMixin):
     def init_data(self):
         self.questions = list(self.repository.questions)
         self.filtered_questions = list(self.questions)
+        self.image_handler.warm_thumbnails(
+            [q.get("image", "") for q in self.questions if q.get("image")],
+            self.SIZES["detail_image"],
+        )
         self.current_modal = None
         self.current_question = (
             self.filtered_questions[0] if self.filtered_questions else None
@@ -141,6 +147,8 @@ class ManageQuestionsScreen(QuestionScreenHandlersMixin):
 
     def refresh_question_cache(self):
         self.questions[:] = list(self.repository.questions)
+        # Altas, ediciones y bajas pueden apuntar a imágenes nuevas
+        self.image_handler.invalidate_image_paths()
 
     def filter_questions(self, query):
         query = (query or "").strip().lower()
@@ -3,8 +3,6 @@ import os
 import tempfile
 from pathlib import Path
 
-import customtkinter as ctk
-
 # Dimensiones base de pantalla y escalado
 SCREEN_BASE_DIMENSIONS = (1280, 720)
 SCREEN_SCALE_LIMITS = (0.18, 1.90)
@@ -143,37 +141,6 @@ SCREEN_FONT_SPECS = {
 }
 
 
-class ScreenFontRegistry:
-
-    def __init__(self, specs):
-        self.fonts = {}
-        self.base_sizes = {}
-        self.min_sizes = {}
-
-        for name, (family, size, weight, min_size) in specs.items():
-            font = (
-                ctk.CTkFont(family=family, size=size, weight=weight)
-                if weight
-                else ctk.CTkFont(family=family, size=size)
-            )
-            self.fonts[name] = font
-            self.base_sizes[name] = size
-            self.min_sizes[name] = min_size or 10
-
-    def get(self, name):
-        return self.fonts[name]
-
-    def items(self):
-        return self.fonts.items()
-
-    def as_dict(self):
-        return dict(self.fonts)
-
-    def attach_attributes(self, target):
-        for name, font in self.fonts.items():
-            setattr(target, f"{name}_font", font)
-
-
 class QuestionPersistenceError(Exception):
 
     pass
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 from types import SimpleNamespace
 
+from juego.monitor_rendimiento import measure
 from juego.pantalla_preguntas_config import QuestionPersistenceError
 from juego.pantalla_preguntas_ui import QuestionScreenUIMixin
 from juego.preguntas_modales import (
@@ -187,6 +188,7 @@ class QuestionScreenHandlersMixin(QuestionScreenUIMixin):
             image_path = self.current_question.get("image", "")
         self.update_detail_image(image_path)
 
+    @measure("manage.render_question_list")
     def render_question_list(self):
         if not self.list_outer_frame or not self.list_outer_frame.winfo_exists():
             return
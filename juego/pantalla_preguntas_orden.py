@@ -1,6 +1,7 @@
 import tkinter as tk
 
 from juego.ayudantes_responsivos import get_logical_dimensions
+from juego.monitor_rendimiento import measure
 
 
 class QuestionScreenLayoutMixin:
@@ -111,13 +112,7 @@ class QuestionScreenLayoutMixin:
             )
 
     def update_fonts(self, scale):
-        for name, base_size in self.font_base_sizes.items():
-            font = getattr(self, f"{name}_font", None)
-            if not font:
-                continue
-            min_size = self.font_min_sizes.get(name, 10)
-            max_size = base_size * 2.2
-            font.configure(size=self.scale_value(base_size, scale, min_size, max_size))
+        self.font_registry.update_scale(scale, self)
 
     def refresh_icons(self, scale):
         limits = {
@@ -366,10 +361,9 @@ class QuestionScreenLayoutMixin:
                 self.apply_title_wraplength()
 
         if self.detail_title_label and self.detail_title_label.winfo_exists():
-            base_size = self.font_base_sizes.get("detail_title", 38)
-            min_size = self.font_min_sizes.get("detail_title", 12)
-            max_size = base_size * 2.2
-            current_font_size = self.scale_value(base_size, scale, min_size, max_size)
+            current_font_size = self.font_registry.scaled_size(
+                "detail_title", scale, self
+            )
             title_height = int(current_font_size * 1.35 * 2)
             self.detail_title_label.configure(height=title_height)
 
@@ -422,6 +416,7 @@ class QuestionScreenLayoutMixin:
                 row=0, column=1, columnspan=1, sticky="nsew"
             )
 
+    @measure("manage.apply_responsive")
     def apply_responsive(self):
         if not self.parent or not self.parent.winfo_exists():
             return
@@ -1,11 +1,16 @@
+import time
 import tkinter as tk
 
 import customtkinter as ctk
-from PIL import Image, ImageFile
+from PIL import ImageFile
 
 from juego.ayudantes_responsivos import ResponsiveScaler, get_logical_dimensions
 from juego.datos_preguntas import load_questions_file
+from juego.fila_respuestas import AnswerRowCanvas
+from juego.fuentes import FontRegistry
 from juego.manejador_imagenes import ImageHandler
+from juego.medicion_texto import TextMeasurer
+from juego.monitor_rendimiento import measure
 from juego.pantalla_juego_config import (
     GAME_BASE_DIMENSIONS,
     GAME_BASE_SIZES,
@@ -16,9 +21,11 @@ from juego.pantalla_juego_config import (
     GAME_PROFILES,
     GAME_RESIZE_DELAY,
     GAME_SCALE_LIMITS,
-    GameFontRegistry,
     GameSizeCalculator,
 )
+from juego.precarga_repaso import NeighborPrefetcher
+from juego.repaso_espaciado import SpacedReviewQueue
+from juego.resultados import ResultsStore
 from juego.rutas_app import (
     get_data_questions_path,
     get_data_root,
@@ -39,6 +46,9 @@ class ReviewScreen:
     COLORS = GAME_COLORS
     ICONS = GAME_ICONS
     BASE_SIZES = GAME_BASE_SIZES
+    TTS_DEBOUNCE_MS = 300
+    TTS_PREFETCHED_DELAY_MS = 40
+    SPACED_REFRESH_MAX_SECONDS = 600
 
     def __init__(
         self, parent, on_return_callback=None, tts_service=None, sfx_service=None
@@ -47,15 +57,14 @@ class ReviewScreen:
         self.on_return_callback = on_return_callback
         self.sfx = sfx_service
 
-        self.questions, self.answer_box_labels = [], []
+        self.questions, self.answer_row = [], None
         self.current_index, self.ultimo_tam_imagen = 0, 0
         self.current_question = self.current_image = self.cached_original_image = (
             self.cached_image_path
         ) = None
-        self.resize_job = self.definition_scroll_update_job = (
-            self.definition_scroll_delayed_job
-        ) = None
+        self.resize_job = None
         self.tts_debounce_job = None
+        self.spaced_refresh_job = None
         self.audio_enabled = True
 
         self.main = self.header_frame = self.header_left_container = (
@@ -79,6 +88,12 @@ class ReviewScreen:
         ) = None
         self.nav_buttons_frame = self.prev_button = self.next_button = None
         self.menu_button = None
+        self.spaced_toggle_btn = None
+
+        # Modo de repaso espaciado (Leitner) opcional
+        self.spaced_mode = False
+        self.review_queue = None
+        self.question_indices = {}
 
         self.timer_font = self.score_font = self.definition_font = None
         self.keyboard_font = self.answer_box_font = self.button_font = None
@@ -97,6 +112,8 @@ class ReviewScreen:
         )
 
         self.tts = tts_service or TTSService(self.audio_dir)
+        self.prefetcher = NeighborPrefetcher(self.image_handler, self.tts)
+        self.text_measurer = TextMeasurer.shared()
 
         if self.sfx and hasattr(self.sfx, "is_muted"):
             self.audio_enabled = not self.sfx.is_muted()
@@ -107,7 +124,7 @@ class ReviewScreen:
             global_scale_factor=GAME_GLOBAL_SCALE_FACTOR,
         )
         self.size_calc = GameSizeCalculator(self.scaler, GAME_PROFILES)
-        self.font_registry = GameFontRegistry(GAME_FONT_SPECS)
+        self.font_registry = FontRegistry(GAME_FONT_SPECS, "review")
         self.font_registry.attach_attributes(self)
         self.font_base_sizes = self.font_registry.base_sizes
         self.font_min_sizes = self.font_registry.min_sizes
@@ -204,6 +221,20 @@ class ReviewScreen:
         )
         self.menu_button.grid(row=0, column=0, sticky="w")
 
+        self.spaced_toggle_btn = ctk.CTkButton(
+            conts[0],
+            text="Spaced Review",
+            font=self.header_button_font or self.button_font,
+            text_color="white",
+            fg_color="transparent",
+            hover_color=self.COLORS["header_hover"],
+            corner_radius=8,
+            width=150,
+            height=44,
+            command=self.toggle_spaced_mode,
+        )
+        self.spaced_toggle_btn.grid(row=0, column=1, sticky="w", padx=(8, 0))
+
         self.question_counter_label = ctk.CTkLabel(
             conts[1], text="0 / 0", font=self.score_font, text_color="white"
         )
@@ -324,6 +355,14 @@ class ReviewScreen:
         self.answer_boxes_frame.grid(row=2, column=0, pady=(6, 12), padx=20)
         self.answer_boxes_frame.grid_rowconfigure(0, weight=1)
         self.answer_boxes_frame.grid_anchor("center")
+        self.answer_row = AnswerRowCanvas(
+            self.answer_boxes_frame,
+            bg_color=self.COLORS["bg_card"],
+            empty_color=self.COLORS["answer_box_empty"],
+            text_color=self.COLORS["text_dark"],
+            font=self.answer_box_font,
+        )
+        self.answer_row.grid(row=0, column=0)
 
     def create_btn(
         self, parent, text, fg, hover, txt_col, cmd, border=0, border_col=""
@@ -393,6 +432,7 @@ class ReviewScreen:
                 image=None, text="On" if self.audio_enabled else "Off"
             )
 
+    @measure("review.show_question")
     def show_question(self, index):
         if not self.questions:
             self.set_definition_text("No questions available!")
@@ -401,9 +441,11 @@ class ReviewScreen:
         self.current_index = max(0, min(index, len(self.questions) - 1))
         self.current_question = self.questions[self.current_index]
 
-        self.question_counter_label.configure(
-            text=f"{self.current_index + 1} / {len(self.questions)}"
-        )
+        if self.spaced_mode:
+            counter = f"Reviewed {self.review_queue.reviewed}"
+        else:
+            counter = f"{self.current_index + 1} / {len(self.questions)}"
+        self.question_counter_label.configure(text=counter)
 
         definition = self.current_question.get("definition", "No definition")
         self.set_definition_text(definition)
@@ -420,6 +462,14 @@ class ReviewScreen:
 
         self.update_nav_buttons_state()
 
+        if not self.spaced_mode:
+            self.prefetcher.update(
+                self.questions,
+                self.current_index,
+                self.get_scaled_image_size(),
+                with_audio=self.audio_enabled,
+            )
+
     def create_answer_boxes_filled(self, answer_text):
         box_sz = self.get_scaled_box_size()
         gap = self.size_state.get("answer_box_gap", 3) if self.size_state else 3
@@ -432,39 +482,11 @@ class ReviewScreen:
         extra_pad = self.scale_value(16, scale, 8, 20)
         word_length = len(answer_text)
 
-        for i in range(len(self.answer_box_labels), word_length):
-            box = ctk.CTkLabel(
-                self.answer_boxes_frame,
-                text="",
-                font=self.answer_box_font,
-                width=box_sz,
-                height=box_sz,
-                fg_color=self.COLORS["answer_box_empty"],
-                corner_radius=8,
-                text_color=self.COLORS["text_dark"],
-            )
-            self.answer_box_labels.append(box)
-
-        for i in range(word_length):
-            box = self.answer_box_labels[i]
-            box.configure(
-                text=answer_text[i].upper(),
-                fg_color=self.COLORS["success_green"],
-                width=box_sz,
-                height=box_sz,
-            )
-            box.grid(row=0, column=i, padx=gap, pady=4)
-
-        if len(self.answer_box_labels) - word_length > 10:
-            for box in self.answer_box_labels[word_length + 10 :]:
-                try:
-                    box.destroy()
-                except tk.TclError:
-                    pass
-            del self.answer_box_labels[word_length + 10 :]
-
-        for i in range(word_length, len(self.answer_box_labels)):
-            self.answer_box_labels[i].grid_remove()
+        if not self.answer_row:
+            return
+        self.answer_row.set_layout(word_length, box_sz, gap)
+        for i, char in enumerate(answer_text):
+            self.answer_row.set_cell(i, char.upper(), self.COLORS["success_green"])
 
         self.safe_config(
             self.answer_boxes_frame,
@@ -479,6 +501,7 @@ class ReviewScreen:
         )
         self.safe_grid(self.answer_boxes_frame, pady=(pad_y, pad_y // 2))
 
+    @measure("review.load_question_image")
     def load_question_image(self):
         if not self.current_question:
             return
@@ -488,25 +511,22 @@ class ReviewScreen:
             return
 
         try:
+            max_sz = self.get_scaled_image_size()
             if (
                 self.cached_original_image is None
                 or self.cached_image_path != image_path
+                or max(self.cached_original_image.size) < max_sz
             ):
-                resolved_path = (
-                    self.image_handler.resolve_image_path(image_path)
-                    if self.image_handler
-                    else None
-                )
-                if resolved_path and resolved_path.exists():
-                    with Image.open(resolved_path) as img:
-                        self.cached_original_image = img.convert("RGBA").copy()
-                        self.cached_image_path = image_path
-                else:
+                if not self.image_handler.resolve_image_path(image_path):
                     self.clear_image("Image not found")
                     return
+                # Normalmente ya está decodificada por la precarga de vecinas
+                self.cached_original_image = self.prefetcher.get_image(
+                    image_path, max_sz
+                )
+                self.cached_image_path = image_path
 
             if self.cached_original_image:
-                max_sz = self.get_scaled_image_size()
                 w, h = self.cached_original_image.size
                 if w > 0 and h > 0:
                     sc = min(max_sz / w, max_sz / h)
@@ -547,8 +567,14 @@ class ReviewScreen:
         self.cancel_job("tts_debounce_job")
 
         if self.audio_enabled and definition and definition != "No definition":
+            # El audio precargado puede sonar casi de inmediato
+            delay = (
+                self.TTS_PREFETCHED_DELAY_MS
+                if self.tts.is_cached(definition)
+                else self.TTS_DEBOUNCE_MS
+            )
             self.tts_debounce_job = self.parent.after(
-                300, self.speak_after_debounce, definition
+                delay, self.speak_after_debounce, definition
             )
 
     def speak_after_debounce(self, definition):
@@ -557,13 +583,97 @@ class ReviewScreen:
             self.tts.speak(definition)
 
     def next_question(self):
+        if self.spaced_mode:
+            self.grade_current(True)
+            return
         if self.questions and self.current_index < len(self.questions) - 1:
             self.show_question(self.current_index + 1)
 
     def prev_question(self):
+        if self.spaced_mode:
+            self.grade_current(False)
+            return
         if self.questions and self.current_index > 0:
             self.show_question(self.current_index - 1)
 
+    # =========================================================================
+    # Repaso espaciado
+    # =========================================================================
+
+    def toggle_spaced_mode(self):
+        if not self.questions:
+            return
+        self.spaced_mode = not self.spaced_mode
+        self.safe_config(
+            self.spaced_toggle_btn,
+            text="Browse All" if self.spaced_mode else "Spaced Review",
+        )
+        self.safe_config(
+            self.prev_button, text="Again" if self.spaced_mode else "Previous"
+        )
+        self.safe_config(
+            self.next_button, text="Got It" if self.spaced_mode else "Next"
+        )
+
+        if not self.spaced_mode:
+            self.cancel_job("spaced_refresh_job")
+            self.show_question(self.current_index)
+            return
+
+        if self.review_queue is None:
+            self.review_queue = SpacedReviewQueue(self.questions, ResultsStore.shared())
+            self.question_indices = {}
+            for index, question in enumerate(self.questions):
+                self.question_indices.setdefault(id(question), index)
+        self.show_next_due()
+
+    def grade_current(self, remembered):
+        if self.review_queue is None or self.current_question is None:
+            return
+        self.review_queue.grade(self.current_question, remembered)
+        self.show_next_due()
+
+    def show_next_due(self):
+        self.cancel_job("spaced_refresh_job")
+        question = self.review_queue.next_due()
+        if question is None:
+            self.current_question = None
+            self.tts.stop()
+            due_at = self.review_queue.next_due_at()
+            message = "All caught up! Nothing is due for review."
+            if due_at is not None:
+                message += time.strftime(
+                    " Next review: %Y-%m-%d %H:%M.", time.localtime(due_at)
+                )
+            self.set_definition_text(message)
+            self.create_answer_boxes_filled("")
+            self.clear_image("No Image")
+            self.question_counter_label.configure(
+                text=f"Reviewed {self.review_queue.reviewed}"
+            )
+            self.update_nav_buttons_state()
+            self.schedule_spaced_refresh(due_at)
+            return
+        self.show_question(self.question_indices[id(question)])
+
+    def schedule_spaced_refresh(self, due_at):
+        # Volver a consultar la cola cuando venza el siguiente término (con tope,
+        # por si cambia el reloj del sistema)
+        if due_at is None:
+            return
+        delay = max(0.5, min(self.SPACED_REFRESH_MAX_SECONDS, due_at - time.time()))
+        try:
+            self.spaced_refresh_job = self.parent.after(
+                int(delay * 1000), self.on_spaced_refresh
+            )
+        except tk.TclError:
+            self.spaced_refresh_job = None
+
+    def on_spaced_refresh(self):
+        self.spaced_refresh_job = None
+        if self.spaced_mode and self.current_question is None:
+            self.show_next_due()
+
     def update_nav_buttons_state(self):
         if not self.questions:
             self.prev_button.configure(state="disabled")
@@ -576,6 +686,21 @@ class ReviewScreen:
             self.nav_buttons_frame.grid()
 
         colors = self.COLORS
+        if self.spaced_mode:
+            state = "normal" if self.current_question is not None else "disabled"
+            self.prev_button.configure(
+                state=state,
+                fg_color=colors["bg_light"],
+                border_color="black",
+                text_color="black",
+            )
+            self.next_button.configure(
+                state=state,
+                fg_color=colors["primary_blue"],
+                hover_color=colors["primary_hover"],
+            )
+            return
+
         if self.current_index <= 0:
             self.prev_button.configure(
                 state="disabled",
@@ -688,6 +813,7 @@ class ReviewScreen:
             self.parent.after_cancel(self.resize_job)
         self.resize_job = self.parent.after(self.RESIZE_DELAY, self.apply_responsive)
 
+    @measure("review.apply_responsive")
     def apply_responsive(self):
         if not self.parent or not self.parent.winfo_exists():
             return
@@ -721,6 +847,13 @@ class ReviewScreen:
             corner_radius=self.scale_value(8, scale, 6, 18),
         )
 
+        self.safe_config(
+            self.spaced_toggle_btn,
+            width=self.scale_value(150, scale, 100, 320),
+            height=self.scale_value(44, scale, 30, 88),
+            corner_radius=self.scale_value(8, scale, 6, 18),
+        )
+
         icon_sz = sz["audio_icon"]
         if self.menu_icon:
             self.menu_icon.configure(size=(icon_sz, icon_sz))
@@ -805,7 +938,7 @@ class ReviewScreen:
             isz = sz["info_icon"]
             self.info_icon.configure(size=(isz, isz))
 
-        self.queue_definition_scroll_update()
+        self.update_definition_scrollbar_visibility()
 
     def update_answer_boxes(self):
         sz = self.size_state
@@ -814,15 +947,12 @@ class ReviewScreen:
         box_sz, gap = sz["answer_box"], sz["answer_box_gap"]
         extra_pad = self.scale_value(16, scale, 8, 20)
 
-        visible_boxes = [b for b in self.answer_box_labels if b.winfo_manager()]
-        for box in visible_boxes:
-            self.safe_config(box, width=box_sz, height=box_sz)
-            self.safe_grid(box, padx=gap, pady=4)
-
-        if visible_boxes:
+        word_length = self.answer_row.word_length if self.answer_row else 0
+        if word_length:
+            self.answer_row.set_layout(word_length, box_sz, gap)
             self.safe_config(
                 self.answer_boxes_frame,
-                width=len(visible_boxes) * (box_sz + gap * 2),
+                width=word_length * (box_sz + gap * 2),
                 height=box_sz + extra_pad,
             )
             pad_y = (
@@ -860,38 +990,10 @@ class ReviewScreen:
     def set_definition_text(self, text):
         if self.definition_label and self.definition_label.winfo_exists():
             self.definition_label.configure(text=text)
-        self.queue_definition_scroll_update()
-
-    def queue_definition_scroll_update(self):
-        if not self.parent or not self.parent.winfo_exists():
-            return
-        self.cancel_job("definition_scroll_update_job")
-        self.cancel_job("definition_scroll_delayed_job")
-        try:
-            self.definition_scroll_update_job = self.parent.after_idle(
-                self.on_scroll_idle_check
-            )
-        except tk.TclError:
-            self.definition_scroll_update_job = None
-            self.update_definition_scrollbar_visibility()
-
-    def on_scroll_idle_check(self):
-        self.definition_scroll_update_job = None
-        self.update_definition_scrollbar_visibility()
-        if self.parent and self.parent.winfo_exists():
-            try:
-                self.definition_scroll_delayed_job = self.parent.after(
-                    150, self.on_scroll_delayed_check
-                )
-            except tk.TclError:
-                pass
-
-    def on_scroll_delayed_check(self):
-        self.definition_scroll_delayed_job = None
         self.update_definition_scrollbar_visibility()
 
     def update_definition_scrollbar_visibility(self):
-        self.definition_scroll_update_job = None
+        # Decidido con métricas de fuente, sin esperar a que Tk distribuya
         if not self.definition_scroll or not self.definition_scroll.winfo_exists():
             return
         if (
@@ -899,25 +1001,15 @@ class ReviewScreen:
             or not self.definition_scroll_wrapper.winfo_exists()
         ):
             return
-        content = next(
-            (
-                w
-                for w in (self.def_inner, self.definition_label)
-                if w and w.winfo_exists()
-            ),
-            None,
-        )
-        if not content:
+        if not self.definition_label or not self.definition_label.winfo_exists():
             return
-        try:
-            content.update_idletasks()
-            self.definition_scroll_wrapper.update_idletasks()
-        except tk.TclError:
-            return
-        wrapper_h = self.definition_scroll_wrapper.winfo_height()
-        if wrapper_h <= 1:
-            wrapper_h = self.definition_scroll_wrapper.winfo_reqheight()
-        self.set_definition_scrollbar_visible(content.winfo_reqheight() > wrapper_h)
+        content_h = self.text_measurer.label_height(
+            self.definition_label, self.definition_font
+        )
+        if self.info_icon:
+            content_h = max(content_h, self.info_icon.cget("size")[1] + 2)
+        wrapper_h = self.definition_scroll_wrapper.cget("height")
+        self.set_definition_scrollbar_visible(content_h > wrapper_h)
 
     def set_definition_scrollbar_visible(self, visible):
         if self.definition_scrollbar_visible is visible:
@@ -960,12 +1052,12 @@ class ReviewScreen:
 
     def cleanup(self):
         self.tts.stop()
+        self.prefetcher.stop()
 
         for job_attr in (
             "resize_job",
-            "definition_scroll_update_job",
-            "definition_scroll_delayed_job",
             "tts_debounce_job",
+            "spaced_refresh_job",
         ):
             self.cancel_job(job_attr)
 
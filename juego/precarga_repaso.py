@@ -0,0 +1,115 @@
+import threading
+from collections import OrderedDict
+
+# Preguntas precargadas a cada lado de la actual
+PREFETCH_RADIUS = 2
+
+
+def neighbor_indices(index, count, radius=PREFETCH_RADIUS):
+    # Primero la siguiente, luego la anterior, y así hacia afuera
+    order = []
+    for distance in range(1, radius + 1):
+        for candidate in (index + distance, index - distance):
+            if 0 <= candidate < count:
+                order.append(candidate)
+    return order
+
+
+class NeighborPrefetcher:
+    # Ventana deslizante de imágenes decodificadas y audio sintetizado alrededor
+    # de la pregunta visible en el repaso
+
+    def __init__(self, image_handler, tts=None, radius=PREFETCH_RADIUS):
+        self.image_handler = image_handler
+        self.tts = tts
+        self.radius = radius
+        self.max_images = 2 * radius + 3
+        self.images = OrderedDict()
+        self.lock = threading.Lock()
+        self.pending = []
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def image_key(self, image_path, size):
+        return (image_path, size)
+
+    def get_image(self, image_path, size):
+        key = self.image_key(image_path, size)
+        with self.lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.images.move_to_end(key)
+                return image
+
+        # Fallo de la ventana: cargar ahora (miniatura reducida, no el original)
+        resolved = self.image_handler.resolve_image_path(image_path)
+        if not resolved:
+            return None
+        content_key = self.image_handler.image_store.content_key(resolved)
+        image = self.image_handler.thumbnails.get(resolved, (size, size), content_key)
+        if image is not None:
+            self.store(key, image)
+        return image
+
+    def store(self, key, image):
+        with self.lock:
+            self.images[key] = image
+            self.images.move_to_end(key)
+            while len(self.images) > self.max_images:
+                self.images.popitem(last=False)
+
+    def update(self, questions, index, size, with_audio=True):
+        tasks = []
+        definitions = []
+        for neighbor in neighbor_indices(index, len(questions), self.radius):
+            question = questions[neighbor]
+            definitions.append(question.get("definition", ""))
+            image_path = question.get("image", "")
+            if not image_path:
+                continue
+            key = self.image_key(image_path, size)
+            with self.lock:
+                if key in self.images:
+                    self.images.move_to_end(key)
+                    continue
+            # Resolver en el hilo principal: la caché de rutas no es compartida
+            resolved = self.image_handler.resolve_image_path(image_path)
+            if resolved:
+                content_key = self.image_handler.image_store.content_key(resolved)
+                tasks.append((key, resolved, content_key))
+
+        self.pending = tasks
+        if self.tts is not None:
+            self.tts.prefetch(definitions if with_audio else [])
+        if not tasks:
+            return
+        self.wakeup.set()
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.wakeup.wait()
+            self.wakeup.clear()
+            while self.pending and not self.stopped.is_set():
+                tasks = self.pending
+                key, resolved, content_key = tasks[0]
+                size = key[1]
+                image = self.image_handler.thumbnails.get(
+                    resolved, (size, size), content_key
+                )
+                if image is not None:
+                    self.store(key, image)
+                if self.pending is tasks:
+                    self.pending = tasks[1:]
+
+    def stop(self):
+        self.pending = []
+        self.stopped.set()
+        self.wakeup.set()
+        if self.tts is not None:
+            self.tts.cancel_prefetch()
+        with self.lock:
+            self.images.clear()
@@ -12,8 +12,11 @@ from juego.fabrica_widgets import (
     ModalWidgetFactory,
     ScaledWidgetResizer,
 )
+from juego.fuentes import FontPool
+from juego.importador_imagenes import ImageImportJob
 
 TITLE_MAX_LENGTH = 50
+IMPORT_POLL_MS = 50
 
 
 class QuestionFormMode:
@@ -40,6 +43,7 @@ class BaseModal:
         self.parent = parent
         self.config = config
         self.modal = None
+        self.font_pool = FontPool.shared()
         self.fonts = {}
         self.font_base_sizes = {}
 
@@ -50,20 +54,19 @@ class BaseModal:
         )
 
     def init_fonts(self, font_specs):
+        # Fuentes del pool: abrir el modal otra vez no crea fuentes nuevas
+        namespace = type(self).__name__
         for name, (family, size, weight) in font_specs.items():
-            font = (
-                ctk.CTkFont(family=family, size=size, weight=weight)
-                if weight
-                else ctk.CTkFont(family=family, size=size)
+            self.fonts[name] = self.font_pool.scalable(
+                namespace, name, family, size, weight
             )
-            self.fonts[name] = font
             self.font_base_sizes[name] = size
 
     def update_fonts(self, scale):
         for name, base_size in self.font_base_sizes.items():
             if name in self.fonts:
                 new_size = self.scaler.scale_value(base_size, scale, 10, base_size * 2)
-                self.fonts[name].configure(size=new_size)
+                self.font_pool.set_size(self.fonts[name], new_size)
 
     def safe_try(self, func):
         try:
@@ -609,6 +612,11 @@ class QuestionFormModal(BaseQuestionModal):
         self.mode = mode
         self.question = question
         self.initial_image_path = ""
+        self.import_job = None
+        self.import_poll_job = None
+        # (origen, destino) de la última importación, para no repetirla si el
+        # guardado se rechaza (por ejemplo, por un título duplicado)
+        self.imported_image = None
 
     def show(self, question=None):
         self.question = question or self.question
@@ -634,12 +642,8 @@ class QuestionFormModal(BaseQuestionModal):
             )
 
         if existing_image_path:
-            try:
-                display_source = Path(existing_image_path).name or existing_image_path
-            except OSError:
-                display_source = existing_image_path
-
-            display_name = self.image_handler.truncate_filename(display_source)
+            # Las imágenes del almacén se muestran con su nombre original
+            display_name = self.image_handler.display_name(existing_image_path)
             self.image_display_label.configure(
                 text=display_name, text_color=self.config.TEXT_DARK
             )
@@ -688,6 +692,9 @@ class QuestionFormModal(BaseQuestionModal):
         return ""
 
     def handle_save(self):
+        if self.import_job is not None:
+            return
+
         form_data = self.get_validated_form_data()
         if not form_data:
             return
@@ -696,6 +703,16 @@ class QuestionFormModal(BaseQuestionModal):
         if image_value is None:
             return
 
+        if isinstance(image_value, Path):
+            if self.imported_image and self.imported_image[0] == image_value:
+                image_value = self.imported_image[1]
+            else:
+                self.start_image_import(form_data, image_value)
+                return
+
+        self.finish_save(form_data, image_value)
+
+    def finish_save(self, form_data, image_value):
         if self.on_save_callback:
             result = self.on_save_callback(
                 form_data["title"], form_data["definition"], image_value
@@ -703,11 +720,75 @@ class QuestionFormModal(BaseQuestionModal):
             if result is False:
                 return
 
+        self.imported_image = None
         self.close()
 
+    def start_image_import(self, form_data, source_path):
+        self.set_saving_state(True)
+        self.update_image_feedback("Preparing image...", is_error=False)
+        self.import_job = ImageImportJob(self.image_handler, source_path).start()
+        self.schedule_import_poll(form_data)
+
+    def schedule_import_poll(self, form_data):
+        self.import_poll_job = None
+        if not self.modal or not self.modal.winfo_exists():
+            return
+        try:
+            self.import_poll_job = self.modal.after(
+                IMPORT_POLL_MS, partial(self.poll_image_import, form_data)
+            )
+        except tk.TclError:
+            pass
+
+    def poll_image_import(self, form_data):
+        self.import_poll_job = None
+        job = self.import_job
+        if job is None:
+            return
+
+        for fraction, message in job.poll():
+            self.update_image_feedback(
+                f"{message} {round(fraction * 100)}%", is_error=False
+            )
+        if not job.done:
+            self.schedule_import_poll(form_data)
+            return
+
+        self.import_job = None
+        self.set_saving_state(False)
+        if job.error:
+            self.update_image_feedback("The image could not be imported.")
+            messagebox.showerror("Image Import Failed", job.error)
+            return
+        if job.destination is None:
+            return
+
+        self.imported_image = (job.source_path, job.destination)
+        self.update_image_feedback("Image imported.", is_error=False)
+        self.finish_save(form_data, job.destination)
+
+    def set_saving_state(self, busy):
+        state = "disabled" if busy else "normal"
+        for button in (self.save_button, self.choose_file_button):
+            if button is not None:
+                self.safe_try(partial(button.configure, state=state))
+        if self.save_button is not None:
+            text = "Saving..." if busy else "Save"
+            self.safe_try(partial(self.save_button.configure, text=text))
+
+    def cancel_image_import(self):
+        if self.import_poll_job is not None and self.modal:
+            self.safe_try(partial(self.modal.after_cancel, self.import_poll_job))
+        self.import_poll_job = None
+        if self.import_job is not None:
+            self.import_job.cancel()
+            self.import_job = None
+
     def close(self):
+        self.cancel_image_import()
         super().close()
         self.initial_image_path = ""
+        self.imported_image = None
 
 
 class AddQuestionModal(QuestionFormModal):
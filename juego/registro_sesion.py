@@ -0,0 +1,193 @@
+import argparse
+import json
+import random
+import time
+
+from juego.rutas_app import get_data_root
+from juego.sesion_juego import GameSession
+
+LOG_VERSION = 1
+
+
+def get_session_logs_dir():
+    return get_data_root() / "sesiones"
+
+
+class SessionRecorder:
+
+    def __init__(self, session, path, clock=time.monotonic):
+        self.session = session
+        self.path = path
+        self.clock = clock
+        self.start = clock()
+        self.file = None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Registro de solo anexado, una línea JSON compacta por evento
+        self.file = open(path, "a", encoding="utf-8", buffering=1)
+        self.write(
+            {
+                "e": "session",
+                "v": LOG_VERSION,
+                "seed": session.seed,
+                "deck": session.deck_mode,
+                "weights": session.deck_weights,
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "questions": [q.get("title", "") for q in session.questions],
+            }
+        )
+        session.add_listener(self.on_event)
+
+    @classmethod
+    def start(cls, session, directory=None, max_files=30):
+        if session.seed is None:
+            return None
+        directory = directory or get_session_logs_dir()
+        millis = int(time.time() * 1000) % 1000
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{millis:03d}"
+        try:
+            cls.prune(directory, max(0, max_files - 1))
+            return cls(session, directory / f"session-{stamp}.jsonl")
+        except OSError as error:
+            print(f"Error opening session log in '{directory}': {error}")
+            return None
+
+    @staticmethod
+    def prune(directory, keep):
+        if not directory.exists():
+            return
+        logs = sorted(directory.glob("session-*.jsonl"))
+        for old in logs[: max(0, len(logs) - keep)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def on_event(self, event, data):
+        record = {"e": event}
+        if "time" in data:
+            # Sin redondear: el bono de tiempo se calcula con este valor y la
+            # repetición debe puntuar exactamente igual
+            record["time"] = data["time"]
+        if event == "question_started":
+            record["title"] = data["question"].get("title", "")
+        elif event == "answer_changed":
+            record["key"] = data["key"]
+        elif event == "wildcard_used":
+            record["wildcard"] = data["wildcard"]
+            if "position" in data:
+                record["position"] = data["position"]
+        elif event in ("answer_correct", "question_skipped"):
+            record["points"] = data["result"]["points_awarded"]
+            record["score"] = data["result"]["total_score"]
+        elif event == "game_completed":
+            record["score"] = data["stats"]["total_score"]
+        self.write(record)
+        if event == "game_completed":
+            self.close()
+
+    def write(self, record):
+        if self.file is None:
+            return
+        record["t"] = round((self.clock() - self.start) * 1000)
+        try:
+            self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        except (OSError, ValueError):
+            self.close()
+
+    def close(self):
+        self.session.remove_listener(self.on_event)
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+
+def load_session_log(path):
+    with open(path, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    if not records or records[0].get("e") != "session":
+        raise ValueError(f"'{path}' is not a session log")
+    return records[0], records[1:]
+
+
+def replay_session(header, events):
+    # Re-ejecuta los eventos contra la lógica real de puntaje y comodines
+    questions = [{"title": title} for title in header["questions"]]
+    session = GameSession(
+        questions,
+        rng=random.Random(header["seed"]),
+        deck=header.get("deck", "uniform"),
+        weights=header.get("weights"),
+    )
+    mismatches = []
+
+    for index, record in enumerate(events):
+        event = record["e"]
+        if event == "question_started":
+            session.commit_pending_result()
+            question = session.next_question()
+            title = question.get("title", "") if question else None
+            if title != record.get("title"):
+                mismatches.append((index, event, record.get("title"), title))
+        elif event == "answer_changed":
+            session.press_key(record["key"])
+        elif event == "wildcard_used":
+            wildcard = record["wildcard"]
+            if wildcard == "double_points":
+                session.use_double_points()
+            elif wildcard == "reveal_letter":
+                result = session.use_reveal_letter()
+                position = result[0] if result else None
+                expected = record.get("position")
+                if position != expected:
+                    mismatches.append((index, event, expected, position))
+            elif wildcard == "freeze":
+                session.use_freeze()
+        elif event in ("answer_correct", "answer_wrong", "answer_incomplete"):
+            session.check_answer(record["time"])
+        elif event == "question_skipped":
+            session.skip(record["time"])
+        elif event == "game_completed":
+            session.commit_pending_result()
+            session.complete()
+
+        if "score" in record and record["score"] != session.score:
+            mismatches.append((index, event, record["score"], session.score))
+
+    return session, mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded game session.")
+    parser.add_argument("log", help="Path to a session-*.jsonl file")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Replay N times (timing workload)"
+    )
+    args = parser.parse_args(argv)
+
+    header, events = load_session_log(args.log)
+    repeat = max(1, args.repeat)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        session, mismatches = replay_session(header, events)
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "events": len(events),
+        "recorded_duration_ms": events[-1]["t"] if events else 0,
+        "final_score": session.score,
+        "questions_answered": session.questions_answered,
+        "mismatches": mismatches,
+        "replays": repeat,
+        "replay_ms_per_run": round(elapsed * 1000 / repeat, 3),
+    }
+    print(json.dumps(report, indent=2))
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
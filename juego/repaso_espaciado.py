@@ -0,0 +1,137 @@
+import heapq
+import time
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Intervalos de Leitner por caja (en días); la caja 0 es "aprendiendo"
+LEITNER_INTERVALS_DAYS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+# Un término olvidado vuelve a aparecer tras unos minutos, no de inmediato
+RELEARN_DELAY_SECONDS = 5 * 60
+
+# Filas o términos que se cargan por consulta al rellenar la cola
+LOAD_BATCH = 200
+
+
+class SpacedReviewQueue:
+    # Solo carga lo que vence: primero los términos programados ya vencidos
+    # (consulta por índice de "due"), luego los términos nuevos del banco, por
+    # lotes y solo cuando no queda nada vencido en memoria
+
+    def __init__(self, questions, store=None, clock=time.time):
+        self.store = store
+        self.clock = clock
+        self.by_title = {}
+        for question in questions:
+            self.by_title.setdefault(question.get("title", ""), question)
+        self.titles = list(self.by_title)
+
+        # Estado por término cargado: [caja, vencimiento, repasos]
+        self.states = {}
+        self.heap = []
+        self.due_cursor = None
+        self.new_cursor = 0
+        self.reviewed = 0
+
+    # =========================================================================
+    # Carga perezosa
+    # =========================================================================
+
+    def load_row(self, row, push):
+        title = row["question"]
+        if title not in self.by_title:
+            return
+        state = self.states.get(title)
+        # Lo calificado en esta sesión manda: la fila puede ser anterior a la
+        # escritura pendiente en el hilo del almacén
+        if state is not None and state[1] != row["due"]:
+            return
+        self.states[title] = [row["box"], row["due"], row["reviews"]]
+        if push:
+            heapq.heappush(self.heap, (row["due"], title))
+
+    def refill(self, now):
+        if self.store:
+            rows = self.store.due_review_states(now, self.due_cursor, LOAD_BATCH)
+            if rows:
+                self.due_cursor = (rows[-1]["due"], rows[-1]["question"])
+                for row in rows:
+                    self.load_row(row, push=True)
+                return True
+
+        if self.new_cursor >= len(self.titles):
+            return False
+        batch = self.titles[self.new_cursor : self.new_cursor + LOAD_BATCH]
+        self.new_cursor += len(batch)
+        saved = self.store.review_states_for(batch) if self.store else {}
+        for title in batch:
+            if title in self.states:
+                continue
+            row = saved.get(title)
+            if row:
+                # Si vence más tarde la devolverá la consulta de vencidos
+                self.load_row(row, push=row["due"] <= now)
+            else:
+                self.states[title] = [0, 0.0, 0]
+                heapq.heappush(self.heap, (0.0, title))
+        return True
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    def peek(self):
+        # Descartar entradas obsoletas (el término se reprogramó después)
+        while self.heap:
+            due, title = self.heap[0]
+            if self.states[title][1] == due:
+                return due, title
+            heapq.heappop(self.heap)
+        return None
+
+    def next_due(self):
+        now = self.clock()
+        while True:
+            top = self.peek()
+            if top is not None and top[0] <= now:
+                return self.by_title[top[1]]
+            if not self.refill(now):
+                return None
+
+    def next_due_at(self):
+        candidates = []
+        top = self.peek()
+        if top is not None:
+            candidates.append(top[0])
+        if self.store:
+            for row in self.store.upcoming_review_states(self.clock()):
+                state = self.states.get(row["question"])
+                if row["question"] not in self.by_title:
+                    continue
+                if state is not None and state[1] != row["due"]:
+                    continue
+                candidates.append(row["due"])
+                break
+        return min(candidates) if candidates else None
+
+    def grade(self, question, remembered):
+        title = question.get("title", "")
+        state = self.states.get(title)
+        if state is None:
+            return None
+
+        now = self.clock()
+        box, _, reviews = state
+        if remembered:
+            box = min(box + 1, len(LEITNER_INTERVALS_DAYS) - 1)
+            due = now + LEITNER_INTERVALS_DAYS[box] * DAY_SECONDS
+        else:
+            box = 0
+            due = now + RELEARN_DELAY_SECONDS
+        state[:] = [box, due, reviews + 1]
+        heapq.heappush(self.heap, (due, title))
+        self.reviewed += 1
+
+        if self.store:
+            self.store.save_review_state(title, box, due, reviews + 1)
+        return state
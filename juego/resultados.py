@@ -0,0 +1,331 @@
+import getpass
+import queue
+import sqlite3
+import threading
+import time
+
+from juego.rutas_app import get_data_root
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student TEXT NOT NULL,
+    played_on TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    seed INTEGER,
+    total_score INTEGER NOT NULL,
+    mastery_pct REAL NOT NULL,
+    knowledge_level TEXT NOT NULL,
+    total_questions INTEGER NOT NULL,
+    questions_answered INTEGER NOT NULL,
+    questions_correct INTEGER NOT NULL,
+    questions_skipped INTEGER NOT NULL,
+    total_errors INTEGER NOT NULL,
+    highest_streak INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_results (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    was_correct INTEGER NOT NULL,
+    was_skipped INTEGER NOT NULL,
+    mistakes INTEGER NOT NULL,
+    time_taken REAL NOT NULL,
+    points_awarded INTEGER NOT NULL,
+    multiplier INTEGER NOT NULL,
+    PRIMARY KEY (session_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_student ON sessions(student, played_on);
+CREATE INDEX IF NOT EXISTS idx_sessions_played_on ON sessions(played_on);
+CREATE INDEX IF NOT EXISTS idx_results_question ON question_results(question);
+CREATE TABLE IF NOT EXISTS question_stats (
+    question TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    skips INTEGER NOT NULL,
+    mistakes INTEGER NOT NULL,
+    total_time REAL NOT NULL,
+    total_points INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS review_schedule (
+    question TEXT PRIMARY KEY,
+    box INTEGER NOT NULL,
+    due REAL NOT NULL,
+    reviews INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_review_due ON review_schedule(due);
+CREATE VIEW IF NOT EXISTS hardest_questions AS
+SELECT
+    question,
+    attempts,
+    CAST(skips AS REAL) / attempts AS skip_rate,
+    CAST(mistakes AS REAL) / attempts AS avg_mistakes,
+    total_time / attempts AS avg_time,
+    CAST(total_points AS REAL) / attempts AS avg_points
+FROM question_stats;
+"""
+
+
+def get_results_db_path():
+    return get_data_root() / "resultados.sqlite3"
+
+
+def get_default_student():
+    try:
+        return getpass.getuser() or "unknown"
+    except (KeyError, OSError, ImportError):
+        return "unknown"
+
+
+class ResultsStore:
+
+    shared_instance = None
+
+    def __init__(self, path=None):
+        self.path = path or get_results_db_path()
+        self.pending = queue.Queue()
+        # Dificultad por pregunta, leída en el hilo de escritura al abrir la base
+        # y tras cada sesión guardada; la interfaz nunca consulta SQLite para esto
+        self.difficulty = {}
+        self.difficulty_ready = threading.Event()
+        self.writer = threading.Thread(target=self.run_writer, daemon=True)
+        self.writer.start()
+
+    @classmethod
+    def shared(cls):
+        if cls.shared_instance is None:
+            cls.shared_instance = cls()
+        return cls.shared_instance
+
+    @classmethod
+    def shutdown_shared(cls, timeout=2.0):
+        if cls.shared_instance is not None:
+            cls.shared_instance.shutdown(timeout)
+            cls.shared_instance = None
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    # =========================================================================
+    # Escritura asíncrona
+    # =========================================================================
+
+    def run_writer(self):
+        # Toda la escritura ocurre en este hilo para no bloquear la interfaz
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self.connect()
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(SCHEMA)
+            self.load_difficulty(connection)
+        except (OSError, sqlite3.Error) as error:
+            print(f"Error opening results database '{self.path}': {error}")
+            connection = None
+        self.difficulty_ready.set()
+
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            if connection is None:
+                continue
+            write, args = item
+            try:
+                with connection:
+                    write(connection, *args)
+            except sqlite3.Error as error:
+                print(f"Error saving results: {error}")
+
+        if connection is not None:
+            connection.close()
+
+    def shutdown(self, timeout=2.0):
+        self.pending.put(None)
+        self.writer.join(timeout)
+
+    def record_session(self, stats, outcomes, student=None, seed=None):
+        student = student or get_default_student()
+        self.pending.put((self.insert_session, (stats, list(outcomes), student, seed)))
+
+    def insert_session(self, connection, stats, outcomes, student, seed):
+        cursor = connection.execute(
+            "INSERT INTO sessions (student, played_on, finished_at, seed, "
+            "total_score, mastery_pct, knowledge_level, total_questions, "
+            "questions_answered, questions_correct, questions_skipped, "
+            "total_errors, highest_streak) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                student,
+                time.strftime("%Y-%m-%d"),
+                time.strftime("%Y-%m-%dT%H:%M:%S"),
+                seed,
+                stats["total_score"],
+                stats["mastery_pct"],
+                stats["knowledge_level"],
+                stats["total_questions"],
+                stats["questions_answered"],
+                stats["questions_correct"],
+                stats["questions_skipped"],
+                stats["total_errors"],
+                stats["highest_streak"],
+            ),
+        )
+        session_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO question_results (session_id, position, question, "
+            "was_correct, was_skipped, mistakes, time_taken, points_awarded, "
+            "multiplier) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    position,
+                    outcome["correct_word"],
+                    int(not outcome["was_skipped"]),
+                    int(outcome["was_skipped"]),
+                    outcome.get("mistakes", 0),
+                    outcome["time_taken"],
+                    outcome["points_awarded"],
+                    outcome["multiplier"],
+                )
+                for position, outcome in enumerate(outcomes)
+            ],
+        )
+        # Agregados por pregunta para que "hardest_questions" no recorra el historial
+        connection.executemany(
+            "INSERT INTO question_stats (question, attempts, skips, mistakes, "
+            "total_time, total_points) VALUES (?, 1, ?, ?, ?, ?) "
+            "ON CONFLICT(question) DO UPDATE SET "
+            "attempts = attempts + 1, skips = skips + excluded.skips, "
+            "mistakes = mistakes + excluded.mistakes, "
+            "total_time = total_time + excluded.total_time, "
+            "total_points = total_points + excluded.total_points",
+            [
+                (
+                    outcome["correct_word"],
+                    int(outcome["was_skipped"]),
+                    outcome.get("mistakes", 0),
+                    outcome["time_taken"],
+                    outcome["points_awarded"],
+                )
+                for outcome in outcomes
+            ],
+        )
+        self.load_difficulty(connection)
+
+    def load_difficulty(self, connection):
+        cursor = connection.execute("SELECT * FROM hardest_questions")
+        names = [column[0] for column in cursor.description]
+        # Se reemplaza el diccionario entero: los lectores nunca ven uno a medias
+        self.difficulty = {row[0]: dict(zip(names, row)) for row in cursor}
+
+    def save_review_state(self, question, box, due, reviews):
+        self.pending.put((self.upsert_review_state, (question, box, due, reviews)))
+
+    def upsert_review_state(self, connection, question, box, due, reviews):
+        connection.execute(
+            "INSERT INTO review_schedule (question, box, due, reviews) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT(question) DO UPDATE SET "
+            "box = excluded.box, due = excluded.due, reviews = excluded.reviews",
+            (question, box, due, reviews),
+        )
+
+    def track(self, session, student=None):
+        # Acumula los resultados de la sesión y los guarda al completarla
+        outcomes = []
+
+        def on_event(event, data):
+            if event in ("answer_correct", "question_skipped"):
+                outcomes.append(data["result"])
+            elif event == "game_completed":
+                session.remove_listener(on_event)
+                self.record_session(data["stats"], outcomes, student, session.seed)
+
+        session.add_listener(on_event)
+        return on_event
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    def query(self, sql, params=()):
+        if not self.path.exists():
+            return []
+        connection = self.connect()
+        connection.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in connection.execute(sql, params)]
+        except sqlite3.Error as error:
+            print(f"Error querying results database: {error}")
+            return []
+        finally:
+            connection.close()
+
+    def hardest_questions(self, limit=10, min_attempts=3):
+        return self.query(
+            "SELECT * FROM hardest_questions WHERE attempts >= ? "
+            "ORDER BY skip_rate DESC, avg_mistakes DESC, avg_time DESC LIMIT ?",
+            (min_attempts, limit),
+        )
+
+    def question_difficulty(self, wait=0.5):
+        # Solo la primera partida tras abrir la base puede esperar un instante
+        self.difficulty_ready.wait(wait)
+        return self.difficulty
+
+    def due_review_states(self, until, after=None, limit=200):
+        # Vencidos hasta "until" en orden (due, question); "after" es la última
+        # fila de la página anterior
+        if after is None:
+            return self.query(
+                "SELECT question, box, due, reviews FROM review_schedule "
+                "WHERE due <= ? ORDER BY due, question LIMIT ?",
+                (until, limit),
+            )
+        last_due, last_question = after
+        return self.query(
+            "SELECT question, box, due, reviews FROM review_schedule "
+            "WHERE due <= ? AND (due > ? OR (due = ? AND question > ?)) "
+            "ORDER BY due, question LIMIT ?",
+            (until, last_due, last_due, last_question, limit),
+        )
+
+    def upcoming_review_states(self, after, limit=20):
+        return self.query(
+            "SELECT question, box, due, reviews FROM review_schedule "
+            "WHERE due > ? ORDER BY due LIMIT ?",
+            (after, limit),
+        )
+
+    def review_states_for(self, questions):
+        if not questions:
+            return {}
+        marks = ", ".join("?" * len(questions))
+        rows = self.query(
+            "SELECT question, box, due, reviews FROM review_schedule "
+            f"WHERE question IN ({marks})",
+            tuple(questions),
+        )
+        return {row["question"]: row for row in rows}
+
+    def student_sessions(self, student, limit=50):
+        return self.query(
+            "SELECT * FROM sessions WHERE student = ? "
+            "ORDER BY played_on DESC, id DESC LIMIT ?",
+            (student, limit),
+        )
+
+    def question_outcomes(self, question, limit=200):
+        return self.query(
+            "SELECT r.*, s.student, s.played_on FROM question_results r "
+            "JOIN sessions s ON s.id = r.session_id "
+            "WHERE r.question = ? ORDER BY s.played_on DESC LIMIT ?",
+            (question, limit),
+        )
+
+    def sessions_between(self, start_date, end_date):
+        return self.query(
+            "SELECT * FROM sessions WHERE played_on BETWEEN ? AND ? "
+            "ORDER BY played_on, id",
+            (start_date, end_date),
+        )
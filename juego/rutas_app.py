@@ -40,6 +40,10 @@ def get_resource_audio_dir():
     return get_resource_dir() / "audio"
 
 
+def get_resource_fonts_dir():
+    return get_resource_dir() / "fuentes"
+
+
 def get_default_questions_path():
     return get_bundle_root() / "datos" / "preguntas.json"
 
@@ -31,6 +31,14 @@ class TTSService:
         self.cachelock = threading.Lock()
         self.speakgen = 0
 
+        # Precarga en segundo plano; un solo sintetizador compartido
+        self.synth_lock = threading.Lock()
+        self.prefetch_queue = []
+        self.prefetch_thread = None
+        self.prefetch_wakeup = threading.Event()
+        self.prefetch_paused = threading.Event()
+        self.prefetch_stopped = threading.Event()
+
         # Dedicated channel for TTS (channel 2, reserved by SFXService)
         self.tts_channel = None
         self.playback_lock = threading.Lock()
@@ -85,19 +93,32 @@ class TTSService:
         self.speaking_thread.start()
 
     def speak_worker(self, text, gen):
-        wav_file = None
+        def cancelled():
+            return self.speaking_cancelled.is_set() or gen != self.speakgen
+
+        # La precarga cede el sintetizador a la definición que se quiere oír ya
+        self.prefetch_paused.set()
         try:
-            if not self.voice:
-                return
+            with self.synth_lock:
+                sound = self.synthesize(text, cancelled)
+        finally:
+            self.prefetch_paused.clear()
+            self.prefetch_wakeup.set()
+
+        if sound is not None and not cancelled():
+            self.play_sound(sound)
 
-            if self.speaking_cancelled.is_set() or gen != self.speakgen:
-                return
+    def synthesize(self, text, cancelled):
+        wav_file = None
+        try:
+            if not self.voice or cancelled():
+                return None
 
             buffer = io.BytesIO()
 
             for chunk in self.voice.synthesize(text):
-                if self.speaking_cancelled.is_set() or gen != self.speakgen:
-                    return
+                if cancelled():
+                    return None
                 if wav_file is None:
                     wav_file = wave.open(buffer, "wb")
                     wav_file.setnchannels(chunk.sample_channels)
@@ -106,31 +127,23 @@ class TTSService:
                 wav_file.writeframes(chunk.audio_int16_bytes)
 
             if wav_file is None:
-                return
+                return None
 
             wav_file.close()
             wav_file = None
 
-            if self.speaking_cancelled.is_set() or gen != self.speakgen:
-                return
+            if cancelled() or pygame is None:
+                return None
 
             # Crear sonido directamente desde el búfer de memoria
             buffer.seek(0)
-            if pygame is not None:
-                sound = pygame.mixer.Sound(file=buffer)
-
-                with self.cachelock:
-                    self.audiocache[text] = sound
-                    self.audiocacheorder.append(text)
-                    while len(self.audiocacheorder) > self.audiocachemax:
-                        viejo = self.audiocacheorder.pop(0)
-                        self.audiocache.pop(viejo, None)
-
-                if not self.speaking_cancelled.is_set() and gen == self.speakgen:
-                    self.play_sound(sound)
+            sound = pygame.mixer.Sound(file=buffer)
+            self.cache_sound(text, sound)
+            return sound
 
         except (OSError, wave.Error, RuntimeError, ValueError) as error:
             logging.exception("Failed to synthesize speech: %s", error)
+            return None
         finally:
             if wav_file is not None:
                 try:
@@ -138,6 +151,70 @@ class TTSService:
                 except wave.Error:
                     pass
 
+    def cache_sound(self, text, sound):
+        with self.cachelock:
+            if text in self.audiocache:
+                self.audiocacheorder.remove(text)
+            self.audiocache[text] = sound
+            self.audiocacheorder.append(text)
+            while len(self.audiocacheorder) > self.audiocachemax:
+                viejo = self.audiocacheorder.pop(0)
+                self.audiocache.pop(viejo, None)
+
+    def is_cached(self, text):
+        with self.cachelock:
+            return bool(text) and text.strip() in self.audiocache
+
+    # =========================================================================
+    # Precarga
+    # =========================================================================
+
+    def prefetch(self, texts):
+        # Reemplaza la lista pendiente: solo importan las vecinas de la pregunta
+        # actual, en orden de prioridad
+        texts = [t.strip() for t in texts if t and t.strip()]
+        with self.cachelock:
+            pending = [t for t in dict.fromkeys(texts) if t not in self.audiocache]
+            # No desalojar de la caché lo que se acaba de precargar
+            pending = pending[: max(0, self.audiocachemax - 1)]
+        self.prefetch_queue = pending
+        if not pending or pygame is None:
+            return
+        self.prefetch_wakeup.set()
+        if self.prefetch_thread is None or not self.prefetch_thread.is_alive():
+            self.prefetch_thread = threading.Thread(
+                target=self.prefetch_worker, daemon=True
+            )
+            self.prefetch_thread.start()
+
+    def cancel_prefetch(self):
+        self.prefetch_queue = []
+
+    def prefetch_worker(self):
+        while not self.prefetch_stopped.is_set():
+            self.prefetch_wakeup.wait()
+            self.prefetch_wakeup.clear()
+            while self.prefetch_queue and not self.prefetch_stopped.is_set():
+                if self.prefetch_paused.is_set():
+                    break
+                text = self.prefetch_queue[0]
+                if self.is_cached(text) or not self.ensure_voice_loaded():
+                    self.drop_prefetched(text)
+                    continue
+                with self.synth_lock:
+                    sound = self.synthesize(text, self.prefetch_interrupted)
+                # Si se interrumpió, se reintenta al reanudar; si falló, se descarta
+                if sound is not None or not self.prefetch_interrupted():
+                    self.drop_prefetched(text)
+
+    def drop_prefetched(self, text):
+        queue = self.prefetch_queue
+        if queue and queue[0] == text:
+            self.prefetch_queue = queue[1:]
+
+    def prefetch_interrupted(self):
+        return self.prefetch_paused.is_set() or self.prefetch_stopped.is_set()
+
     def stop(self):
         self.speaking_cancelled.set()
         try:
@@ -149,9 +226,14 @@ class TTSService:
 
     def shutdown(self):
         self.stop()
-        if self.speaking_thread is not None and self.speaking_thread.is_alive():
-            self.speaking_thread.join(timeout=1.0)
+        self.prefetch_queue = []
+        self.prefetch_stopped.set()
+        self.prefetch_wakeup.set()
+        for thread in (self.speaking_thread, self.prefetch_thread):
+            if thread is not None and thread.is_alive():
+                thread.join(timeout=1.0)
         self.speaking_thread = None
+        self.prefetch_thread = None
         with self.cachelock:
             self.audiocache.clear()
             self.audiocacheorder.clear()
@@ -0,0 +1,446 @@
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import random
+import time
+from collections import deque
+
+from juego.datos_preguntas import load_questions_file
+from juego.logica import ScoringSystem
+from juego.rutas_app import get_data_questions_path, get_default_questions_path
+
+DEFAULT_PORT = 8765
+
+# Límites por cliente para que la memoria no crezca con la duración de la clase
+MAX_LINE_BYTES = 4096
+MAX_OUTBOX = 32
+MAX_NAME_LENGTH = 32
+MAX_MISTAKES_TRACKED = 99
+# Jugadores recordados (conectados o no); al superarlo se descarta el
+# desconectado peor clasificado
+MAX_PLAYERS = 1000
+# Margen de latencia aceptado entre el tiempo del cliente y el del servidor
+TIME_TOLERANCE = 1.0
+
+LEADERBOARD_SIZE = 10
+LEADERBOARD_INTERVAL = 1.0
+
+
+class ClassroomPlayer:
+
+    __slots__ = (
+        "player_id",
+        "name",
+        "scoring",
+        "next_index",
+        "mistakes",
+        "question_started",
+        "outbox",
+        "leaderboard",
+        "wakeup",
+        "connected",
+    )
+
+    def __init__(self, player_id, name, total_questions, started):
+        self.player_id = player_id
+        self.name = name
+        self.scoring = ScoringSystem(total_questions)
+        self.next_index = 0
+        self.mistakes = 0
+        # Momento (reloj del servidor) en que quedó activa la pregunta actual
+        self.question_started = started
+        # Cola acotada: si el cliente no lee, se descartan los mensajes más viejos
+        self.outbox = deque(maxlen=MAX_OUTBOX)
+        # Solo se guarda la tabla más reciente (las anteriores ya no importan)
+        self.leaderboard = None
+        self.wakeup = asyncio.Event()
+        self.connected = True
+
+    def send(self, message):
+        self.outbox.append(message)
+        self.wakeup.set()
+
+    def offer_leaderboard(self, message):
+        self.leaderboard = message
+        self.wakeup.set()
+
+    def disconnect(self):
+        # Se conserva el puntaje; solo se liberan los mensajes pendientes
+        self.connected = False
+        self.outbox.clear()
+        self.leaderboard = None
+        self.wakeup.set()
+
+    def drain(self):
+        messages = list(self.outbox)
+        self.outbox.clear()
+        if self.leaderboard is not None:
+            messages.append(self.leaderboard)
+            self.leaderboard = None
+        self.wakeup.clear()
+        return messages
+
+
+class ClassroomHub:
+
+    def __init__(self, questions, seed=None, clock=time.monotonic):
+        self.questions = list(questions)
+        self.clock = clock
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Un solo orden de preguntas para toda la clase
+        self.order = list(range(len(self.questions)))
+        random.Random(self.seed).shuffle(self.order)
+        self.players = {}
+        self.ids = itertools.count(1)
+        self.leaderboard_version = 0
+        self.published_version = -1
+
+    # =========================================================================
+    # Jugadores
+    # =========================================================================
+
+    def join(self, name):
+        name = (str(name or "").strip() or "Player")[:MAX_NAME_LENGTH]
+        player = ClassroomPlayer(
+            next(self.ids), name, len(self.questions), self.clock()
+        )
+        self.players[player.player_id] = player
+        if len(self.players) > MAX_PLAYERS:
+            self.evict_one()
+        player.send(
+            {
+                "type": "welcome",
+                "player_id": player.player_id,
+                "seed": self.seed,
+                "questions": [self.public_question(i) for i in self.order],
+            }
+        )
+        self.leaderboard_version += 1
+        return player
+
+    def leave(self, player):
+        # Quien termina o pierde la conexión sigue en la tabla de posiciones
+        if player.connected:
+            player.disconnect()
+            self.leaderboard_version += 1
+
+    def evict_one(self):
+        offline = [p for p in self.players.values() if not p.connected]
+        if not offline:
+            return
+        worst = min(offline, key=self.rank_key)
+        del self.players[worst.player_id]
+        self.leaderboard_version += 1
+
+    def reset(self):
+        for player in self.players.values():
+            player.disconnect()
+        self.players.clear()
+        self.leaderboard_version += 1
+
+    def public_question(self, index):
+        question = self.questions[index]
+        return {
+            "index": index,
+            "definition": question.get("definition", ""),
+            "length": len(question.get("title", "").replace(" ", "")),
+            "image": question.get("image", ""),
+        }
+
+    # =========================================================================
+    # Mensajes
+    # =========================================================================
+
+    def handle_message(self, player, message):
+        kind = message.get("type")
+        if kind == "check":
+            self.handle_check(player, message)
+        elif kind == "skip":
+            self.handle_skip(player, message)
+        elif kind == "ping":
+            player.send({"type": "pong"})
+        else:
+            player.send({"type": "error", "reason": f"unknown message '{kind}'"})
+
+    def current_question(self, player, message):
+        # Las respuestas deben llegar en el orden distribuido; las repetidas se ignoran
+        if player.next_index >= len(self.order):
+            player.send({"type": "error", "reason": "game already completed"})
+            return None
+        expected = self.order[player.next_index]
+        if message.get("index") != expected:
+            player.send({"type": "error", "reason": "unexpected question index"})
+            return None
+        return self.questions[expected]
+
+    def read_time(self, player, message):
+        # El tiempo del cliente solo se acepta dentro del medido por el servidor
+        # (menos la latencia tolerada): no se puede reclamar un tiempo casi nulo
+        elapsed = max(0.0, self.clock() - player.question_started)
+        try:
+            claimed = float(message.get("time", elapsed))
+        except (TypeError, ValueError):
+            claimed = elapsed
+        if not math.isfinite(claimed):
+            claimed = elapsed
+        return min(elapsed, max(elapsed - TIME_TOLERANCE, claimed))
+
+    def handle_check(self, player, message):
+        question = self.current_question(player, message)
+        if question is None:
+            return
+        target = question.get("title", "").replace(" ", "").upper()
+        answer = str(message.get("answer", "")).replace(" ", "").upper()
+        if answer != target:
+            player.mistakes = min(MAX_MISTAKES_TRACKED, player.mistakes + 1)
+            player.send(
+                {"type": "result", "correct": False, "mistakes": player.mistakes}
+            )
+            return
+
+        result = player.scoring.process_correct_answer(
+            time_seconds=self.read_time(player, message), mistakes=player.mistakes
+        )
+        self.advance(player, result.points_earned, correct=True)
+
+    def handle_skip(self, player, message):
+        if self.current_question(player, message) is None:
+            return
+        player.scoring.process_skip(mistakes=player.mistakes)
+        self.advance(player, 0, correct=False)
+
+    def advance(self, player, points, correct):
+        player.next_index += 1
+        player.mistakes = 0
+        player.question_started = self.clock()
+        player.send(
+            {
+                "type": "result",
+                "correct": correct,
+                "points": points,
+                "total_score": player.scoring.total_score,
+                "completed": player.next_index >= len(self.order),
+            }
+        )
+        self.leaderboard_version += 1
+
+    # =========================================================================
+    # Tabla de posiciones
+    # =========================================================================
+
+    def rank_key(self, player):
+        return (player.scoring.total_score, player.next_index, -player.player_id)
+
+    def leaderboard(self, limit=LEADERBOARD_SIZE):
+        # O(n log k): no se ordena a toda la clase en cada publicación
+        top = heapq.nlargest(limit, self.players.values(), key=self.rank_key)
+        return [
+            {
+                "name": p.name,
+                "score": p.scoring.total_score,
+                "answered": p.next_index,
+                "mastery_pct": round(p.scoring.get_mastery_percentage(), 1),
+                "connected": p.connected,
+            }
+            for p in top
+        ]
+
+    def publish_leaderboard(self):
+        if self.published_version == self.leaderboard_version:
+            return False
+        self.published_version = self.leaderboard_version
+        online = [p for p in self.players.values() if p.connected]
+        message = {
+            "type": "leaderboard",
+            "players": len(self.players),
+            "online": len(online),
+            "top": self.leaderboard(),
+        }
+        for player in online:
+            player.offer_leaderboard(message)
+        return True
+
+
+class LoopbackClient:
+    # Sustituto en memoria de una conexión TCP, para pruebas y demostraciones
+
+    def __init__(self, hub, name):
+        self.hub = hub
+        self.player = hub.join(name)
+
+    def send(self, message):
+        self.hub.handle_message(self.player, message)
+
+    def receive(self):
+        return self.player.drain()
+
+    def close(self):
+        self.hub.leave(self.player)
+
+
+class ClassroomServer:
+
+    def __init__(self, hub, host="127.0.0.1", port=DEFAULT_PORT):
+        self.hub = hub
+        self.host = host
+        self.port = port
+        self.server = None
+        self.leaderboard_task = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_LINE_BYTES
+        )
+        self.leaderboard_task = asyncio.create_task(self.leaderboard_loop())
+        return self.server
+
+    async def stop(self):
+        if self.leaderboard_task:
+            self.leaderboard_task.cancel()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def leaderboard_loop(self):
+        while True:
+            await asyncio.sleep(LEADERBOARD_INTERVAL)
+            self.hub.publish_leaderboard()
+
+    async def handle_connection(self, reader, writer):
+        player = None
+        sender = None
+        try:
+            hello = await self.read_message(reader)
+            if not hello or hello.get("type") != "join":
+                return
+            player = self.hub.join(hello.get("name"))
+            sender = asyncio.create_task(self.send_loop(player, writer))
+            while player.connected:
+                message = await self.read_message(reader)
+                if message is None:
+                    break
+                self.hub.handle_message(player, message)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if player is not None:
+                self.hub.leave(player)
+            if sender is not None:
+                await asyncio.gather(sender, return_exceptions=True)
+            writer.close()
+
+    async def read_message(self, reader):
+        while True:
+            try:
+                line = await reader.readline()
+            except (asyncio.LimitOverrunError, ValueError):
+                # Línea demasiado larga: cerrar en lugar de acumular memoria
+                return None
+            if not line:
+                return None
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                return message
+
+    async def send_loop(self, player, writer):
+        while player.connected:
+            await player.wakeup.wait()
+            messages = player.drain()
+            if not messages:
+                continue
+            writer.write(
+                b"".join(
+                    json.dumps(m, separators=(",", ":")).encode("utf-8") + b"\n"
+                    for m in messages
+                )
+            )
+            await writer.drain()
+
+
+class ManualClock:
+    # Reloj que solo avanza cuando se le indica (demo sin esperas reales)
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def run_loopback_demo(hub, clients, rng):
+    # Simula una clase completa sin red y muestra la tabla final; cada alumno
+    # juega su partida completa y el reloj avanza lo que tarda en responder
+    clock = ManualClock()
+    hub.clock = clock
+    for i in range(clients):
+        client = LoopbackClient(hub, f"Student {i + 1}")
+        for index in hub.order:
+            title = hub.questions[index].get("title", "")
+            seconds = rng.uniform(3, 120)
+            clock.advance(seconds)
+            if rng.random() < 0.1:
+                client.send({"type": "skip", "index": index})
+                continue
+            while rng.random() < 0.3:
+                client.send({"type": "check", "index": index, "answer": "?"})
+            client.send(
+                {"type": "check", "index": index, "answer": title, "time": seconds}
+            )
+            client.receive()
+        client.close()
+        hub.publish_leaderboard()
+    return hub.leaderboard()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local classroom session server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--questions", help="Question bank (defaults to the app's)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--demo", type=int, metavar="N", help="Simulate N loopback clients and exit"
+    )
+    args = parser.parse_args(argv)
+
+    path = args.questions or get_data_questions_path()
+    if not args.questions and not path.exists():
+        path = get_default_questions_path()
+
+    hub = ClassroomHub(load_questions_file(path), seed=args.seed)
+    if not hub.questions:
+        print("No questions available.")
+        return 1
+
+    if args.demo:
+        board = run_loopback_demo(hub, args.demo, random.Random(hub.seed))
+        print(json.dumps(board, indent=2))
+        return 0
+
+    async def serve():
+        server = ClassroomServer(hub, args.host, args.port)
+        await server.start()
+        print(f"Classroom server listening on {args.host}:{args.port}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+import random
+
+from juego.comodines import WildcardManager
+from juego.logica import ScoringSystem
+from juego.mazo import build_deck
+
+
+class GameSession:
+
+    MAX_QUESTION_HISTORY = 50
+    DELETE_KEY = "⌫"
+
+    # Resultados de check_answer
+    CHECK_IGNORED = "ignored"
+    CHECK_INCOMPLETE = "incomplete"
+    CHECK_WRONG = "wrong"
+    CHECK_CORRECT = "correct"
+
+    def __init__(self, questions, rng=None, seed=None, deck="uniform", weights=None):
+        self.questions = list(questions)
+        # Semilla explícita para poder reproducir la sesión desde su registro
+        if rng is None and seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = rng or random.Random(seed)
+        self.listeners = []
+
+        self.scoring = ScoringSystem(len(self.questions) or 1)
+        self.wildcards = WildcardManager(rng=self.rng)
+
+        self.deck_mode = deck
+        self.deck_weights = weights
+        self.deck = build_deck(deck, self.questions, self.rng, weights)
+        self.current_question = None
+        self.current_answer = ""
+        self.question_mistakes = 0
+        self.answer_locked = False
+        self.pending_result = None
+        self.history = []
+        self.completed = False
+
+    # =========================================================================
+    # Eventos
+    # =========================================================================
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def emit(self, event, **data):
+        for callback in list(self.listeners):
+            callback(event, data)
+
+    # =========================================================================
+    # Estado
+    # =========================================================================
+
+    @property
+    def score(self):
+        return self.scoring.total_score
+
+    @property
+    def questions_answered(self):
+        return self.scoring.questions_answered
+
+    def has_questions(self):
+        return bool(self.questions)
+
+    def get_target_word(self):
+        if not self.current_question:
+            return ""
+        return self.current_question.get("title", "").replace(" ", "")
+
+    def is_answer_complete(self):
+        target_len = len(self.get_target_word())
+        ans = self.current_answer.ljust(target_len)
+        return all(ans[i].strip() for i in range(target_len))
+
+    def is_playing(self):
+        return (
+            self.current_question is not None
+            and not self.answer_locked
+            and self.pending_result is None
+        )
+
+    # =========================================================================
+    # Flujo de preguntas
+    # =========================================================================
+
+    def next_question(self):
+        self.wildcards.reset_for_new_question()
+        self.answer_locked = False
+        self.current_answer = ""
+        self.question_mistakes = 0
+
+        if not self.questions:
+            self.current_question = None
+            return None
+
+        question = self.deck.draw()
+        if question is None:
+            self.complete()
+            return None
+
+        self.current_question = question
+        self.emit("question_started", question=self.current_question)
+        return self.current_question
+
+    def complete(self):
+        if self.completed:
+            return
+        self.completed = True
+        self.current_question = None
+        self.emit("game_completed", stats=self.scoring.get_session_stats())
+
+    def commit_pending_result(self):
+        if self.pending_result:
+            self.history.append(self.pending_result)
+            # Limitar tamaño del historial para evitar crecimiento ilimitado de memoria
+            if len(self.history) > self.MAX_QUESTION_HISTORY:
+                self.history = self.history[-self.MAX_QUESTION_HISTORY :]
+        self.pending_result = None
+
+    # =========================================================================
+    # Entrada
+    # =========================================================================
+
+    def press_key(self, key):
+        if not self.is_playing():
+            return False
+
+        max_len = len(self.get_target_word())
+        revealed = self.wildcards.get_revealed_positions()
+
+        # Rellenar la respuesta actual hasta max_len con espacios para preservar posiciones
+        ans = list(self.current_answer.ljust(max_len))
+
+        if key == self.DELETE_KEY:
+            # Encontrar la última posición no revelada con contenido y limpiarla
+            for i in range(max_len - 1, -1, -1):
+                if i in revealed:
+                    continue
+                if ans[i].strip():
+                    ans[i] = " "
+                    break
+        else:
+            # Encontrar la primera posición vacía no revelada y llenarla
+            for i in range(max_len):
+                if i in revealed:
+                    continue
+                if not ans[i].strip():
+                    ans[i] = key
+                    break
+
+        # Recortar espacios finales, pero nunca por debajo de la posición revelada más alta + 1
+        min_len = (max(revealed) + 1) if revealed else 0
+        while len(ans) > min_len and not ans[-1].strip():
+            ans.pop()
+
+        self.current_answer = "".join(ans)
+        self.emit("answer_changed", answer=self.current_answer, key=key)
+        return True
+
+    # =========================================================================
+    # Comodines
+    # =========================================================================
+
+    def use_double_points(self):
+        if not self.is_playing():
+            return 0
+        stacks = self.wildcards.activate_double_points()
+        if stacks > 0:
+            self.emit(
+                "wildcard_used",
+                wildcard="double_points",
+                multiplier=self.wildcards.get_points_multiplier(),
+            )
+        return stacks
+
+    def use_reveal_letter(self):
+        if not self.is_playing():
+            return None
+        title = self.get_target_word().upper()
+        result = self.wildcards.activate_reveal_letter(self.current_answer, title)
+        if result is None:
+            return None
+
+        pos, letter = result
+        ans = list(self.current_answer.upper())
+        while len(ans) <= pos:
+            ans.append(" ")
+        ans[pos] = letter
+        self.current_answer = "".join(ans).rstrip()
+        self.emit(
+            "wildcard_used", wildcard="reveal_letter", position=pos, letter=letter
+        )
+        return result
+
+    def use_freeze(self):
+        if not self.is_playing():
+            return False
+        if not self.wildcards.activate_freeze():
+            return False
+        self.emit("wildcard_used", wildcard="freeze")
+        return True
+
+    # =========================================================================
+    # Verificar y saltar
+    # =========================================================================
+
+    def check_answer(self, time_seconds):
+        if not self.is_playing():
+            return self.CHECK_IGNORED
+        if not self.is_answer_complete():
+            self.emit("answer_incomplete", time=time_seconds)
+            return self.CHECK_INCOMPLETE
+
+        clean = self.get_target_word()
+        if self.current_answer.upper() != clean.upper():
+            self.question_mistakes += 1
+            self.emit(
+                "answer_wrong", time=time_seconds, mistakes=self.question_mistakes
+            )
+            return self.CHECK_WRONG
+
+        self.answer_locked = True
+        mult = self.wildcards.get_points_multiplier()
+        effective_time = self.scoring.get_effective_time(time_seconds)
+        raw_pts = self.scoring.calculate_raw_points(effective_time)
+        max_raw = self.scoring.max_raw_per_question
+
+        res = self.scoring.process_correct_answer(
+            time_seconds=time_seconds,
+            mistakes=self.question_mistakes,
+        )
+        pts = self.scoring.apply_wildcard_bonus(res.points_earned, mult)
+
+        # Calcular cargas ganadas
+        charges_earned, charges_max_reached = self.wildcards.calculate_earned_charges(
+            raw_pts, max_raw, self.question_mistakes, was_skipped=False
+        )
+
+        self.pending_result = self.build_result(
+            time_seconds,
+            points_awarded=pts,
+            was_skipped=False,
+            multiplier=mult,
+            charges_earned=charges_earned,
+            charges_max_reached=charges_max_reached,
+        )
+        self.emit("answer_correct", time=time_seconds, result=self.pending_result)
+        return self.CHECK_CORRECT
+
+    def skip(self, time_seconds):
+        if not self.is_playing():
+            return None
+
+        self.answer_locked = True
+        self.scoring.process_skip(mistakes=self.question_mistakes)
+
+        # Calcular cargas por saltar (para seguimiento anti-frustración)
+        charges_earned, charges_max_reached = self.wildcards.calculate_earned_charges(
+            0, 1, 0, was_skipped=True
+        )
+
+        self.pending_result = self.build_result(
+            time_seconds,
+            points_awarded=0,
+            was_skipped=True,
+            multiplier=1,
+            charges_earned=charges_earned,
+            charges_max_reached=charges_max_reached,
+        )
+        self.emit("question_skipped", time=time_seconds, result=self.pending_result)
+        return self.pending_result
+
+    def build_result(
+        self,
+        time_seconds,
+        points_awarded,
+        was_skipped,
+        multiplier,
+        charges_earned,
+        charges_max_reached,
+    ):
+        return {
+            "correct_word": self.current_question.get("title", ""),
+            "time_taken": int(time_seconds),
+            "points_awarded": points_awarded,
+            "total_score": self.scoring.total_score,
+            "question": self.current_question,
+            "answer": self.current_answer,
+            "was_skipped": was_skipped,
+            "mistakes": self.question_mistakes,
+            "multiplier": multiplier,
+            "streak": self.scoring.clean_streak,
+            "streak_multiplier": self.scoring.calculate_streak_multiplier(),
+            "charges_earned": charges_earned,
+            "charges_max_reached": charges_max_reached,
+        }
@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from juego.comodines import WildcardManager
+from juego.logica import ScoringSystem
+from juego.monitor_rendimiento import percentile
+from juego.sesion_juego import GameSession
+
+# Perfiles sintéticos de jugador:
+# tiempo medio y dispersión (s), probabilidad de error por intento,
+# probabilidad de saltar y de usar un comodín cuando hay cargas
+PLAYER_PROFILES = {
+    "novice": {
+        "mean_time": 75,
+        "time_spread": 35,
+        "mistake_rate": 0.45,
+        "skip_rate": 0.15,
+        "wildcard_rate": 0.50,
+    },
+    "average": {
+        "mean_time": 45,
+        "time_spread": 20,
+        "mistake_rate": 0.25,
+        "skip_rate": 0.05,
+        "wildcard_rate": 0.35,
+    },
+    "expert": {
+        "mean_time": 22,
+        "time_spread": 8,
+        "mistake_rate": 0.08,
+        "skip_rate": 0.01,
+        "wildcard_rate": 0.20,
+    },
+}
+
+# Constante de WildcardManager con el costo de cada comodín
+WILDCARD_COSTS = {
+    "double_points": "COST_DOUBLE_POINTS",
+    "reveal_letter": "COST_REVEAL_LETTER",
+    "freeze": "COST_FREEZE_TIMER",
+}
+
+MAX_MISTAKES_PER_QUESTION = 6
+WORD_LENGTHS = (3, 12)
+CHUNK_SIZE = 250
+
+
+def build_rules(config):
+    # Subclases con las constantes a evaluar, p. ej.
+    # {"scoring": {"SPEED_TIER_1_MAX": 30}, "wildcards": {"MAX_CHARGES": 4}}
+    config = config or {}
+    scoring_cls = type(
+        "ScoringSystem", (ScoringSystem,), dict(config.get("scoring", {}))
+    )
+    wildcard_cls = type(
+        "WildcardManager", (WildcardManager,), dict(config.get("wildcards", {}))
+    )
+    return scoring_cls, wildcard_cls
+
+
+def build_questions(rng, num_questions):
+    low, high = WORD_LENGTHS
+    return [
+        {
+            "title": "".join(
+                rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                for _ in range(rng.randint(low, high))
+            ),
+            "definition": "",
+        }
+        for _ in range(num_questions)
+    ]
+
+
+def use_random_wildcard(session, rng):
+    choice = rng.choice(("double_points", "reveal_letter", "freeze"))
+    if choice == "double_points":
+        return choice if session.use_double_points() > 0 else None
+    if choice == "reveal_letter":
+        return choice if session.use_reveal_letter() is not None else None
+    return choice if session.use_freeze() else None
+
+
+def simulate_session(profile, num_questions, config, seed):
+    rng = random.Random(seed)
+    scoring_cls, wildcard_cls = build_rules(config)
+
+    session = GameSession(build_questions(rng, num_questions), rng=rng)
+    session.scoring = scoring_cls(num_questions)
+    session.wildcards = wildcard_cls(rng=rng)
+
+    wildcards_used = Counter()
+    charges_earned = 0
+    charges_capped = 0
+
+    while session.next_question() is not None:
+        seconds = max(1.0, rng.gauss(profile["mean_time"], profile["time_spread"]))
+
+        has_charges = session.wildcards.get_charges() > 0
+        if has_charges and rng.random() < profile["wildcard_rate"]:
+            used = use_random_wildcard(session, rng)
+            if used:
+                wildcards_used[used] += 1
+                if used == "freeze":
+                    # Congelar detiene el reloj a mitad de la respuesta
+                    seconds *= 0.5
+
+        if rng.random() < profile["skip_rate"]:
+            result = session.skip(seconds)
+        else:
+            target = session.get_target_word()
+            mistakes = 0
+            while (
+                mistakes < MAX_MISTAKES_PER_QUESTION
+                and rng.random() < profile["mistake_rate"]
+            ):
+                # Respuesta completa pero incorrecta
+                session.current_answer = "#" * len(target)
+                session.check_answer(seconds)
+                mistakes += 1
+            session.current_answer = target
+            session.check_answer(seconds)
+            result = session.pending_result
+
+        charges_earned += result["charges_earned"]
+        charges_capped += int(result["charges_max_reached"])
+        session.commit_pending_result()
+
+    stats = session.scoring.get_session_stats()
+    charges_spent = sum(
+        count * getattr(session.wildcards, WILDCARD_COSTS[name])
+        for name, count in wildcards_used.items()
+    )
+    return {
+        "score": stats["total_score"],
+        "mastery_pct": stats["mastery_pct"],
+        "knowledge_level": stats["knowledge_level"],
+        "highest_streak": stats["highest_streak"],
+        "charges_earned": charges_earned,
+        "charges_capped": charges_capped,
+        "charges_spent": charges_spent,
+        "wildcards_used": dict(wildcards_used),
+    }
+
+
+def simulate_chunk(task):
+    profile_name, profile, start, count, num_questions, config, seed = task
+    return [
+        simulate_session(profile, num_questions, config, f"{seed}-{profile_name}-{i}")
+        for i in range(start, start + count)
+    ]
+
+
+def describe(values):
+    ordered = sorted(values)
+    if not ordered:
+        return {"mean": 0.0, "p5": 0.0, "p50": 0.0, "p95": 0.0}
+    return {
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p5": round(percentile(ordered, 5), 2),
+        "p50": round(percentile(ordered, 50), 2),
+        "p95": round(percentile(ordered, 95), 2),
+    }
+
+
+def summarize_profile(records):
+    total = len(records)
+    levels = Counter(r["knowledge_level"] for r in records)
+    wildcards = Counter()
+    for r in records:
+        wildcards.update(r["wildcards_used"])
+    return {
+        "sessions": total,
+        "score": describe([r["score"] for r in records]),
+        "mastery_pct": describe([r["mastery_pct"] for r in records]),
+        "highest_streak": describe([r["highest_streak"] for r in records]),
+        "charges_earned": describe([r["charges_earned"] for r in records]),
+        "charges_spent": describe([r["charges_spent"] for r in records]),
+        "charges_capped": describe([r["charges_capped"] for r in records]),
+        "wildcards_used": {
+            name: round(count / total, 3) for name, count in sorted(wildcards.items())
+        },
+        "knowledge_level": {
+            level: round(count / total, 3) for level, count in levels.most_common()
+        },
+    }
+
+
+def run_simulation(
+    config=None,
+    profiles=None,
+    sessions=1000,
+    num_questions=15,
+    workers=None,
+    seed=0,
+):
+    profiles = profiles or PLAYER_PROFILES
+    tasks = []
+    for name, profile in profiles.items():
+        for start in range(0, sessions, CHUNK_SIZE):
+            count = min(CHUNK_SIZE, sessions - start)
+            tasks.append((name, profile, start, count, num_questions, config, seed))
+
+    records = {name: [] for name in profiles}
+    if workers == 1:
+        results = list(map(simulate_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, tasks))
+    for task, chunk in zip(tasks, results):
+        records[task[0]].extend(chunk)
+
+    return {
+        "config": config or {},
+        "num_questions": num_questions,
+        "seed": seed,
+        "profiles": {name: summarize_profile(recs) for name, recs in records.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo simulation of scoring and wildcard charges."
+    )
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--questions", type=int, default=15)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", help="JSON file with constant overrides")
+    parser.add_argument("--profile", action="append", choices=sorted(PLAYER_PROFILES))
+    args = parser.parse_args(argv)
+
+    config = None
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as file:
+            config = json.load(file)
+
+    profiles = None
+    if args.profile:
+        profiles = {name: PLAYER_PROFILES[name] for name in args.profile}
+
+    report = run_simulation(
+        config=config,
+        profiles=profiles,
+        sessions=max(1, args.sessions),
+        num_questions=max(1, args.questions),
+        workers=max(1, args.workers or 1),
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+import tkinter as tk
+
+import customtkinter as ctk
+
+from juego.fila_respuestas import rounded_rect_points
+
+
+class KeyboardCanvas(tk.Canvas):
+
+    DELETE_KEY = "⌫"
+    CORNER_RADIUS = 8
+    BORDER_WIDTH = 2
+    HOVER_COOLDOWN_MS = 80
+
+    def __init__(
+        self, master, layout, command, colors, font, delete_icon=None, sfx=None
+    ):
+        super().__init__(
+            master,
+            width=1,
+            height=1,
+            bg=colors["bg_light"],
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        self.layout = layout
+        self.command = command
+        self.colors = colors
+        self.font = font
+        self.delete_icon = delete_icon
+        self.delete_photo = None
+        self.sfx = sfx
+
+        # Tecla -> elementos del lienzo y colores de cada estado
+        self.keys = {}
+        # Filas para la detección de impactos: (y0, y1, [(tecla, x0, x1)])
+        self.row_bounds = []
+        self.metrics = None
+
+        self.enabled = True
+        self.hovered_key = None
+        self.mouse_key = None
+        self.pressed_keys = set()
+
+        self.bind("<Motion>", self.on_motion)
+        self.bind("<Leave>", self.on_leave)
+        self.bind("<ButtonPress-1>", self.on_button_press)
+        self.bind("<ButtonRelease-1>", self.on_button_release)
+
+    # =========================================================================
+    # Dibujo
+    # =========================================================================
+
+    def get_scaling(self):
+        try:
+            return ctk.ScalingTracker.get_widget_scaling(self)
+        except (AttributeError, KeyError, tk.TclError):
+            return 1.0
+
+    def get_font_spec(self, scaling):
+        if isinstance(self.font, ctk.CTkFont):
+            return self.font.create_scaled_tuple(scaling)
+        return self.font
+
+    def get_delete_photo(self, scaling):
+        if self.delete_icon is None:
+            return None
+        mode = "dark" if ctk.get_appearance_mode() == "Dark" else "light"
+        try:
+            return self.delete_icon.create_scaled_photo_image(scaling, mode)
+        except (AttributeError, tk.TclError):
+            return None
+
+    def set_metrics(
+        self, key_size, key_width, delete_width, key_gap, row_gap, icon_size=None
+    ):
+        scaling = self.get_scaling()
+        metrics = (
+            key_size,
+            key_width,
+            delete_width,
+            key_gap,
+            row_gap,
+            icon_size,
+            scaling,
+            self.get_font_spec(scaling),
+        )
+        # Un cambio de tamaño sin efecto no debe redibujar el teclado
+        if metrics == self.metrics:
+            return
+        self.metrics = metrics
+        self.redraw()
+
+    def redraw(self):
+        if not self.metrics:
+            return
+        key_size, key_width, delete_width, key_gap, row_gap, _, scaling, font_spec = (
+            self.metrics
+        )
+
+        key_px = max(1, round(key_size * scaling))
+        key_w_px = max(1, round(key_width * scaling))
+        delete_w_px = max(1, round(delete_width * scaling))
+        pad_x = round((key_gap // 2) * scaling)
+        row_pad = round(row_gap * scaling)
+        border = max(1, round(self.BORDER_WIDTH * scaling))
+        radius = self.CORNER_RADIUS * scaling
+        self.delete_photo = self.get_delete_photo(scaling)
+
+        row_widths = []
+        for row_keys in self.layout:
+            widths = [
+                delete_w_px if key == self.DELETE_KEY else key_w_px for key in row_keys
+            ]
+            row_widths.append(sum(w + pad_x * 2 for w in widths))
+        total_width = max(row_widths) if row_widths else 1
+        row_pitch = key_px + row_pad * 2
+
+        self.delete("all")
+        self.keys.clear()
+        self.row_bounds = []
+
+        for row_idx, row_keys in enumerate(self.layout):
+            y0 = row_idx * row_pitch + row_pad
+            y1 = y0 + key_px
+            x = (total_width - row_widths[row_idx]) / 2
+            hits = []
+            for key in row_keys:
+                is_del = key == self.DELETE_KEY
+                w = delete_w_px if is_del else key_w_px
+                x0 = x + pad_x
+                x1 = x0 + w
+                inset = border / 2
+                box_id = self.create_polygon(
+                    *rounded_rect_points(
+                        x0 + inset, y0 + inset, x1 - inset, y1 - inset, radius
+                    ),
+                    smooth=True,
+                    outline=self.colors["header_bg"],
+                    width=border,
+                )
+                cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+                if is_del and self.delete_photo:
+                    label_id = self.create_image(cx, cy, image=self.delete_photo)
+                    is_text = False
+                else:
+                    label_id = self.create_text(cx, cy, text=key, font=font_spec)
+                    is_text = True
+
+                self.keys[key] = {
+                    "box": box_id,
+                    "label": label_id,
+                    "is_text": is_text,
+                    "fg": (
+                        self.colors["danger_red"] if is_del else self.colors["key_bg"]
+                    ),
+                    "hover": (
+                        self.colors["danger_hover"]
+                        if is_del
+                        else self.colors["key_hover"]
+                    ),
+                    "pressed": (
+                        self.colors["danger_hover"]
+                        if is_del
+                        else self.colors["key_pressed"]
+                    ),
+                    "text": "white" if is_del else self.colors["text_dark"],
+                }
+                self.apply_key_style(key)
+                hits.append((key, x0, x1))
+                x = x1 + pad_x
+            self.row_bounds.append((y0, y1, hits))
+
+        self.configure(width=total_width, height=len(self.layout) * row_pitch)
+
+    def apply_key_style(self, key):
+        info = self.keys.get(key)
+        if not info:
+            return
+        if key in self.pressed_keys:
+            fill = info["pressed"]
+        elif self.enabled and key == self.hovered_key:
+            fill = info["hover"]
+        else:
+            fill = info["fg"]
+        try:
+            self.itemconfigure(info["box"], fill=fill)
+            if info["is_text"]:
+                text_color = (
+                    info["text"] if self.enabled else self.colors["key_text_disabled"]
+                )
+                self.itemconfigure(info["label"], fill=text_color)
+        except tk.TclError:
+            pass
+
+    # =========================================================================
+    # Estado
+    # =========================================================================
+
+    def has_key(self, key):
+        return key in self.keys
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if not enabled:
+            self.pressed_keys.clear()
+            self.mouse_key = None
+        for key in self.keys:
+            self.apply_key_style(key)
+
+    def set_pressed(self, key, pressed):
+        if key not in self.keys:
+            return
+        if pressed:
+            self.pressed_keys.add(key)
+        else:
+            self.pressed_keys.discard(key)
+        self.apply_key_style(key)
+
+    # =========================================================================
+    # Eventos del ratón
+    # =========================================================================
+
+    def key_at(self, x, y):
+        for y0, y1, hits in self.row_bounds:
+            if y0 <= y < y1:
+                for key, x0, x1 in hits:
+                    if x0 <= x < x1:
+                        return key
+                return None
+        return None
+
+    def on_motion(self, event):
+        key = self.key_at(event.x, event.y)
+        if key == self.hovered_key:
+            return
+        previous = self.hovered_key
+        self.hovered_key = key
+        self.apply_key_style(previous)
+        self.apply_key_style(key)
+        if key and self.enabled and self.sfx:
+            self.sfx.play(
+                "hover", cooldown_ms=self.HOVER_COOLDOWN_MS, stop_previous=True
+            )
+
+    def on_leave(self, _event):
+        previous = self.hovered_key
+        self.hovered_key = None
+        self.apply_key_style(previous)
+
+    def on_button_press(self, event):
+        if not self.enabled:
+            return
+        key = self.key_at(event.x, event.y)
+        if key is None:
+            return
+        self.mouse_key = key
+        self.set_pressed(key, True)
+
+    def on_button_release(self, event):
+        key = self.mouse_key
+        self.mouse_key = None
+        if key is None:
+            return
+        self.set_pressed(key, False)
+        # Igual que un botón: solo se activa si se suelta sobre la misma tecla
+        if not self.enabled or self.key_at(event.x, event.y) != key:
+            return
+        if self.sfx:
+            self.sfx.play("click", stop_previous=True, volume=0.8)
+        if self.command:
+            self.command(key)
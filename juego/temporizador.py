@@ -0,0 +1,80 @@
+import math
+import time
+import tkinter as tk
+
+
+class GameTimer:
+
+    # Margen para que el repintado caiga justo después del cambio de segundo
+    BOUNDARY_SLACK_MS = 5
+
+    def __init__(self, widget, on_tick=None, clock=time.monotonic):
+        self.widget = widget
+        self.on_tick = on_tick
+        self.clock = clock
+
+        # Tiempo de los segmentos ya cerrados (pausas por congelamiento, etc.)
+        self.accumulated = 0.0
+        self.segment_start = None
+        self.job = None
+        self.last_whole = 0
+
+    def is_running(self):
+        return self.segment_start is not None
+
+    def elapsed(self):
+        if self.segment_start is None:
+            return self.accumulated
+        return self.accumulated + (self.clock() - self.segment_start)
+
+    def elapsed_seconds(self):
+        return int(self.elapsed())
+
+    def reset(self):
+        self.cancel_job()
+        self.accumulated = 0.0
+        self.segment_start = None
+        self.last_whole = 0
+
+    def resume(self):
+        if self.segment_start is not None:
+            return
+        self.segment_start = self.clock()
+        self.schedule_repaint()
+
+    def pause(self):
+        if self.segment_start is None:
+            return
+        self.accumulated += self.clock() - self.segment_start
+        self.segment_start = None
+        self.cancel_job()
+
+    def cancel_job(self):
+        if self.job:
+            try:
+                self.widget.after_cancel(self.job)
+            except tk.TclError:
+                pass
+            self.job = None
+
+    def schedule_repaint(self):
+        self.cancel_job()
+        elapsed = self.elapsed()
+        # Programar el siguiente repintado en el próximo límite de segundo
+        next_boundary = math.floor(elapsed) + 1
+        delay = int((next_boundary - elapsed) * 1000) + self.BOUNDARY_SLACK_MS
+        try:
+            self.job = self.widget.after(max(1, delay), self.on_repaint)
+        except tk.TclError:
+            self.job = None
+
+    def on_repaint(self):
+        self.job = None
+        if self.segment_start is None:
+            return
+        whole = self.elapsed_seconds()
+        if whole != self.last_whole:
+            self.last_whole = whole
+            if self.on_tick:
+                self.on_tick(whole)
+        self.schedule_repaint()
@@ -3,7 +3,10 @@ import threading
 
 import customtkinter as ctk
 
+from juego.fuentes import FontPool
 from juego.interfaz import AppController
+from juego.monitor_rendimiento import PerformanceMonitor
+from juego.resultados import ResultsStore
 from juego.rutas_app import ensure_user_data, get_resource_audio_dir
 from juego.servicio_sfx import HoverSoundBinder, SFXService
 from juego.servicio_tts import TTSService
@@ -29,6 +32,9 @@ root.grid_columnconfigure(0, weight=1)
 root.configure(fg_color="#F5F7FA")
 
 ensure_user_data()
+FontPool.shared().load_bundled_fonts()
+# Abrir la base de resultados ya: su hilo carga la dificultad antes de la partida
+ResultsStore.shared()
 AUDIO_DIR = get_resource_audio_dir()
 
 tts_service = TTSService(AUDIO_DIR)
@@ -41,6 +47,7 @@ def limpiar_al_salir():
     hover_binder.unbind_events()
     sfx_service.shutdown()
     tts_service.shutdown()
+    ResultsStore.shutdown_shared()
 
 
 atexit.register(limpiar_al_salir)
@@ -58,6 +65,9 @@ def iniciarprecarga():
 
 root.after(120, iniciarprecarga)
 
+# Monitor de latencia opcional (TRIVIA_PERF_MONITOR=1; F12 muestra la superposición)
+PerformanceMonitor.install(root)
+
 app = AppController(root, tts_service=tts_service, sfx_service=sfx_service)
 
 root.mainloop()
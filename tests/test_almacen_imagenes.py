@@ -0,0 +1,34 @@
+from juego.almacen_imagenes import INDEX_NAME, ImageStore
+
+
+def stored_files(root):
+    return sorted(p.name for p in root.iterdir() if p.name != INDEX_NAME)
+
+
+def test_same_bytes_with_another_suffix_reuse_the_indexed_file(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    first = source_dir / "photo.jpg"
+    second = source_dir / "copy.jpeg"
+    first.write_bytes(b"same image bytes")
+    second.write_bytes(b"same image bytes")
+
+    store = ImageStore(tmp_path / "imagenes")
+    stored = store.put_file(first)
+    again = store.put_file(second)
+    from_bytes = store.put_bytes(b"same image bytes", ".JPEG", name="bytes")
+
+    assert again == stored and from_bytes == stored
+    assert stored_files(store.root) == [stored.name]
+    (entry,) = store.load_index()["images"].values()
+    assert entry["file"] == stored.name
+
+
+def test_missing_indexed_file_is_written_again(tmp_path):
+    store = ImageStore(tmp_path / "imagenes")
+    stored = store.put_bytes(b"image", ".png")
+    stored.unlink()
+
+    restored = store.put_bytes(b"image", ".jpg")
+    assert restored.exists()
+    assert store.load_index()["images"][restored.stem]["file"] == restored.name
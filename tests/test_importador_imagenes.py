@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+
+from juego.importador_imagenes import (
+    ImageImportError,
+    ImageImportJob,
+    ImportCancelled,
+)
+
+
+class FailingHandler:
+
+    def __init__(self, error):
+        self.error = error
+        self.invalidated_on = []
+
+    def invalidate_image_paths(self):
+        self.invalidated_on.append(threading.current_thread())
+
+    def import_image(self, source_path, progress=None):
+        progress(0.5, "Decoding...")
+        raise self.error
+
+
+def run_job(error):
+    job = ImageImportJob(FailingHandler(error), "photo.jpg").start()
+    job.thread.join(5)
+    updates = job.poll()
+    return job, updates
+
+
+@pytest.mark.parametrize(
+    "error", [ValueError("bad header"), MemoryError(), KeyError("store")]
+)
+def test_unexpected_errors_still_finish_the_job(error):
+    job, updates = run_job(error)
+    assert updates == [(0.5, "Decoding...")]
+    assert job.done
+    assert job.destination is None
+    assert job.error.startswith("Unable to import the image.")
+    # La caché de rutas solo se toca desde el hilo que consulta poll()
+    assert job.image_handler.invalidated_on == [threading.current_thread()]
+
+
+def test_known_outcomes_finish_the_job():
+    job, _ = run_job(ImageImportError("Unsupported format"))
+    assert job.done and job.error == "Unsupported format"
+
+    job, _ = run_job(OSError("disk full"))
+    assert job.done and job.error.startswith("Unable to save the image.")
+
+    job, _ = run_job(ImportCancelled())
+    assert job.done and job.error is None and job.destination is None
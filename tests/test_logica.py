@@ -0,0 +1,90 @@
+import itertools
+import random
+
+import pytest
+
+from juego.logica import ScoringSystem
+
+pytest.importorskip("numpy")
+
+# Cuántas preguntas tiene la sesión: cubre BASE_MIN, el valor de referencia y BASE_MAX
+QUESTION_COUNTS = (1, 7, 15, 40)
+
+
+def boundary_times():
+    grace = ScoringSystem.GRACE_PERIOD_SECONDS
+    edges = [0, grace]
+    for tier in (
+        ScoringSystem.SPEED_TIER_1_MAX,
+        ScoringSystem.SPEED_TIER_2_MAX,
+        ScoringSystem.SPEED_TIER_3_MAX,
+    ):
+        edges.append(grace + tier)
+    times = [-30.0, -1e-9, 1e-9, 1e6]
+    for edge in edges:
+        times.extend((edge - 1e-9, edge, edge + 1e-9, edge - 0.5, edge + 0.5))
+    return times
+
+
+def scalar_score(total_questions, time_seconds, mistakes, prior_streak, multiplier):
+    scoring = ScoringSystem(total_questions)
+    scoring.clean_streak = prior_streak
+    raw = scoring.calculate_raw_points(scoring.get_effective_time(time_seconds))
+    result = scoring.process_correct_answer(time_seconds, mistakes)
+    return raw, scoring.apply_wildcard_bonus(result.points_earned, multiplier)
+
+
+def assert_batch_matches(total_questions, rows):
+    times, mistakes, streaks, multipliers = (list(column) for column in zip(*rows))
+    expected = [scalar_score(total_questions, *row) for row in rows]
+    expected_raw = [raw for raw, _ in expected]
+    expected_awarded = [awarded for _, awarded in expected]
+
+    scoring = ScoringSystem(total_questions)
+    raw, awarded = scoring.score_batch(times, mistakes, streaks, multipliers)
+    assert raw.tolist() == expected_raw
+    assert awarded.tolist() == expected_awarded
+
+    raw, awarded = scoring.score_batch_python(times, mistakes, streaks, multipliers)
+    assert raw == expected_raw
+    assert awarded == expected_awarded
+
+
+@pytest.mark.parametrize("total_questions", QUESTION_COUNTS)
+def test_batch_matches_scalar_on_random_rows(total_questions):
+    rng = random.Random(total_questions)
+    rows = [
+        (
+            rng.choice((rng.uniform(-10, 250), float(rng.randint(0, 200)))),
+            rng.choice((0, 0, 0, 1, 2, rng.randint(0, 15))),
+            rng.randint(0, 14),
+            rng.choice((1, 1, 2, 4, 8)),
+        )
+        for _ in range(5000)
+    ]
+    assert_batch_matches(total_questions, rows)
+
+
+@pytest.mark.parametrize("total_questions", QUESTION_COUNTS)
+def test_batch_matches_scalar_on_boundaries(total_questions):
+    streak_edges = (
+        0,
+        ScoringSystem.STREAK_MAX_LEVEL - 1,
+        ScoringSystem.STREAK_MAX_LEVEL,
+        ScoringSystem.STREAK_MAX_LEVEL + 1,
+    )
+    rows = list(
+        itertools.product(
+            boundary_times(), (-1, 0, 1, 10, 100), streak_edges, (0, 1, 2, 3)
+        )
+    )
+    assert_batch_matches(total_questions, rows)
+
+
+def test_batch_defaults_match_fresh_scalar_answers():
+    times = [0, 12.5, 45, 85.25, 200]
+    mistakes = [0, 1, 0, 3, 0]
+    raw, awarded = ScoringSystem(15).score_batch(times, mistakes)
+    expected = [scalar_score(15, t, m, 0, 1) for t, m in zip(times, mistakes)]
+    assert raw.tolist() == [r for r, _ in expected]
+    assert awarded.tolist() == [a for _, a in expected]
@@ -0,0 +1,60 @@
+import os
+import time
+
+from PIL import Image
+
+from juego import miniaturas
+from juego.miniaturas import ThumbnailStore
+
+
+def make_sources(directory, count):
+    directory.mkdir()
+    paths = []
+    for index in range(count):
+        path = directory / f"photo-{index}.png"
+        Image.effect_noise((300, 300), 40 + index).convert("RGB").save(path)
+        paths.append(path)
+    return paths
+
+
+def test_disk_cache_trims_least_recently_used(tmp_path, monkeypatch):
+    store = ThumbnailStore(tmp_path / "cache")
+    sources = make_sources(tmp_path / "src", 12)
+
+    store.get(sources[0], (100, 100))
+    one = next(store.cache_dir.glob("*.png")).stat().st_size
+    monkeypatch.setattr(miniaturas, "DISK_CACHE_MAX_BYTES", one * 6)
+    monkeypatch.setattr(miniaturas, "DISK_CACHE_TRIM_BYTES", one * 4)
+
+    kept = store.cache_path(sources[0], 128)
+    for index, source in enumerate(sources[1:]):
+        past = time.time() - 1000 + index
+        for cached in store.cache_dir.glob("*.png"):
+            os.utime(cached, (past, past))
+        # Reusar la primera la mantiene como la más reciente
+        store.get(sources[0], (100, 100))
+        store.get(source, (100, 100))
+
+    files = list(store.cache_dir.glob("*.png"))
+    assert len(files) <= 6
+    assert kept.exists()
+    assert store.disk_bytes == sum(path.stat().st_size for path in files)
+
+
+def test_warm_queues_entries_while_a_worker_runs(tmp_path):
+    store = ThumbnailStore(tmp_path / "cache")
+    sources = make_sources(tmp_path / "src", 8)
+
+    store.warm([(path, None) for path in sources[:4]], (100, 100))
+    store.warm([(path, None) for path in sources[4:]], (100, 100))
+    store.warm([(path, None) for path in sources], (400, 400))
+    for _ in range(500):
+        thread = store.warm_thread
+        if thread is None:
+            break
+        thread.join(0.05)
+
+    for path in sources:
+        assert store.cache_path(path, 128).exists()
+        assert store.cache_path(path, 512).exists()
+    assert not store.warm_queue and not store.warm_queued
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from juego.registro_sesion import SessionRecorder, load_session_log, replay_session
+from juego.sesion_juego import GameSession
+from juego.simulador import build_questions
+
+SESSIONS = 300
+
+
+def play_random_session(session, rng):
+    # Jugador aleatorio que usa todo lo que el registro debe reproducir
+    results = []
+    while session.next_question() is not None:
+        elapsed = rng.uniform(0.5, 180.0)
+        if rng.random() < 0.3:
+            rng.choice(
+                (
+                    session.use_double_points,
+                    session.use_reveal_letter,
+                    session.use_freeze,
+                )
+            )()
+
+        if rng.random() < 0.1:
+            session.skip(elapsed)
+        else:
+            target = session.get_target_word()
+            for _ in range(rng.randint(0, 2)):
+                for letter in rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=len(target)):
+                    session.press_key(letter)
+                elapsed += rng.uniform(0.0, 20.0)
+                session.check_answer(elapsed)
+                for _ in range(len(target)):
+                    session.press_key(GameSession.DELETE_KEY)
+            answer = session.current_answer.ljust(len(target))
+            for position, letter in enumerate(target):
+                if not answer[position].strip():
+                    session.press_key(letter)
+            session.check_answer(elapsed)
+
+        results.append(session.pending_result)
+        session.commit_pending_result()
+    return results
+
+
+@pytest.mark.parametrize("deck", ["uniform", "weighted"])
+def test_replay_matches_recorded_sessions(tmp_path, deck):
+    for index in range(SESSIONS):
+        rng = random.Random(f"{deck}-{index}")
+        questions = build_questions(rng, rng.randint(1, 20))
+        session = GameSession(questions, seed=rng.randrange(2**32), deck=deck)
+        recorder = SessionRecorder(session, tmp_path / f"session-{deck}-{index}.jsonl")
+
+        results = play_random_session(session, rng)
+        recorder.close()
+
+        header, events = load_session_log(recorder.path)
+        replayed, mismatches = replay_session(header, events)
+
+        assert mismatches == []
+        assert replayed.score == session.score
+        assert replayed.questions_answered == session.questions_answered
+        replayed.commit_pending_result()
+        expected = [
+            (r["points_awarded"], r["was_skipped"], r["multiplier"]) for r in results
+        ]
+        actual = [
+            (r["points_awarded"], r["was_skipped"], r["multiplier"])
+            for r in replayed.history[-len(results) :]
+        ]
+        assert actual == expected
@@ -0,0 +1,122 @@
+import pytest
+
+from juego.repaso_espaciado import (
+    DAY_SECONDS,
+    LOAD_BATCH,
+    RELEARN_DELAY_SECONDS,
+    SpacedReviewQueue,
+)
+from juego.resultados import ResultsStore
+
+NOW = 1_000_000.0
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = NOW
+
+    def __call__(self):
+        return self.now
+
+
+class CountingStore:
+    # Envoltorio que cuenta cuántas filas devuelve el almacén real
+
+    def __init__(self, store):
+        self.store = store
+        self.rows = 0
+
+    def count(self, rows):
+        self.rows += len(rows)
+        return rows
+
+    def due_review_states(self, *args):
+        return self.count(self.store.due_review_states(*args))
+
+    def upcoming_review_states(self, *args):
+        return self.count(self.store.upcoming_review_states(*args))
+
+    def review_states_for(self, questions):
+        rows = self.store.review_states_for(questions)
+        self.count(list(rows))
+        return rows
+
+    def save_review_state(self, *args):
+        self.store.save_review_state(*args)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(tmp_path / "resultados.sqlite3")
+    yield store
+    store.shutdown(timeout=60)
+
+
+def seed_schedule(store, rows):
+    for title, box, due in rows:
+        store.save_review_state(title, box, due, 1)
+    store.shutdown(timeout=60)
+
+
+def questions_for(titles):
+    return [{"title": title, "definition": title} for title in titles]
+
+
+def test_only_due_rows_are_loaded(store):
+    scheduled = [f"FUTURE{i}" for i in range(2000)]
+    overdue = [f"OVERDUE{i}" for i in range(5)]
+    seed_schedule(
+        store,
+        [(title, 3, NOW + DAY_SECONDS) for title in scheduled]
+        + [(title, 1, NOW - 60 * (i + 1)) for i, title in enumerate(overdue)],
+    )
+    counting = CountingStore(store)
+    queue = SpacedReviewQueue(
+        questions_for(scheduled + overdue), counting, clock=Clock()
+    )
+
+    first = queue.next_due()
+    assert first["title"] == "OVERDUE4"
+    assert counting.rows == len(overdue)
+    assert len(queue.states) == len(overdue)
+
+
+def test_new_terms_follow_overdue_ones_in_batches(store):
+    seed_schedule(store, [("OLD", 2, NOW - 10)])
+    titles = ["OLD"] + [f"NEW{i}" for i in range(LOAD_BATCH * 2)]
+    queue = SpacedReviewQueue(questions_for(titles), store, clock=Clock())
+
+    seen = []
+    question = queue.next_due()
+    while question is not None and len(seen) < 3:
+        seen.append(question["title"])
+        queue.grade(question, True)
+        question = queue.next_due()
+    assert seen[0] == "OLD"
+    assert queue.new_cursor == LOAD_BATCH
+
+
+def test_relearn_comes_back_after_delay():
+    clock = Clock()
+    queue = SpacedReviewQueue(questions_for(["ONLY"]), clock=clock)
+
+    question = queue.next_due()
+    queue.grade(question, False)
+    assert queue.next_due() is None
+    assert queue.next_due_at() == NOW + RELEARN_DELAY_SECONDS
+
+    clock.now += RELEARN_DELAY_SECONDS
+    assert queue.next_due()["title"] == "ONLY"
+
+
+def test_session_grades_override_stale_rows(store):
+    clock = Clock()
+    seed_schedule(store, [("TERM", 1, NOW - 5)])
+    queue = SpacedReviewQueue(questions_for(["TERM"]), store, clock=clock)
+
+    question = queue.next_due()
+    # El almacén ya está cerrado: la fila en disco sigue vencida
+    queue.grade(question, True)
+    assert queue.next_due() is None
+    assert queue.next_due_at() == NOW + 2 * DAY_SECONDS
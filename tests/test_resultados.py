@@ -0,0 +1,47 @@
+from juego.resultados import ResultsStore
+
+STATS = {
+    "total_score": 100,
+    "mastery_pct": 50.0,
+    "knowledge_level": "Student",
+    "total_questions": 2,
+    "questions_answered": 2,
+    "questions_correct": 1,
+    "questions_skipped": 1,
+    "total_errors": 3,
+    "highest_streak": 1,
+}
+
+
+def outcome(word, skipped, mistakes):
+    return {
+        "correct_word": word,
+        "was_skipped": skipped,
+        "mistakes": mistakes,
+        "time_taken": 30,
+        "points_awarded": 0 if skipped else 100,
+        "multiplier": 1,
+    }
+
+
+def test_difficulty_is_served_from_the_writer_thread(tmp_path, monkeypatch):
+    path = tmp_path / "resultados.sqlite3"
+    store = ResultsStore(path)
+    assert store.question_difficulty() == {}
+
+    store.record_session(
+        STATS, [outcome("PHISHING", False, 3), outcome("MALWARE", True, 0)], "ana"
+    )
+    store.shutdown(timeout=10)
+
+    # Ninguna consulta síncrona desde el hilo que pide la dificultad
+    monkeypatch.setattr(store, "query", None)
+    difficulty = store.question_difficulty()
+    assert difficulty["PHISHING"]["avg_mistakes"] == 3
+    assert difficulty["MALWARE"]["skip_rate"] == 1
+
+    reopened = ResultsStore(path)
+    try:
+        assert reopened.question_difficulty(wait=5).keys() == difficulty.keys()
+    finally:
+        reopened.shutdown()
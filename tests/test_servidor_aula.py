@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from juego import servidor_aula
+from juego.logica import ScoringSystem
+from juego.servidor_aula import ClassroomHub, ClassroomServer, ManualClock
+
+QUESTIONS = [
+    {"title": "PHISHING", "definition": "a"},
+    {"title": "FIREWALL", "definition": "b"},
+    {"title": "MALWARE", "definition": "c"},
+]
+
+
+def make_hub():
+    clock = ManualClock()
+    return ClassroomHub(QUESTIONS, seed=7, clock=clock), clock
+
+
+def answer(hub, player, time_seconds):
+    index = hub.order[player.next_index]
+    hub.handle_message(
+        player,
+        {
+            "type": "check",
+            "index": index,
+            "answer": QUESTIONS[index]["title"],
+            "time": time_seconds,
+        },
+    )
+
+
+def expected_points(time_seconds):
+    scoring = ScoringSystem(len(QUESTIONS))
+    return scoring.process_correct_answer(time_seconds, mistakes=0).points_earned
+
+
+def test_claimed_time_is_clamped_to_server_elapsed():
+    hub, clock = make_hub()
+    fast, slow = hub.join("fast"), hub.join("slow")
+    clock.advance(40)
+
+    answer(hub, fast, 0.01)
+    answer(hub, slow, 500)
+
+    tolerance = servidor_aula.TIME_TOLERANCE
+    assert fast.scoring.total_score == expected_points(40 - tolerance)
+    assert slow.scoring.total_score == expected_points(40)
+
+
+def test_elapsed_restarts_with_each_question():
+    hub, clock = make_hub()
+    player = hub.join("student")
+    clock.advance(90)
+    answer(hub, player, 90)
+    clock.advance(5)
+    assert hub.read_time(player, {"time": 0}) == 5 - servidor_aula.TIME_TOLERANCE
+    assert hub.read_time(player, {"time": "nan"}) == 5
+    assert hub.read_time(player, {}) == 5
+
+
+def test_disconnected_players_stay_on_the_leaderboard():
+    hub, clock = make_hub()
+    finished, online = hub.join("finished"), hub.join("online")
+    for _ in QUESTIONS:
+        clock.advance(10)
+        answer(hub, finished, 10)
+    hub.leave(finished)
+
+    assert hub.publish_leaderboard()
+    names = [row["name"] for row in hub.leaderboard()]
+    assert names == ["finished", "online"]
+    assert finished.drain() == []
+    board = online.drain()[-1]
+    assert board["players"] == 2 and board["online"] == 1
+
+    hub.reset()
+    assert hub.leaderboard() == []
+
+
+def test_eviction_only_drops_disconnected_players(monkeypatch):
+    monkeypatch.setattr(servidor_aula, "MAX_PLAYERS", 2)
+    hub, clock = make_hub()
+    first, second = hub.join("first"), hub.join("second")
+    clock.advance(10)
+    answer(hub, second, 10)
+    hub.leave(first)
+    hub.leave(second)
+
+    hub.join("third")
+    assert [p.name for p in hub.players.values()] == ["second", "third"]
+    hub.join("fourth")
+    assert len(hub.players) == 2
+
+
+def test_tcp_disconnect_keeps_score():
+    async def scenario():
+        hub, clock = make_hub()
+        server = ClassroomServer(hub, port=0)
+        await server.start()
+        port = server.server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"type":"join","name":"remote"}\n')
+            welcome = json.loads(await reader.readline())
+            clock.advance(20)
+            index = welcome["questions"][0]["index"]
+            message = {
+                "type": "check",
+                "index": index,
+                "answer": QUESTIONS[index]["title"],
+                "time": 20,
+            }
+            writer.write(json.dumps(message).encode("utf-8") + b"\n")
+            result = json.loads(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+            for _ in range(100):
+                if not any(p.connected for p in hub.players.values()):
+                    break
+                await asyncio.sleep(0.01)
+            return hub, result
+        finally:
+            await server.stop()
+
+    hub, result = asyncio.run(scenario())
+    assert result["correct"] is True
+    board = hub.leaderboard()
+    assert len(hub.players) == 1
+    assert board[0]["name"] == "remote"
+    assert board[0]["score"] == result["total_score"]
+    assert board[0]["connected"] is False
@@ -0,0 +1,24 @@
+from juego.simulador import PLAYER_PROFILES, simulate_session
+
+COSTS = {"COST_DOUBLE_POINTS": 3, "COST_REVEAL_LETTER": 1, "COST_FREEZE_TIMER": 2}
+
+
+def test_charges_spent_weights_each_use_by_its_cost():
+    config = {"wildcards": dict(COSTS, MAX_CHARGES=20)}
+    profile = dict(PLAYER_PROFILES["novice"], wildcard_rate=1.0)
+    used = 0
+    for seed in range(50):
+        record = simulate_session(profile, 15, config, seed)
+        counts = record["wildcards_used"]
+        used += sum(counts.values())
+        assert record["charges_spent"] == (
+            3 * counts.get("double_points", 0)
+            + counts.get("reveal_letter", 0)
+            + 2 * counts.get("freeze", 0)
+        )
+    assert used > 0
+
+
+def test_unit_costs_count_uses():
+    record = simulate_session(PLAYER_PROFILES["average"], 15, None, "unit")
+    assert record["charges_spent"] == sum(record["wildcards_used"].values())